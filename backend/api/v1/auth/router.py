@@ -10,8 +10,10 @@ from jose import JWTError, jwt
 from fastapi import Depends, HTTPException, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 import redis
+import redis.asyncio as aioredis
 import json
 from core.config import settings
+from db.database import redis_client as shared_redis_client
 
 # 환경 변수
 SECRET_KEY = settings.SECRET_KEY
@@ -51,9 +53,9 @@ def get_password_hash(password: str) -> str:
     return pwd_context.hash(password)
 
 
-def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -> str:
+def encode_access_token(data: dict, expires_delta: Optional[timedelta] = None) -> str:
     """
-    JWT 액세스 토큰 생성
+    JWT 액세스 토큰 인코딩 (Redis 저장 없음)
 
     Args:
         data: 토큰에 포함할 데이터
@@ -70,23 +72,64 @@ def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -
         expire = datetime.utcnow() + timedelta(minutes=ACCESS_TOKEN_EXPIRE_MINUTES)
 
     to_encode.update({"exp": expire})
-    encoded_jwt = jwt.encode(to_encode, SECRET_KEY, algorithm=ALGORITHM)
+    return jwt.encode(to_encode, SECRET_KEY, algorithm=ALGORITHM)
+
+
+def session_entry(user_id: int, token: str):
+    """Redis에 저장할 세션 키/값"""
+    # user_id를 키로 사용하여 JWT payload 데이터 저장
+    return f"user:{user_id}:session", json.dumps({"token": token})
+
+
+def create_access_token(data: dict, expires_delta: Optional[timedelta] = None,
+                        redis_client: Optional[redis.Redis] = None) -> str:
+    """
+    JWT 액세스 토큰 생성
+
+    Args:
+        data: 토큰에 포함할 데이터
+        expires_delta: 만료 시간
+        redis_client: 세션을 저장할 Redis 클라이언트 (기본값: 공유 커넥션 풀 클라이언트)
+
+    Returns:
+        str: JWT 토큰
+    """
+    encoded_jwt = encode_access_token(data, expires_delta)
 
     # Redis에 JWT 데이터 저장
-    r = redis.Redis(host='localhost', port=6379, decode_responses=True)
+    r = redis_client or shared_redis_client
     user_id = data.get("user_id")
     if user_id:
-        # user_id를 키로 사용하여 JWT payload 데이터 저장
-        redis_key = f"user:{user_id}:session"
-        redis_value = json.dumps({
-            "token": encoded_jwt
-        })
-        # 만료 시간과 동일하게 24시간 설정
+        redis_key, redis_value = session_entry(user_id, encoded_jwt)
+        # 만료 시간과 동일하게 설정
         r.setex(redis_key, ACCESS_TOKEN_EXPIRE_MINUTES * 60, redis_value)
 
     return encoded_jwt
 
 
+async def create_access_token_async(data: dict, redis_client: aioredis.Redis,
+                                    expires_delta: Optional[timedelta] = None) -> str:
+    """
+    JWT 액세스 토큰 생성 (async 라우트용, 비동기 Redis 클라이언트 사용)
+
+    Args:
+        data: 토큰에 포함할 데이터
+        redis_client: 비동기 Redis 클라이언트
+        expires_delta: 만료 시간
+
+    Returns:
+        str: JWT 토큰
+    """
+    encoded_jwt = encode_access_token(data, expires_delta)
+
+    user_id = data.get("user_id")
+    if user_id:
+        redis_key, redis_value = session_entry(user_id, encoded_jwt)
+        await redis_client.setex(redis_key, ACCESS_TOKEN_EXPIRE_MINUTES * 60, redis_value)
+
+    return encoded_jwt
+
+
 def decode_access_token(token: str) -> Optional[dict]:
     """
     JWT 토큰 디코딩
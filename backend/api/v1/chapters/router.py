@@ -3,26 +3,44 @@ Chapter Router (단일 질문-학습 모드)
 질문 등록 및 학습 페이지 조회
 """
 
+import json
+from datetime import datetime
 from fastapi import APIRouter, HTTPException, Depends
-from sqlalchemy.orm import Session
-from typing import Optional, List
+from sqlalchemy import select, update, insert
+from sqlalchemy.orm import Session, joinedload
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import Optional, List, Dict, Any
 from utils.auth_middleware import require_auth
+from utils.rate_limiter import admit_generation
 from api.v1.schemas import (
-    ChapterCreate, ChapterCreateResponse, SingleLearningPage, ChapterListItem,
-    ConceptDTO, ExerciseDTO, QuizDTO, ConceptWebhook, ExerciseWebhook, 
-    QuizWebhook, WebhookResponse
+    ChapterCreate, ChapterCreateResponse, ChapterBulkCreate, ChapterBulkCreateResponse,
+    SingleLearningPage, ChapterListItem,
+    ConceptDTO, ExerciseDTO, QuizDTO, ConceptWebhook, ConceptStreamChunk, ExerciseWebhook, 
+    QuizWebhook, WebhookResponse, single_learning_page_adapter, chapter_list_adapter
 )
+from core.config import settings
+from core.responses import adapter_response, raw_json_response
 from db import models
-from db.database import get_db
+from db.database import get_db, get_async_db
+from utils.kafka_manager import kafka_manager
+from utils.learning_page_cache import learning_page_cache
+from utils.emission_queue import emission_queue
+from utils.generation_stream import generation_stream, APPENDED, DUPLICATE, GAP
+from utils.pagination import encode_cursor, decode_cursor, keyset_before
+from utils.generation_cache import generation_cache, load_chapters_with_resources, serialize_generation, normalize_question
+from utils.similar_question_index import similar_question_index
+from utils.generation_scheduler import inflight_limiter, lease_member
 from core.socketio_manager import (
-    emit_chapter_processing_started,
-    emit_concept_processing,
-    emit_exercise_processing,
-    emit_quiz_processing,
+    chapter_processing_started_payload,
+    concept_processing_payload,
+    exercise_processing_payload,
+    quiz_processing_payload,
+    all_completed_payload,
     emit_concept_completed,
     emit_exercise_completed,
     emit_quiz_completed,
-    emit_all_completed
+    emit_all_completed,
+    emit_progress_update
 )
 
 router = APIRouter(prefix="/v1/chapter", tags=["chapter"])
@@ -33,81 +51,283 @@ router = APIRouter(prefix="/v1/chapter", tags=["chapter"])
 async def create_chapter(
     chapter: ChapterCreate,
     current_user: dict = Depends(require_auth),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     학생이 질문을 등록합니다.
     질문 1개 → Chapter 1개 → Concept 1개 + Exercise 1개 + Quiz 1개 (빈 값)
+    AI 생성을 요청해야 하는데 사용자별/전체 토큰 버킷이 비어 있으면 429 + Retry-After (utils/rate_limiter)
 
     Flow:
-    1. 챕터 생성 (title = 질문)
-    2. 빈 Concept, Exercise, Quiz 생성
-    3. Socket.IO로 처리 시작 알림 발송
-    4. Kafka로 AI 생성 요청 전송 (실제 Kafka 코드는 미구현)
+    1. 같은 질문의 생성 결과가 캐시에 있으면 복사해 바로 완료된 챕터 생성 (AI 생성 요청 없음)
+       캐시에 없어도 띄어쓰기/조사만 다른 완료 챕터(설명도 같아야 함)가 있으면 그 결과를 복사하고,
+       조금 덜 비슷하면 생성은 요청하되 응답에 비슷한 챕터를 알려줌 (similar_chapter_id)
+    2. 없으면 챕터 생성 (title = 질문) + 빈 Concept, Exercise, Quiz 생성
+    3. Socket.IO 처리 시작 알림을 발송 큐에 적재 (응답을 기다리게 하지 않음)
+    4. Kafka 발송할 AI 생성 요청을 같은 트랜잭션으로 outbox에 기록 (outbox_relay가 발송)
     5. n8n이 AI 응답을 받아 webhook으로 전송
     """
+    generation = await generation_cache.get(chapter.title, chapter.description)
+    similar = None
+    if generation is None:
+        similar, generation = await find_similar_generation(chapter.title, chapter.description, db)
+    if generation is None:
+        # AI 생성을 요청하는 질문만 토큰 차감 (캐시로 바로 완료되는 질문은 차감하지 않음)
+        await admit_generation(current_user["user_id"], 1)
+
     # 챕터 생성
     new_chapter = models.Chapter(
         owner_id=chapter.owner_id,
         title=chapter.title,
         description=chapter.description,
-        status=models.StatusEnum.pending,
+        status=models.StatusEnum.completed if generation else models.StatusEnum.pending,
+        completion_mask=int(models.CompletionBit.all) if generation else 0,
         is_active=True
     )
     db.add(new_chapter)
-    db.flush()  # chapter.id 생성
+    await db.flush()  # chapter.id 생성
+
+    if generation:
+        new_concept, new_exercise, new_quiz = build_cached_resources(new_chapter.id, generation)
+    else:
+        new_concept, new_exercise, new_quiz = build_empty_resources(new_chapter.id)
+    db.add_all([new_concept, new_exercise, new_quiz])
+
+    if not generation:
+        # AI 생성 요청을 outbox에 기록 (챕터와 같은 트랜잭션 → 커밋되면 요청도 유실되지 않음)
+        messages = kafka_manager.build_generation_messages(
+            current_user["user_id"], new_chapter.id, new_chapter.title
+        )
+        db.add_all([
+            models.Outbox(
+                topic=kafka_manager.TOPICS["N8N_REQUESTS"],
+                message_key=message["message_id"],
+                payload=message,
+                user_id=message["user_id"],
+                priority=message["priority"]
+            )
+            for message in messages
+        ])
+    await db.flush()  # concept/exercise/quiz id 생성 (한 번의 flush로 묶음)
+
+    await db.commit()
+    await db.refresh(new_chapter)
+
+    # Socket.IO 실시간 알림 (발송 큐가 chapter_status 프레임 하나로 모아 응답 이후 발송)
+    chapter_id = new_chapter.id
+    if generation:
+        emission_queue.enqueue(chapter_id, 'all_completed', all_completed_payload(chapter_id))
+    else:
+        emission_queue.enqueue(chapter_id, 'chapter_processing_started',
+                               chapter_processing_started_payload(chapter_id, new_chapter.title))
+        emission_queue.enqueue(chapter_id, 'concept_processing', concept_processing_payload(chapter_id, new_concept.id))
+        emission_queue.enqueue(chapter_id, 'exercise_processing', exercise_processing_payload(chapter_id, new_exercise.id))
+        emission_queue.enqueue(chapter_id, 'quiz_processing', quiz_processing_payload(chapter_id, 1))
 
-    # 개념 정리 생성 (빈 값)
-    new_concept = models.Concept(
+    return ChapterCreateResponse(
         chapter_id=new_chapter.id,
-        title=None,
-        content=None,
-        is_complete=False
+        concept_id=new_concept.id,
+        exercise_id=new_exercise.id,
+        quiz_id=new_quiz.id,
+        status=new_chapter.status.value,
+        created_at=new_chapter.created_at,
+        similar_chapter_id=similar[0] if similar else None,
+        similarity=similar[1] if similar else None
     )
-    db.add(new_concept)
-    db.flush()
 
-    # 실습 과제 생성 (빈 값)
-    new_exercise = models.Exercise(
-        chapter_id=new_chapter.id,
-        question=None,
-        answer=None,
-        is_complete=False
+
+async def find_similar_generation(title: str, description: Optional[str], db: AsyncSession):
+    """
+    유사 질문 색인에서 비슷한 완료 챕터 조회
+    색인은 제목만 비교하므로, 설명이 다르면 결과를 복사하지 않고 비슷한 챕터만 알려줍니다
+    (생성 캐시 키와 같이 설명도 생성 결과에 영향을 줌).
+
+    Returns:
+        ((chapter_id, 유사도) 또는 None,
+         유사도가 SIMILAR_QUESTION_AUTO_APPLY_THRESHOLD 이상이고 설명이 같으면 그 챕터의 생성 결과, 아니면 None)
+    """
+    await similar_question_index.sync(db)
+    similar = similar_question_index.query(title, settings.SIMILAR_QUESTION_THRESHOLD)
+    if similar is None or similar[1] < settings.SIMILAR_QUESTION_AUTO_APPLY_THRESHOLD:
+        return similar, None
+
+    chapters = await load_chapters_with_resources([similar[0]], db)
+    generation = serialize_generation(chapters[0]) if chapters else None
+    if generation is None:
+        # 삭제되었거나 내용이 비어 있는 챕터는 색인에서 제거하고 평소처럼 생성
+        similar_question_index.remove(similar[0])
+        return None, None
+    if normalize_question(chapters[0].description) != normalize_question(description):
+        return similar, None
+    return similar, generation
+
+
+def build_empty_resources(chapter_id: int):
+    """AI 생성 전 빈 Concept, Exercise, Quiz"""
+    return (
+        models.Concept(chapter_id=chapter_id, title=None, content=None, is_complete=False),
+        models.Exercise(chapter_id=chapter_id, title=None, contents=None, is_complete=False),
+        models.Quiz(
+            chapter_id=chapter_id,
+            question=None,
+            options=None,
+            correct_answer=None,
+            type=models.QuizTypeEnum.multiple
+        )
     )
-    db.add(new_exercise)
-    db.flush()
 
-    # 퀴즈 생성 (빈 값)
-    new_quiz = models.Quiz(
-        chapter_id=new_chapter.id,
-        question=None,
-        options=None,
-        correct_answer=None,
-        type=models.QuizTypeEnum.multiple
+
+def build_cached_resources(chapter_id: int, generation: dict):
+    """캐시된(또는 유사 질문 챕터의) 생성 결과로 채운 완료 상태의 Concept, Exercise, Quiz"""
+    quiz = generation["quiz"]
+    return (
+        models.Concept(chapter_id=chapter_id, is_complete=True, **generation["concept"]),
+        models.Exercise(chapter_id=chapter_id, is_complete=True, **generation["exercise"]),
+        models.Quiz(
+            chapter_id=chapter_id,
+            question=quiz["question"],
+            options=quiz["options"],
+            correct_answer=quiz["correct_answer"],
+            explanation=quiz["explanation"],
+            type=models.QuizTypeEnum(quiz["type"] or models.QuizTypeEnum.multiple.value)
+        )
     )
-    db.add(new_quiz)
-    db.flush()
 
-    db.commit()
-    db.refresh(new_chapter)
 
-    # Socket.IO 실시간 알림 발송 - 처리 시작
-    await emit_chapter_processing_started(new_chapter.id, new_chapter.title)
-    await emit_concept_processing(new_chapter.id, new_concept.id)
-    await emit_exercise_processing(new_chapter.id, new_exercise.id)
-    await emit_quiz_processing(new_chapter.id, 1)
+# 1-1. 질문 일괄 등록 (교사용)
+@router.post("/bulk", response_model=ChapterBulkCreateResponse)
+async def create_chapters_bulk(
+    bulk: ChapterBulkCreate,
+    current_user: dict = Depends(require_auth),
+    db: AsyncSession = Depends(get_async_db)
+):
+    """
+    질문 목록을 한 번에 등록합니다.
 
-    # TODO: Kafka로 AI 생성 요청 전송
-    # send_to_kafka(chapter_id=new_chapter.id, title=new_chapter.title)
+    질문마다 create_chapter를 부르면 질문 1개당 INSERT/flush 왕복이 여러 번 생기므로,
+    Chapter → Concept/Exercise/Quiz → outbox를 테이블별 여러 행 INSERT로 한 트랜잭션에 기록합니다.
+    (질문 수와 관계없이 DB 왕복 8회 안팎)
+    토큰 버킷은 본문 검증을 통과한 뒤 질문 수만큼 차감합니다.
 
-    return ChapterCreateResponse(
-        chapter_id=new_chapter.id,
-        concept_id=new_concept.id,
-        exercise_id=new_exercise.id,
-        quiz_id=new_quiz.id,
-        status=new_chapter.status.value,
-        created_at=new_chapter.created_at
-    )
+    Flow:
+    1. 챕터 여러 행 INSERT (id 할당)
+    2. 빈 Concept, Exercise, Quiz를 테이블별 여러 행 INSERT
+    3. AI 생성 요청(질문당 3개)을 outbox에 여러 행 INSERT (outbox_relay가 배치 단위로 Kafka 발송)
+    4. 생성된 리소스 id를 조회 1회로 모아 커밋
+    5. Socket.IO 처리 시작 알림을 발송 큐에 적재
+    """
+    if not bulk.questions:
+        raise HTTPException(status_code=400, detail="No questions")
+    if len(bulk.questions) > settings.CHAPTER_BULK_MAX_SIZE:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Too many questions (max {settings.CHAPTER_BULK_MAX_SIZE})"
+        )
+    await admit_generation(current_user["user_id"], len(bulk.questions))
+
+    now = datetime.utcnow()
+    chapter_rows = [
+        {
+            "owner_id": bulk.owner_id,
+            "title": question.title,
+            "description": question.description,
+            "status": models.StatusEnum.pending,
+            "completion_mask": 0,
+            "is_active": True,
+            "created_at": now,
+            "updated_at": now
+        }
+        for question in bulk.questions
+    ]
+    chapter_ids = await insert_chapters(chapter_rows, db)
+    if chapter_ids is None:
+        # 다른 트랜잭션과 id가 섞였으면 되돌리고 행마다 INSERT (느리지만 정확)
+        await db.rollback()
+        chapters = [models.Chapter(**row) for row in chapter_rows]
+        db.add_all(chapters)
+        await db.flush()
+        chapter_ids = [chapter.id for chapter in chapters]
+
+    await db.execute(insert(models.Concept), [
+        {"chapter_id": chapter_id, "is_complete": False} for chapter_id in chapter_ids
+    ])
+    await db.execute(insert(models.Exercise), [
+        {"chapter_id": chapter_id, "is_complete": False} for chapter_id in chapter_ids
+    ])
+    await db.execute(insert(models.Quiz), [
+        {"chapter_id": chapter_id, "type": models.QuizTypeEnum.multiple} for chapter_id in chapter_ids
+    ])
+    await db.execute(insert(models.Outbox), [
+        {
+            "topic": kafka_manager.TOPICS["N8N_REQUESTS"],
+            "message_key": message["message_id"],
+            "payload": message,
+            "user_id": message["user_id"],
+            "priority": message["priority"]
+        }
+        for chapter_id, question in zip(chapter_ids, bulk.questions)
+        for message in kafka_manager.build_generation_messages(current_user["user_id"], chapter_id, question.title)
+    ])
+
+    resource_ids = {
+        row.chapter_id: row
+        for row in await db.execute(
+            select(
+                models.Chapter.id.label("chapter_id"),
+                models.Concept.id.label("concept_id"),
+                models.Exercise.id.label("exercise_id"),
+                models.Quiz.id.label("quiz_id")
+            )
+            .join(models.Concept, models.Concept.chapter_id == models.Chapter.id)
+            .join(models.Exercise, models.Exercise.chapter_id == models.Chapter.id)
+            .join(models.Quiz, models.Quiz.chapter_id == models.Chapter.id)
+            .where(models.Chapter.id.in_(chapter_ids))
+        )
+    }
+    await db.commit()
+
+    responses = []
+    for chapter_id, question in zip(chapter_ids, bulk.questions):
+        ids = resource_ids[chapter_id]
+        emission_queue.enqueue(chapter_id, 'chapter_processing_started',
+                               chapter_processing_started_payload(chapter_id, question.title))
+        emission_queue.enqueue(chapter_id, 'concept_processing', concept_processing_payload(chapter_id, ids.concept_id))
+        emission_queue.enqueue(chapter_id, 'exercise_processing', exercise_processing_payload(chapter_id, ids.exercise_id))
+        emission_queue.enqueue(chapter_id, 'quiz_processing', quiz_processing_payload(chapter_id, 1))
+        responses.append(ChapterCreateResponse(
+            chapter_id=chapter_id,
+            concept_id=ids.concept_id,
+            exercise_id=ids.exercise_id,
+            quiz_id=ids.quiz_id,
+            status=models.StatusEnum.pending.value,
+            created_at=now
+        ))
+
+    return ChapterBulkCreateResponse(chapters=responses)
+
+
+async def insert_chapters(rows: List[Dict[str, Any]], db: AsyncSession) -> Optional[List[int]]:
+    """
+    챕터 여러 행 INSERT 후 할당된 id 목록 (rows와 같은 순서)
+
+    RETURNING을 지원하는 DB(SQLite, MariaDB)는 INSERT 결과로 id를 받습니다.
+    MySQL은 여러 행 INSERT의 첫 id(LAST_INSERT_ID)부터 연속된 id를 계산하고 조회 1회로 검증합니다.
+    (innodb_autoinc_lock_mode가 1 이하면 항상 연속, 2에서 동시 INSERT와 섞이면 None)
+    """
+    if db.get_bind().dialect.insert_returning:
+        # 한 문장 안에서는 VALUES 순서대로 증가하는 id가 할당되므로 정렬하면 rows 순서
+        # (sort_by_parameter_order는 SQLite에서 행마다 INSERT로 바뀜)
+        return sorted((await db.scalars(insert(models.Chapter).returning(models.Chapter.id), rows)).all())
+
+    result = await db.execute(insert(models.Chapter).values(rows))
+    chapter_ids = list(range(result.lastrowid, result.lastrowid + len(rows)))
+    titles = dict((await db.execute(
+        select(models.Chapter.id, models.Chapter.title)
+        .where(models.Chapter.id.in_(chapter_ids), models.Chapter.owner_id == rows[0]["owner_id"])
+    )).all())
+    if [titles.get(chapter_id) for chapter_id in chapter_ids] != [row["title"] for row in rows]:
+        return None
+    return chapter_ids
 
 
 # 2. 단일 학습 페이지 조회 (한 번에 모든 데이터)
@@ -122,14 +342,37 @@ def get_learning_page(
     Chapter + Concept + Exercise + Quiz를 한 번에 조회
 
     프론트엔드는 이 API 한 번만 호출하면 모든 데이터를 받을 수 있습니다.
+    Redis 캐시를 먼저 확인하고, 없으면 1:1 관계를 joinedload로 묶어 SELECT 1회로 조회합니다.
     """
-    # 챕터 조회
-    chapter = db.query(models.Chapter).filter(models.Chapter.id == chapter_id).first()
+    cached, version = learning_page_cache.get_json(chapter_id)
+    if cached:
+        # 캐시에는 응답 본문 그대로 저장되어 있으므로 파싱/재직렬화 없이 반환
+        return raw_json_response(cached)
+
+    chapter = (
+        db.query(models.Chapter)
+        .options(
+            joinedload(models.Chapter.concept),
+            joinedload(models.Chapter.exercise),
+            joinedload(models.Chapter.quiz)
+        )
+        .filter(models.Chapter.id == chapter_id)
+        .first()
+    )
     if not chapter:
         raise HTTPException(status_code=404, detail="Chapter not found")
 
-    # Concept 조회 (1:1)
-    concept = db.query(models.Concept).filter(models.Concept.chapter_id == chapter_id).first()
+    body = single_learning_page_adapter.dump_json(build_learning_page(chapter))
+    learning_page_cache.set_json(chapter_id, version, body)
+    return raw_json_response(body)
+
+
+def build_learning_page(chapter: models.Chapter) -> SingleLearningPage:
+    """
+    concept/exercise/quiz가 로드된 Chapter로 SingleLearningPage 생성
+    (관계가 미리 로드되어 있어야 추가 쿼리가 발생하지 않음)
+    """
+    concept = chapter.concept
     concept_dto = None
     if concept:
         concept_dto = ConceptDTO(
@@ -139,24 +382,21 @@ def get_learning_page(
             is_complete=concept.is_complete
         )
 
-    # Exercise 조회 (1:1)
-    exercise = db.query(models.Exercise).filter(models.Exercise.chapter_id == chapter_id).first()
+    exercise = chapter.exercise
     exercise_dto = None
     if exercise:
         exercise_dto = ExerciseDTO(
             id=exercise.id,
-            question=exercise.question,
+            question=exercise.title,
             is_complete=exercise.is_complete
         )
 
-    # Quiz 조회 (1:1)
-    quiz = db.query(models.Quiz).filter(models.Quiz.chapter_id == chapter_id).first()
+    quiz = chapter.quiz
     quiz_dto = None
     if quiz:
         # 옵션이 JSON 문자열인 경우 파싱
         options = None
         if quiz.options:
-            import json
             if isinstance(quiz.options, str):
                 options = json.loads(quiz.options)
             else:
@@ -186,20 +426,45 @@ def get_chapters(
     skip: int = 0,
     limit: int = 20,
     owner_id: Optional[int] = None,
+    cursor: Optional[str] = None,
     current_user: dict = Depends(require_auth),
     db: Session = Depends(get_db)
 ):
     """
-    챕터 목록 조회 (학생의 질문 목록)
+    챕터 목록 조회 (학생의 질문 목록, 최신순)
+
+    - cursor: 이전 응답의 X-Next-Cursor 헤더 값 (지정하면 skip은 무시)
+    - skip: 하위 호환용 OFFSET 페이지네이션 (깊은 페이지일수록 느림)
+
+    다음 페이지가 있을 수 있으면 X-Next-Cursor 헤더로 커서를 반환합니다.
+    owner_id를 지정하면 (owner_id, created_at, id) 인덱스 범위 스캔으로 처리됩니다.
     """
     query = db.query(models.Chapter)
 
     if owner_id:
         query = query.filter(models.Chapter.owner_id == owner_id)
 
-    chapters = query.order_by(models.Chapter.created_at.desc()).offset(skip).limit(limit).all()
+    if cursor:
+        try:
+            cursor_created_at, cursor_id = decode_cursor(cursor)
+        except ValueError:
+            raise HTTPException(status_code=400, detail="Invalid cursor")
+        query = query.filter(
+            keyset_before(models.Chapter.created_at, models.Chapter.id, cursor_created_at, cursor_id)
+        )
+    query = query.order_by(models.Chapter.created_at.desc(), models.Chapter.id.desc())
+    if skip and not cursor:
+        query = query.offset(skip)
+
+    chapters = query.limit(limit).all()
 
-    return [ChapterListItem.from_orm(chapter) for chapter in chapters]
+    headers = None
+    if chapters and len(chapters) == limit:
+        last = chapters[-1]
+        headers = {"X-Next-Cursor": encode_cursor(last.created_at, last.id)}
+
+    items = chapter_list_adapter.validate_python(chapters, from_attributes=True)
+    return adapter_response(chapter_list_adapter, items, headers=headers)
 
 
 # ==================== N8N Webhook 엔드포인트 ====================
@@ -208,32 +473,59 @@ def get_chapters(
 async def concept_finish_webhook(
     chapter_id: int,
     data: ConceptWebhook,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     개념 정리 생성 완료 webhook (n8n → 백엔드)
     """
-    chapter = db.query(models.Chapter).filter(models.Chapter.id == chapter_id).first()
-    if not chapter:
-        raise HTTPException(status_code=404, detail="Chapter not found")
+    await complete_concept(chapter_id, data.title, data.content, db)
 
-    concept = db.query(models.Concept).filter(models.Concept.chapter_id == chapter_id).first()
-    if not concept:
-        raise HTTPException(status_code=404, detail="Concept not found")
+    return WebhookResponse(
+        status="success",
+        message="개념 정리가 성공적으로 저장되었습니다",
+        chapter_id=chapter_id
+    )
 
-    # AI가 생성한 데이터로 업데이트
-    concept.title = data.title
-    concept.content = data.content
-    concept.is_complete = True
 
-    db.commit()
-    db.refresh(concept)
+@router.post("/{chapter_id}/concept-stream", response_model=WebhookResponse)
+async def concept_stream_webhook(
+    chapter_id: int,
+    chunk: ConceptStreamChunk,
+    db: AsyncSession = Depends(get_async_db)
+):
+    """
+    개념 정리 생성 중간 결과 webhook (n8n → 백엔드, 조각마다 호출)
 
-    # Socket.IO로 완료 알림 발송
-    await emit_concept_completed(chapter_id, concept.id)
+    조각은 Redis 버퍼에 이어 붙이고 delta를 바로 챕터 룸에 progress_update로 보내므로,
+    사용자는 전체 생성이 끝나기 전에 첫 문장부터 볼 수 있습니다.
+    done=True인 마지막 조각에서 누적된 본문을 concept-finish와 같은 방식으로 한 번 저장합니다.
+
+    - 재전송된 조각은 무시 (status=duplicate)
+    - 순번이 건너뛰면 409, detail의 expected_seq부터 다시 전송
+    """
+    status, last_seq = await generation_stream.append("concept", chapter_id, chunk.seq, chunk.delta)
+    if status == GAP:
+        raise HTTPException(
+            status_code=409,
+            detail={"message": "Chunk sequence gap", "expected_seq": last_seq + 1}
+        )
+
+    if status == APPENDED and chunk.delta:
+        await emit_progress_update(
+            chapter_id, chunk.progress, "개념 정리를 생성 중입니다...",
+            resource="concept", seq=chunk.seq, delta=chunk.delta
+        )
+
+    if not chunk.done:
+        return WebhookResponse(status=status, message="조각이 반영되었습니다", chapter_id=chapter_id)
 
-    # 모든 리소스 완료 확인
-    await check_and_emit_all_completed(chapter_id, db)
+    # 마지막 조각: 저장 전에 실패했다면 재전송 시 버퍼가 남아 있으므로 다시 저장 시도
+    content = await generation_stream.read("concept", chapter_id)
+    if content is None:
+        return WebhookResponse(status=DUPLICATE, message="이미 저장된 개념 정리입니다", chapter_id=chapter_id)
+
+    await complete_concept(chapter_id, chunk.title, content, db)
+    await generation_stream.clear("concept", chapter_id)
 
     return WebhookResponse(
         status="success",
@@ -246,32 +538,41 @@ async def concept_finish_webhook(
 async def exercise_finish_webhook(
     chapter_id: int,
     data: ExerciseWebhook,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     실습 과제 생성 완료 webhook (n8n → 백엔드)
     """
-    chapter = db.query(models.Chapter).filter(models.Chapter.id == chapter_id).first()
+    chapter = await db.scalar(select(models.Chapter).where(models.Chapter.id == chapter_id))
     if not chapter:
         raise HTTPException(status_code=404, detail="Chapter not found")
 
-    exercise = db.query(models.Exercise).filter(models.Exercise.chapter_id == chapter_id).first()
+    exercise = await db.scalar(select(models.Exercise).where(models.Exercise.chapter_id == chapter_id))
     if not exercise:
         raise HTTPException(status_code=404, detail="Exercise not found")
 
     # AI가 생성한 데이터로 업데이트
-    exercise.question = data.question
-    exercise.answer = data.answer
+    exercise.title = data.question
+    exercise.contents = data.answer
     exercise.is_complete = True
 
-    db.commit()
-    db.refresh(exercise)
+    # 완료 비트 기록 (같은 트랜잭션, 마지막 리소스였는지 함께 판정)
+    all_completed = await mark_resource_completed(chapter_id, models.CompletionBit.exercise, db)
+
+    await db.commit()
+
+    # 학습 페이지 캐시 무효화
+    await learning_page_cache.invalidate_async(chapter_id)
+
+    # 생성 스케줄러의 발송 중 슬롯 반납
+    await inflight_limiter.release([lease_member(chapter_id, "exercise")])
 
     # Socket.IO로 완료 알림 발송
     await emit_exercise_completed(chapter_id, exercise.id)
 
-    # 모든 리소스 완료 확인
-    await check_and_emit_all_completed(chapter_id, db)
+    # 마지막으로 도착한 webhook만 완료 후처리 + all_completed 발송
+    if all_completed:
+        await finish_chapter(chapter_id, db)
 
     return WebhookResponse(
         status="success",
@@ -284,16 +585,16 @@ async def exercise_finish_webhook(
 async def quiz_finish_webhook(
     chapter_id: int,
     data: QuizWebhook,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     퀴즈 생성 완료 webhook (n8n → 백엔드)
     """
-    chapter = db.query(models.Chapter).filter(models.Chapter.id == chapter_id).first()
+    chapter = await db.scalar(select(models.Chapter).where(models.Chapter.id == chapter_id))
     if not chapter:
         raise HTTPException(status_code=404, detail="Chapter not found")
 
-    quiz = db.query(models.Quiz).filter(models.Quiz.chapter_id == chapter_id).first()
+    quiz = await db.scalar(select(models.Quiz).where(models.Quiz.chapter_id == chapter_id))
     if not quiz:
         raise HTTPException(status_code=404, detail="Quiz not found")
 
@@ -303,17 +604,25 @@ async def quiz_finish_webhook(
     quiz.type = data.type
 
     if data.options:
-        import json
         quiz.options = json.dumps(data.options)
 
-    db.commit()
-    db.refresh(quiz)
+    # 완료 비트 기록 (같은 트랜잭션, 마지막 리소스였는지 함께 판정)
+    all_completed = await mark_resource_completed(chapter_id, models.CompletionBit.quiz, db)
+
+    await db.commit()
+
+    # 학습 페이지 + 퀴즈 정답 캐시 무효화 (챕터 버전을 공유하므로 한 번에 무효화됨)
+    await learning_page_cache.invalidate_async(chapter_id)
+
+    # 생성 스케줄러의 발송 중 슬롯 반납
+    await inflight_limiter.release([lease_member(chapter_id, "quiz")])
 
     # Socket.IO로 완료 알림 발송
     await emit_quiz_completed(chapter_id, 1)
 
-    # 모든 리소스 완료 확인
-    await check_and_emit_all_completed(chapter_id, db)
+    # 마지막으로 도착한 webhook만 완료 후처리 + all_completed 발송
+    if all_completed:
+        await finish_chapter(chapter_id, db)
 
     return WebhookResponse(
         status="success",
@@ -322,35 +631,75 @@ async def quiz_finish_webhook(
     )
 
 
-async def check_and_emit_all_completed(chapter_id: int, db: Session):
+async def complete_concept(chapter_id: int, title: Optional[str], content: str, db: AsyncSession):
+    """
+    개념 정리 저장 + 완료 처리 (concept-finish / concept-stream 공통)
+
+    Args:
+        title: 개념 정리 제목 (없으면 챕터 제목)
+    """
+    chapter = await db.scalar(select(models.Chapter).where(models.Chapter.id == chapter_id))
+    if not chapter:
+        raise HTTPException(status_code=404, detail="Chapter not found")
+
+    concept = await db.scalar(select(models.Concept).where(models.Concept.chapter_id == chapter_id))
+    if not concept:
+        raise HTTPException(status_code=404, detail="Concept not found")
+
+    # AI가 생성한 데이터로 업데이트
+    concept.title = title or chapter.title
+    concept.content = content
+    concept.is_complete = True
+
+    # 완료 비트 기록 (같은 트랜잭션, 마지막 리소스였는지 함께 판정)
+    all_completed = await mark_resource_completed(chapter_id, models.CompletionBit.concept, db)
+
+    await db.commit()
+
+    # 학습 페이지 캐시 무효화
+    await learning_page_cache.invalidate_async(chapter_id)
+
+    # 생성 스케줄러의 발송 중 슬롯 반납
+    await inflight_limiter.release([lease_member(chapter_id, "concept")])
+
+    # Socket.IO로 완료 알림 발송
+    await emit_concept_completed(chapter_id, concept.id)
+
+    # 마지막으로 도착한 webhook만 완료 후처리 + all_completed 발송
+    if all_completed:
+        await finish_chapter(chapter_id, db)
+
+
+async def finish_chapter(chapter_id: int, db: AsyncSession):
+    """모든 리소스가 완료된 챕터의 후처리 (생성 결과 캐싱, 유사 질문 색인, all_completed 발송)"""
+    for completed in await generation_cache.store_completed([chapter_id], db):
+        similar_question_index.add(completed.id, completed.title)
+    await emit_all_completed(chapter_id)
+
+
+async def mark_resource_completed(chapter_id: int, bit: models.CompletionBit, db: AsyncSession) -> bool:
     """
-    모든 리소스(개념, 실습, 퀴즈)가 완료되었는지 확인하고,
-    모두 완료되었으면 all_completed 이벤트 발송 + 챕터 상태 업데이트
+    챕터의 리소스 완료 비트를 설정하고, 이 호출로 모든 리소스(개념, 실습, 퀴즈)가
+    완료되었으면 챕터 상태를 completed로 변경합니다. 커밋은 호출자가 합니다.
+
+    첫 UPDATE가 챕터 row lock을 잡으므로 동시에 도착한 webhook은 직렬화되고,
+    두 번째 조건부 UPDATE가 pending → completed 전환에 성공한 트랜잭션은 정확히 하나입니다.
+
+    Returns:
+        bool: 이 호출이 챕터를 완료시켰으면 True (all_completed 발송 대상)
     """
-    # 개념 정리 완료 확인
-    concept = db.query(models.Concept).filter(
-        models.Concept.chapter_id == chapter_id,
-        models.Concept.is_complete == True
-    ).first()
-
-    # 실습 과제 완료 확인
-    exercise = db.query(models.Exercise).filter(
-        models.Exercise.chapter_id == chapter_id,
-        models.Exercise.is_complete == True
-    ).first()
-
-    # 퀴즈 완료 확인
-    quiz = db.query(models.Quiz).filter(
-        models.Quiz.chapter_id == chapter_id
-    ).first()
-    quiz_complete = quiz and quiz.question is not None
-
-    # 모두 완료되었으면 all_completed 이벤트 발송
-    if concept and exercise and quiz_complete:
-        # 챕터 상태 업데이트
-        chapter = db.query(models.Chapter).filter(models.Chapter.id == chapter_id).first()
-        if chapter:
-            chapter.status = models.StatusEnum.completed
-            db.commit()
-
-        await emit_all_completed(chapter_id)
+    await db.execute(
+        update(models.Chapter)
+        .where(models.Chapter.id == chapter_id)
+        .values(completion_mask=models.Chapter.completion_mask.op("|")(int(bit)))
+    )
+    result = await db.execute(
+        update(models.Chapter)
+        .where(
+            models.Chapter.id == chapter_id,
+            models.Chapter.completion_mask == int(models.CompletionBit.all),
+            models.Chapter.status == models.StatusEnum.pending
+        )
+        .values(status=models.StatusEnum.completed)
+    )
+    return result.rowcount == 1
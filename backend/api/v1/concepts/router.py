@@ -9,6 +9,7 @@ from utils.auth_middleware import require_auth
 # from api.v1.schemas import ConceptResponse, ConceptUpdateRequest, ConceptUpdateResponse  # 스키마 없음
 from db import models
 from db.database import get_db
+from utils.learning_page_cache import learning_page_cache
 from datetime import datetime, timezone
 
 router = APIRouter(prefix="/v1/concept", tags=["concept"])
@@ -56,5 +57,6 @@ def update_concept_completion(
     concept.updated_at = datetime.now(timezone.utc)
 
     db.commit()
+    learning_page_cache.invalidate(chapter_id)
 
     return Response(status_code=204)
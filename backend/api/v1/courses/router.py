@@ -3,37 +3,109 @@ Course Router
 강의 CRUD 작업
 """
 
-from fastapi import APIRouter, HTTPException, Depends
+import logging
+from typing import Optional, Iterator
+from fastapi import APIRouter, HTTPException, Depends, Header
+from fastapi.responses import StreamingResponse
+from sqlalchemy import select
 from sqlalchemy.orm import Session
 from utils.auth_middleware import require_auth
-# from typing import List
-# from api.v1.schemas import CourseListItem, CourseCreate, CourseResponse, CourseDetailResponse, ChapterSimple  # 스키마 없음
+# from api.v1.schemas import CourseCreate, CourseResponse  # 스키마 없음
+from api.v1.schemas import (
+    CourseDetail, CourseDetailResponse, course_list_item_adapter, course_detail_response_adapter
+)
+from core.config import settings
+from core.responses import adapter_response
 from db import models
-from db.database import get_db
+from db.database import get_db, SessionLocal
+
+logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/v1/course", tags=["course"])
 
+NDJSON_MEDIA_TYPE = "application/x-ndjson"
+
+# 목록에 필요한 컬럼만 조회 (ORM 객체/identity map을 만들지 않음)
+COURSE_LIST_COLUMNS = (
+    models.Course.id,
+    models.Course.title,
+    models.Course.description,
+    models.Course.difficulty,
+    models.Course.owner_id,
+    models.Course.created_at,
+)
+
+
+def dump_course_row(row) -> bytes:
+    """강의 목록 항목 JSON (상세 응답과 같은 CourseListItem 스키마로 직렬화)"""
+    return course_list_item_adapter.dump_json(course_list_item_adapter.validate_python(row, from_attributes=True))
+
+
+def stream_courses(
+    difficulty: Optional[models.DifficultyEnum],
+    owner_id: Optional[int],
+    ndjson: bool
+) -> Iterator[bytes]:
+    """
+    강의 목록을 서버 사이드 커서로 읽으며 청크 단위로 직렬화
+
+    StreamingResponse가 응답을 보내는 동안 계속 읽어야 하므로 요청 의존성(get_db) 세션이 아닌
+    자체 세션을 사용합니다. (sync 제너레이터 → threadpool에서 실행되어 이벤트 루프를 막지 않음)
+
+    Args:
+        ndjson: True면 한 줄에 하나씩(NDJSON), False면 JSON 배열
+    """
+    query = select(*COURSE_LIST_COLUMNS).order_by(models.Course.id)
+    if difficulty:
+        query = query.where(models.Course.difficulty == difficulty)
+    if owner_id:
+        query = query.where(models.Course.owner_id == owner_id)
+
+    separator = b"\n" if ndjson else b","
+    first = True
+    if not ndjson:
+        yield b"["
+
+    db = SessionLocal()
+    try:
+        result = db.execute(query.execution_options(yield_per=settings.COURSE_STREAM_BATCH_SIZE))
+        for partition in result.partitions():
+            chunk = separator.join(dump_course_row(row) for row in partition)
+            if ndjson:
+                yield chunk + b"\n"
+            else:
+                yield chunk if first else b"," + chunk
+            first = False
+    except Exception as e:
+        # 헤더가 이미 전송되어 상태 코드를 바꿀 수 없음 → 응답이 중간에 끊겨 클라이언트가 감지
+        logger.error(f"강의 목록 스트리밍 실패: {e}")
+        raise
+    finally:
+        db.close()
+
+    if not ndjson:
+        yield b"]"
+
 
 # 1. 강의 리스트 조회
 @router.get("/")
 def get_course_list(
-    current_user: dict = Depends(require_auth),
-    db: Session = Depends(get_db)
+    difficulty: Optional[models.DifficultyEnum] = None,
+    owner_id: Optional[int] = None,
+    accept: Optional[str] = Header(None),
+    current_user: dict = Depends(require_auth)
 ):
-    """등록된 모든 강의 목록을 조회합니다."""
-    courses = db.query(models.Course).all()
-
-    return [
-        {
-            "id": course.id,
-            "title": course.title,
-            "description": course.description,
-            "difficulty": course.difficulty,
-            "owner_id": course.owner_id,
-            "created_at": course.created_at.isoformat() if course.created_at else None
-        }
-        for course in courses
-    ]
+    """
+    등록된 강의 목록을 조회합니다.
+
+    전체 목록을 메모리에 올리지 않고 서버 사이드 커서로 읽는 대로 스트리밍합니다.
+    기본 응답은 기존과 같은 JSON 배열이며, Accept: application/x-ndjson이면 한 줄에 강의 하나씩 보냅니다.
+    """
+    ndjson = accept is not None and NDJSON_MEDIA_TYPE in accept
+    return StreamingResponse(
+        stream_courses(difficulty, owner_id, ndjson),
+        media_type=NDJSON_MEDIA_TYPE if ndjson else "application/json"
+    )
 
 
 # 2. 강의 생성
@@ -55,7 +127,7 @@ def get_course_list(
 
 
 # 3. 강의 상세 보기
-@router.get("/{course_id}")
+@router.get("/{course_id}", response_model=CourseDetailResponse)
 def get_course_detail(
     course_id: int,
     current_user: dict = Depends(require_auth),
@@ -67,4 +139,6 @@ def get_course_detail(
     if not course:
         raise HTTPException(status_code=404, detail="Course not found")
 
-    return {"course": course.__dict__}
+    # course.__dict__에는 SQLAlchemy 내부 상태(_sa_instance_state)가 섞여 있으므로 스키마로 변환
+    detail = CourseDetailResponse(course=CourseDetail.model_validate(course, from_attributes=True))
+    return adapter_response(course_detail_response_adapter, detail)
@@ -4,7 +4,7 @@ Exercise Router
 """
 
 from fastapi import APIRouter, HTTPException, Depends
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, joinedload
 from utils.auth_middleware import require_auth
 from api.v1.schemas import ExerciseResponse, ExerciseWithChapterResponse
 from db import models
@@ -22,18 +22,17 @@ def get_exercise(
     db: Session = Depends(get_db)
 ):
     """해당 챕터의 실습 과제를 조회합니다."""
-    # 챕터 조회
-    chapter = db.query(models.Chapter).filter(
+    # 챕터 + 실습 과제 조회 (1:1, 한 번의 쿼리)
+    chapter = db.query(models.Chapter).options(
+        joinedload(models.Chapter.exercise)
+    ).filter(
         models.Chapter.id == chapter_id
     ).first()
 
     if not chapter:
         raise HTTPException(status_code=404, detail="Chapter not found")
 
-    # 챕터의 실습 과제 조회
-    exercise = db.query(models.Exercise).filter(
-        models.Exercise.chapter_id == chapter_id
-    ).first()
+    exercise = chapter.exercise
 
     if not exercise:
         raise HTTPException(status_code=404, detail="Exercise not found")
@@ -4,13 +4,18 @@ Member Router
 """
 
 from fastapi import APIRouter, HTTPException, Depends
+from sqlalchemy import select
 from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 import redis
-from api.v1.schemas import MemberSignup, MemberLogin, MemberResponse, LoginResponse
+import redis.asyncio as aioredis
+from api.v1.schemas import MemberSignup, MemberLogin, MemberResponse, LoginResponse, SignupResponse
 from db import models
-from db.database import get_db, get_redis
-from api.v1.auth.router import get_password_hash, verify_password, create_access_token
+from db.database import get_db, get_async_db, get_redis, get_async_redis
+from api.v1.auth.router import create_access_token_async
 from utils.auth_middleware import require_auth
+from utils.token_cache import token_cache
+from utils.password_hasher import password_hasher
 
 router = APIRouter(prefix="/v1/member", tags=["member"])
 
@@ -20,10 +25,10 @@ TOKEN_EXPIRE_SECONDS = 86400
 
 # 1. 회원가입
 @router.post("/signup", response_model=MemberResponse)
-def signup(member: MemberSignup, db: Session = Depends(get_db)):
+async def signup(member: MemberSignup, db: AsyncSession = Depends(get_async_db)):
     """새 사용자를 등록합니다."""
     # 이메일 중복 확인
-    existing_member = db.query(models.Member).filter(models.Member.email == member.email).first()
+    existing_member = await db.scalar(select(models.Member).where(models.Member.email == member.email))
     if existing_member:
         raise HTTPException(status_code=400, detail="Email already registered")
         return SignupResponse(
@@ -33,8 +38,8 @@ def signup(member: MemberSignup, db: Session = Depends(get_db)):
             created_at=new_member.created_at
         )
 
-    # 비밀번호 해싱
-    hashed_password = get_password_hash(member.password)
+    # 비밀번호 해싱 (전용 프로세스 풀)
+    hashed_password = await password_hasher.hash(member.password)
 
     # 새 회원 생성
     new_member = models.Member(
@@ -43,8 +48,8 @@ def signup(member: MemberSignup, db: Session = Depends(get_db)):
     )
 
     db.add(new_member)
-    db.commit()
-    db.refresh(new_member)
+    await db.commit()
+    await db.refresh(new_member)
 
     return SignupResponse(
         state="success",
@@ -56,10 +61,10 @@ def signup(member: MemberSignup, db: Session = Depends(get_db)):
 
 # 2. 로그인
 @router.post("/login", response_model=LoginResponse)
-def login(
+async def login(
     credentials: MemberLogin,
-    db: Session = Depends(get_db),
-    redis_client: redis.Redis = Depends(get_redis)
+    db: AsyncSession = Depends(get_async_db),
+    redis_client: aioredis.Redis = Depends(get_async_redis)
 ):
     """
     사용자 로그인 후 JWT 토큰을 발급하고 Redis에 저장합니다.
@@ -69,22 +74,28 @@ def login(
     Redis TTL: 1일 (86400초)
     """
     # 사용자 조회
-    member = db.query(models.Member).filter(models.Member.email == credentials.email).first()
+    member = await db.scalar(select(models.Member).where(models.Member.email == credentials.email))
 
     if not member:
         raise HTTPException(status_code=401, detail="Invalid email or password")
 
-    # 비밀번호 확인
-    if not verify_password(credentials.password, member.password):
+    # 비밀번호 확인 (전용 프로세스 풀)
+    if not await password_hasher.verify(credentials.password, member.password):
         raise HTTPException(status_code=401, detail="Invalid email or password")
         return LoginResponse(state="failed")
 
     # JWT 토큰 생성
-    access_token = create_access_token(data={"user_id": member.id, "email": member.email})
+    access_token = await create_access_token_async(
+        data={"user_id": member.id, "email": member.email},
+        redis_client=redis_client
+    )
 
     # Redis에 토큰 저장 (TTL: 1일)
     redis_key = f"token:{member.id}"
-    redis_client.setex(redis_key, TOKEN_EXPIRE_SECONDS, access_token)
+    await redis_client.setex(redis_key, TOKEN_EXPIRE_SECONDS, access_token)
+
+    # 이전 토큰은 더 이상 유효하지 않으므로 모든 워커의 토큰 캐시에서 제거
+    await token_cache.broadcast_invalidation_async(member.id)
 
     return LoginResponse(
         state="success",
@@ -128,6 +139,9 @@ def logout(
     # Redis에서 토큰 삭제
     deleted = redis_client.delete(redis_key)
 
+    # 모든 워커의 토큰 캐시에서 제거 (pub/sub)
+    token_cache.broadcast_invalidation(user_id)
+
     return {
         "status": "success",
         "message": "Logged out successfully",
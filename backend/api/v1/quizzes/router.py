@@ -3,15 +3,126 @@ Quiz Router (단일 퀴즈 제출)
 챕터당 퀴즈 1개, 정답 제출 및 채점
 """
 
+from typing import Dict, Iterable, Any, List, Tuple
 from fastapi import APIRouter, HTTPException, Depends
+from sqlalchemy import select
 from sqlalchemy.orm import Session
 from utils.auth_middleware import require_auth
-from api.v1.schemas import QuizSubmit, QuizSubmitResponse
+from api.v1.schemas import (
+    QuizSubmit, QuizSubmitResponse, QuizBatchSubmit, QuizBatchSubmitResponse, QuizBatchResult
+)
+from core.config import settings
 from db import models
 from db.database import get_db
+from utils.answer_key_cache import answer_key_cache, normalize_answer
+from utils.answer_grader import grade_answer
+from utils.grading_dispatcher import grading_dispatcher
 
 router = APIRouter(prefix="/v1/quiz", tags=["quiz"])
 
+# 채점할 수 없는 사유 → 단일 제출 시 HTTP 상태 코드
+CHAPTER_NOT_FOUND = "Chapter not found"
+QUIZ_NOT_FOUND = "Quiz not found"
+QUIZ_NOT_READY = "Quiz is not ready yet"
+ERROR_STATUS = {
+    CHAPTER_NOT_FOUND: 404,
+    QUIZ_NOT_FOUND: 404,
+    QUIZ_NOT_READY: 400,
+}
+
+
+def load_answer_keys(chapter_ids: Iterable[int], db: Session) -> Dict[int, Any]:
+    """
+    챕터별 정답 조회 (캐시 → 없는 챕터만 IN 쿼리 1회)
+
+    Returns:
+        Dict: chapter_id → {"answer", "explanation"} 또는 채점할 수 없는 사유(str)
+    """
+    chapter_ids = set(chapter_ids)
+    answer_keys, missing = answer_key_cache.get_many(chapter_ids)
+    if len(answer_keys) == len(chapter_ids):
+        return answer_keys
+
+    # Redis 오류 시에는 missing이 비어 있으므로(저장도 건너뜀) 캐시에 없는 챕터를 직접 계산
+    to_load = chapter_ids - answer_keys.keys()
+    rows = db.execute(
+        select(models.Chapter.id, models.Quiz.id.label("quiz_id"), models.Quiz.question,
+               models.Quiz.correct_answer, models.Quiz.explanation, models.Quiz.type)
+        .outerjoin(models.Quiz, models.Quiz.chapter_id == models.Chapter.id)
+        .where(models.Chapter.id.in_(to_load))
+    ).all()
+
+    loaded = {}
+    results: Dict[int, Any] = {chapter_id: CHAPTER_NOT_FOUND for chapter_id in to_load}
+    for row in rows:
+        if row.quiz_id is None:
+            results[row.id] = QUIZ_NOT_FOUND
+        elif not row.question or not row.correct_answer:
+            # 아직 생성되지 않은 퀴즈는 캐싱하지 않음
+            results[row.id] = QUIZ_NOT_READY
+        else:
+            loaded[row.id] = results[row.id] = {
+                "answer": normalize_answer(row.correct_answer),
+                "explanation": row.explanation,
+                "type": row.type.value if row.type else None,
+                "question": row.question
+            }
+
+    if loaded:
+        answer_key_cache.set_many(loaded, missing)
+
+    results.update(answer_keys)
+    return results
+
+
+def grade(submissions: List[Tuple[Dict[str, Any], str]]) -> List[QuizSubmitResponse]:
+    """
+    답안 채점 (로컬 채점 엔진 → 확신하지 못한 답안만 QuizGrader로 재채점)
+
+    Args:
+        submissions: [(정답, 학생 답안), ...]
+
+    Returns:
+        List: submissions와 같은 순서의 채점 결과
+    """
+    local = [grade_answer(answer_key, answer) for answer_key, answer in submissions]
+
+    escalated = [
+        index for index, (_, confidence) in enumerate(local)
+        if confidence < settings.QUIZ_ESCALATION_CONFIDENCE
+    ]
+    # 다른 요청의 재채점 답안과 함께 묶여 발송됨 (grading_dispatcher)
+    remote = grading_dispatcher.grade([
+        {
+            "quiz": submissions[index][0].get("question") or "",
+            "answer": submissions[index][1],
+            "correct_answer": submissions[index][0]["answer"]
+        }
+        for index in escalated
+    ]) if escalated and grading_dispatcher.enabled else []
+    remote_scores = dict(zip(escalated, remote))
+
+    results = []
+    for index, ((answer_key, _), (is_correct, confidence)) in enumerate(zip(submissions, local)):
+        score = remote_scores.get(index)
+        if score is not None:
+            results.append(QuizSubmitResponse(
+                is_correct=score >= settings.QUIZ_GRADER_PASS_SCORE,
+                score=round(score),
+                explanation=answer_key["explanation"],
+                graded_by="quiz_grader"
+            ))
+        else:
+            # QuizGrader를 쓸 수 없으면 신뢰도가 낮아도 로컬 판정 사용
+            results.append(QuizSubmitResponse(
+                is_correct=is_correct,
+                score=100 if is_correct else 0,
+                explanation=answer_key["explanation"],
+                confidence=round(confidence, 3),
+                graded_by="local"
+            ))
+    return results
+
 
 @router.post("/{chapter_id}/submit", response_model=QuizSubmitResponse)
 def submit_quiz(
@@ -24,34 +135,48 @@ def submit_quiz(
     퀴즈 정답 제출 및 채점
 
     Flow:
-    1. chapter_id로 퀴즈 조회 (1:1 관계)
-    2. 정답 비교
-    3. 점수 계산 (맞으면 100점, 틀리면 0점)
-    4. 결과 반환 (is_correct, score, explanation)
-    """
-    # 챕터 존재 확인
-    chapter = db.query(models.Chapter).filter(models.Chapter.id == chapter_id).first()
-    if not chapter:
-        raise HTTPException(status_code=404, detail="Chapter not found")
-
-    # 퀴즈 조회 (1:1)
-    quiz = db.query(models.Quiz).filter(models.Quiz.chapter_id == chapter_id).first()
-    if not quiz:
-        raise HTTPException(status_code=404, detail="Quiz not found")
-
-    # 퀴즈가 아직 생성되지 않았으면 에러
-    if not quiz.question or not quiz.correct_answer:
-        raise HTTPException(status_code=400, detail="Quiz is not ready yet")
-
-    # 정답 확인 (대소문자 무시)
-    user_answer = submission.answer.strip()
-    correct_answer = quiz.correct_answer.strip()
-
-    is_correct = user_answer.lower() == correct_answer.lower()
-    score = 100 if is_correct else 0
-
-    return QuizSubmitResponse(
-        is_correct=is_correct,
-        score=score,
-        explanation=quiz.explanation
-    )
+    1. 정답 캐시 조회 (없으면 chapter_id로 퀴즈 조회 후 캐싱)
+    2. 로컬 채점 (O/X 표현, 숫자 허용 오차, 띄어쓰기/어미 정리, 자모 편집 거리)
+    3. 판정 신뢰도가 낮으면 QuizGrader로 재채점 (설정되지 않았거나 실패하면 로컬 판정 사용)
+    4. 결과 반환 (is_correct, score, explanation, confidence, graded_by)
+    """
+    answer_key = load_answer_keys([chapter_id], db)[chapter_id]
+    if isinstance(answer_key, str):
+        raise HTTPException(status_code=ERROR_STATUS[answer_key], detail=answer_key)
+
+    return grade([(answer_key, submission.answer)])[0]
+
+
+@router.post("/submit-batch", response_model=QuizBatchSubmitResponse)
+def submit_quiz_batch(
+    batch: QuizBatchSubmit,
+    current_user: dict = Depends(require_auth),
+    db: Session = Depends(get_db)
+):
+    """
+    퀴즈 일괄 제출 및 채점
+
+    여러 (chapter_id, answer)를 한 번에 채점합니다. 정답은 캐시에서 한 번에 조회하고,
+    캐시에 없는 챕터만 IN 쿼리 1회로 조회합니다. QuizGrader 재채점이 필요한 답안은 다른 요청의 답안과 함께 묶어 보냅니다.
+    채점할 수 없는 답안은 전체 요청을 실패시키지 않고 해당 항목의 error에 사유를 담습니다.
+    """
+    if len(batch.submissions) > settings.QUIZ_BATCH_MAX_SIZE:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Too many submissions (max {settings.QUIZ_BATCH_MAX_SIZE})"
+        )
+
+    answer_keys = load_answer_keys((item.chapter_id for item in batch.submissions), db)
+
+    gradable = [item for item in batch.submissions if not isinstance(answer_keys[item.chapter_id], str)]
+    graded = iter(grade([(answer_keys[item.chapter_id], item.answer) for item in gradable]))
+
+    results = []
+    for item in batch.submissions:
+        answer_key = answer_keys[item.chapter_id]
+        if isinstance(answer_key, str):
+            results.append(QuizBatchResult(chapter_id=item.chapter_id, error=answer_key))
+        else:
+            results.append(QuizBatchResult(chapter_id=item.chapter_id, **next(graded).model_dump()))
+
+    return QuizBatchSubmitResponse(results=results)
@@ -3,7 +3,7 @@ Pydantic 스키마 (단일 질문-학습 모드)
 질문 1개 → Chapter 1개 → Concept 1개 + Exercise 1개 + Quiz 1개
 """
 
-from pydantic import BaseModel, EmailStr
+from pydantic import BaseModel, EmailStr, TypeAdapter
 from typing import Optional, List
 from datetime import datetime
 
@@ -62,8 +62,27 @@ class ChapterCreateResponse(BaseModel):
     concept_id: int
     exercise_id: int
     quiz_id: int
-    status: str  # "pending"
+    status: str  # "pending" (캐시/유사 질문 결과를 복사했으면 "completed")
     created_at: datetime
+    similar_chapter_id: Optional[int] = None  # 비슷한 질문으로 이미 완료된 챕터
+    similarity: Optional[float] = None  # 0~1 (제목 글자 2-gram Jaccard)
+
+
+class ChapterBulkItem(BaseModel):
+    """일괄 등록할 질문 1개"""
+    title: str
+    description: Optional[str] = ""
+
+
+class ChapterBulkCreate(BaseModel):
+    """질문 일괄 등록 (교사용, 질문 목록 업로드)"""
+    owner_id: int
+    questions: List[ChapterBulkItem]
+
+
+class ChapterBulkCreateResponse(BaseModel):
+    """질문 일괄 등록 응답 (questions와 같은 순서)"""
+    chapters: List[ChapterCreateResponse]
 
 
 # ==================== 단일 학습 페이지 조회 스키마 ====================
@@ -130,6 +149,35 @@ class QuizSubmitResponse(BaseModel):
     is_correct: bool
     score: int
     explanation: Optional[str] = None
+    confidence: Optional[float] = None  # 판정 신뢰도 0~1 (QuizGrader가 채점했으면 None)
+    graded_by: Optional[str] = None  # "local" | "quiz_grader"
+
+
+class QuizBatchItem(BaseModel):
+    """일괄 채점 답안 1개"""
+    chapter_id: int
+    answer: str
+
+
+class QuizBatchSubmit(BaseModel):
+    """퀴즈 일괄 제출 (여러 챕터의 답안을 한 번에 채점, 제출자는 JWT의 사용자)"""
+    submissions: List[QuizBatchItem]
+
+
+class QuizBatchResult(BaseModel):
+    """일괄 채점 결과 1개 (채점할 수 없으면 error에 사유)"""
+    chapter_id: int
+    is_correct: Optional[bool] = None
+    score: Optional[int] = None
+    explanation: Optional[str] = None
+    confidence: Optional[float] = None
+    graded_by: Optional[str] = None
+    error: Optional[str] = None
+
+
+class QuizBatchSubmitResponse(BaseModel):
+    """퀴즈 일괄 제출 응답 (submissions와 같은 순서)"""
+    results: List[QuizBatchResult]
 
 
 # ==================== N8N Webhook 스키마 ====================
@@ -140,6 +188,15 @@ class ConceptWebhook(BaseModel):
     content: str
 
 
+class ConceptStreamChunk(BaseModel):
+    """개념 정리 생성 중간 결과 조각 (n8n → 백엔드, 생성되는 대로 전송)"""
+    seq: int  # 0부터 1씩 증가하는 조각 순번 (재전송 시 같은 값)
+    delta: str = ""
+    done: bool = False  # 마지막 조각이면 True → 누적된 본문을 저장
+    title: Optional[str] = None  # 마지막 조각에 포함 (없으면 챕터 제목 사용)
+    progress: Optional[int] = None  # 0-100
+
+
 class ExerciseWebhook(BaseModel):
     """실습 과제 생성 완료 webhook (n8n → 백엔드)"""
     question: str
@@ -174,3 +231,37 @@ class ChapterListItem(BaseModel):
 
     class Config:
         from_attributes = True
+
+
+# ==================== 강의 스키마 ====================
+
+class CourseListItem(BaseModel):
+    """강의 목록 항목"""
+    id: int
+    title: str
+    description: Optional[str] = None
+    difficulty: Optional[str] = None
+    owner_id: int
+    created_at: Optional[datetime] = None
+
+    class Config:
+        from_attributes = True
+
+
+class CourseDetail(CourseListItem):
+    """강의 상세"""
+    updated_at: Optional[datetime] = None
+
+
+class CourseDetailResponse(BaseModel):
+    """강의 상세 응답"""
+    course: CourseDetail
+
+
+# ==================== 직렬화용 TypeAdapter ====================
+# 요청마다 스키마를 다시 만들지 않도록 모듈 로드 시 한 번 생성 (core.responses.adapter_response와 함께 사용)
+
+single_learning_page_adapter = TypeAdapter(SingleLearningPage)
+chapter_list_adapter = TypeAdapter(List[ChapterListItem])
+course_list_item_adapter = TypeAdapter(CourseListItem)
+course_detail_response_adapter = TypeAdapter(CourseDetailResponse)
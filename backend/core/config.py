@@ -19,16 +19,91 @@ class Settings:
     DB_NAME = os.getenv("DB_NAME", "poppins_db")
     
     DATABASE_URL = f"mysql+pymysql://{DB_USER}:{DB_PASSWORD}@{DB_HOST}:{DB_PORT}/{DB_NAME}"
+    ASYNC_DATABASE_URL = f"mysql+aiomysql://{DB_USER}:{DB_PASSWORD}@{DB_HOST}:{DB_PORT}/{DB_NAME}"
+    COURSE_STREAM_BATCH_SIZE = int(os.getenv("COURSE_STREAM_BATCH_SIZE", 1000))  # 강의 목록 스트리밍 시 서버 사이드 커서에서 한 번에 가져올 행 수
     
     # Redis
     REDIS_HOST = os.getenv("REDIS_HOST", "localhost")
     REDIS_PORT = int(os.getenv("REDIS_PORT", 6379))
     REDIS_DB = int(os.getenv("REDIS_DB", 0))
+    REDIS_MAX_CONNECTIONS = int(os.getenv("REDIS_MAX_CONNECTIONS", 50))  # 커넥션 풀 최대 크기 (sync/async 각각)
+    REDIS_SOCKET_TIMEOUT = float(os.getenv("REDIS_SOCKET_TIMEOUT", 5))  # 명령 응답 대기(초)
+    REDIS_CONNECT_TIMEOUT = float(os.getenv("REDIS_CONNECT_TIMEOUT", 2))  # 연결 타임아웃(초)
+    LEARNING_PAGE_CACHE_TTL = int(os.getenv("LEARNING_PAGE_CACHE_TTL", 300))  # 학습 페이지 캐시 TTL(초)
+    GENERATION_STREAM_TTL = int(os.getenv("GENERATION_STREAM_TTL", 3600))  # 스트리밍 중인 생성 결과 버퍼 TTL(초)
+    ANSWER_KEY_CACHE_TTL = int(os.getenv("ANSWER_KEY_CACHE_TTL", 3600))  # 퀴즈 정답 캐시 TTL(초)
+    GENERATION_CACHE_TTL = int(os.getenv("GENERATION_CACHE_TTL", 604800))  # 같은 질문의 AI 생성 결과 재사용 기간(초)
+    GENERATION_WORKFLOW_VERSION = os.getenv("GENERATION_WORKFLOW_VERSION", "1")  # n8n 프롬프트/워크플로 변경 시 올려서 이전 결과 무시
+    SIMILAR_QUESTION_THRESHOLD = float(os.getenv("SIMILAR_QUESTION_THRESHOLD", 0.7))  # 비슷한 기존 챕터를 응답에 알려주는 최소 유사도
+    SIMILAR_QUESTION_AUTO_APPLY_THRESHOLD = float(os.getenv("SIMILAR_QUESTION_AUTO_APPLY_THRESHOLD", 0.9))  # 생성 없이 기존 결과를 복사하는 최소 유사도 (1 초과면 사용 안 함)
+    SIMILAR_QUESTION_INDEX_MAXSIZE = int(os.getenv("SIMILAR_QUESTION_INDEX_MAXSIZE", 50000))  # 유사 질문 색인 최대 챕터 수
+    SIMILAR_QUESTION_REFRESH_INTERVAL = float(os.getenv("SIMILAR_QUESTION_REFRESH_INTERVAL", 30))  # 다른 프로세스에서 완료된 챕터를 색인에 반영하는 간격(초)
     
+    # Kafka
+    KAFKA_BOOTSTRAP_SERVERS = os.getenv("KAFKA_BOOTSTRAP_SERVERS", "localhost:9092")
+    KAFKA_LINGER_MS = int(os.getenv("KAFKA_LINGER_MS", 5))  # 배치를 모으기 위해 대기하는 시간
+    KAFKA_BATCH_NUM_MESSAGES = int(os.getenv("KAFKA_BATCH_NUM_MESSAGES", 1000))
+    KAFKA_BATCH_SIZE = int(os.getenv("KAFKA_BATCH_SIZE", 1048576))  # 배치 최대 바이트
+    KAFKA_QUEUE_MAX_MESSAGES = int(os.getenv("KAFKA_QUEUE_MAX_MESSAGES", 100000))  # 로컬 큐 상한
+    KAFKA_BACKPRESSURE_TIMEOUT = float(os.getenv("KAFKA_BACKPRESSURE_TIMEOUT", 1.0))  # 큐가 가득 찼을 때 최대 대기(초)
+    KAFKA_FLUSH_TIMEOUT = float(os.getenv("KAFKA_FLUSH_TIMEOUT", 10.0))  # 종료 시 drain 대기(초)
+    KAFKA_CONSUMER_GROUP = os.getenv("KAFKA_CONSUMER_GROUP", "docgodai-ingest")
+    KAFKA_CONSUMER_BATCH_SIZE = int(os.getenv("KAFKA_CONSUMER_BATCH_SIZE", 500))  # 마이크로 배치 최대 메시지 수
+    KAFKA_CONSUMER_BATCH_TIMEOUT = float(os.getenv("KAFKA_CONSUMER_BATCH_TIMEOUT", 0.5))  # 배치를 모으는 최대 시간(초)
+    KAFKA_CONSUMER_MAX_ATTEMPTS = int(os.getenv("KAFKA_CONSUMER_MAX_ATTEMPTS", 3))  # 반영 실패 시 재시도 횟수 (초과하면 dead-letter)
+
+    # Outbox relay
+    OUTBOX_BATCH_SIZE = int(os.getenv("OUTBOX_BATCH_SIZE", 200))  # 한 번에 발송할 outbox 행 수
+    OUTBOX_POLL_INTERVAL = float(os.getenv("OUTBOX_POLL_INTERVAL", 0.5))  # outbox가 비었을 때 대기(초)
+    OUTBOX_MAX_PENDING = int(os.getenv("OUTBOX_MAX_PENDING", 20000))  # relay가 메모리 대기열에 올려 두는 최대 행 수
+    OUTBOX_RESCAN_INTERVAL = float(os.getenv("OUTBOX_RESCAN_INTERVAL", 30))  # 놓친 outbox 행을 처음부터 다시 읽는 간격(초)
+    OUTBOX_CLAIM_TIMEOUT = int(os.getenv("OUTBOX_CLAIM_TIMEOUT", 120))  # 발송 결과를 반영하지 못한 행을 다시 발송하기까지(초), 브로커 전달 타임아웃보다 길게
+    OUTBOX_MAX_ATTEMPTS = int(os.getenv("OUTBOX_MAX_ATTEMPTS", 10))  # 이 횟수만큼 발송에 실패하면 포기 (failed_at 기록)
+
+    # Generation scheduler (Gemini 할당량 기준)
+    GENERATION_MAX_INFLIGHT = int(os.getenv("GENERATION_MAX_INFLIGHT", 30))  # 동시에 진행할 수 있는 전체 AI 생성 수
+    GENERATION_MAX_INFLIGHT_PER_USER = int(os.getenv("GENERATION_MAX_INFLIGHT_PER_USER", 6))  # 사용자별 동시 AI 생성 수
+    GENERATION_LEASE_TTL = int(os.getenv("GENERATION_LEASE_TTL", 600))  # 완료 응답이 없는 생성을 발송 중에서 제외하기까지(초)
+
+    # Generation admission control (토큰 = 등록하는 질문 수, 질문 1개 = AI 생성 3건)
+    GENERATION_USER_RATE = float(os.getenv("GENERATION_USER_RATE", 0.5))  # 사용자별 초당 충전 토큰
+    GENERATION_USER_BURST = int(os.getenv("GENERATION_USER_BURST", 30))  # 사용자별 연속으로 등록할 수 있는 질문 수
+    GENERATION_GLOBAL_RATE = float(os.getenv("GENERATION_GLOBAL_RATE", 20))  # 전체 초당 충전 토큰
+    GENERATION_GLOBAL_BURST = int(os.getenv("GENERATION_GLOBAL_BURST", 1000))  # 전체 연속으로 등록할 수 있는 질문 수
+
+    # Socket.IO
+    # memory: 단일 프로세스 / redis: Redis pub/sub으로 여러 워커(및 Kafka 소비 워커)에 이벤트 전달
+    SOCKETIO_CLIENT_MANAGER = os.getenv("SOCKETIO_CLIENT_MANAGER", "memory")
+    SOCKETIO_MESSAGE_QUEUE = os.getenv("SOCKETIO_MESSAGE_QUEUE", f"redis://{REDIS_HOST}:{REDIS_PORT}/{REDIS_DB}")
+    SOCKETIO_CHANNEL = os.getenv("SOCKETIO_CHANNEL", "socketio")  # pub/sub 채널 (환경별로 분리할 때 변경)
+    SOCKETIO_ROOM_TTL = int(os.getenv("SOCKETIO_ROOM_TTL", 86400))  # 룸 멤버 집합 유지 시간(초), 죽은 워커의 sid 정리용
+    SOCKETIO_EMIT_QUEUE_MAXSIZE = int(os.getenv("SOCKETIO_EMIT_QUEUE_MAXSIZE", 10000))  # 발송 대기 가능한 최대 챕터 수
+    SOCKETIO_EMIT_FLUSH_INTERVAL = float(os.getenv("SOCKETIO_EMIT_FLUSH_INTERVAL", 0.05))  # 챕터별 이벤트를 모으는 시간(초)
+
     # Security
     SECRET_KEY = os.getenv("SECRET_KEY", "your-secret-key-here-change-this-in-production")
     ALGORITHM = "HS256"
     ACCESS_TOKEN_EXPIRE_MINUTES = 30
+    TOKEN_CACHE_MAXSIZE = int(os.getenv("TOKEN_CACHE_MAXSIZE", 10000))  # 검증된 토큰 캐시 최대 항목 수
+    TOKEN_CACHE_TTL = float(os.getenv("TOKEN_CACHE_TTL", 30))  # 검증된 토큰 캐시 유지 시간(초)
+    PASSWORD_HASH_WORKERS = int(os.getenv("PASSWORD_HASH_WORKERS", os.cpu_count() or 1))  # 비밀번호 해싱 프로세스 수
+
+    # Chapter
+    CHAPTER_BULK_MAX_SIZE = int(os.getenv("CHAPTER_BULK_MAX_SIZE", 500))  # 일괄 등록 요청당 최대 질문 수
+
+    # Quiz
+    QUIZ_BATCH_MAX_SIZE = int(os.getenv("QUIZ_BATCH_MAX_SIZE", 500))  # 일괄 채점 요청당 최대 답안 수
+    QUIZ_LOCAL_ACCEPT_SIMILARITY = float(os.getenv("QUIZ_LOCAL_ACCEPT_SIMILARITY", 0.85))  # 자모 유사도가 이 이상이면 로컬에서 정답 처리
+    QUIZ_LOCAL_REJECT_SIMILARITY = float(os.getenv("QUIZ_LOCAL_REJECT_SIMILARITY", 0.5))  # 자모 유사도가 이 이하면 로컬에서 오답 처리
+    QUIZ_NUMERIC_ABS_TOLERANCE = float(os.getenv("QUIZ_NUMERIC_ABS_TOLERANCE", 1e-9))  # 숫자 답안 절대 허용 오차
+    QUIZ_NUMERIC_REL_TOLERANCE = float(os.getenv("QUIZ_NUMERIC_REL_TOLERANCE", 1e-6))  # 숫자 답안 상대 허용 오차
+    QUIZ_ESCALATION_CONFIDENCE = float(os.getenv("QUIZ_ESCALATION_CONFIDENCE", 0.8))  # 로컬 판정 신뢰도가 이 미만이면 QuizGrader로 재채점
+    QUIZ_GRADER_URL = os.getenv("QUIZ_GRADER_URL", "")  # n8n QuizGrader webhook (예: http://n8n:5678/webhook/grade1, 비어 있으면 로컬 판정만 사용, "stub"이면 대역 채점기)
+    QUIZ_GRADER_TIMEOUT = float(os.getenv("QUIZ_GRADER_TIMEOUT", 20))  # QuizGrader 요청 타임아웃(초)
+    QUIZ_GRADER_PASS_SCORE = float(os.getenv("QUIZ_GRADER_PASS_SCORE", 60))  # QuizGrader 점수(0~100)가 이 이상이면 정답
+    QUIZ_GRADER_BATCH_SIZE = int(os.getenv("QUIZ_GRADER_BATCH_SIZE", 32))  # QuizGrader 요청 1회에 묶는 최대 답안 수
+    QUIZ_GRADER_BATCH_WAIT = float(os.getenv("QUIZ_GRADER_BATCH_WAIT", 0.05))  # 첫 답안 이후 묶음을 기다리는 최대 시간(초)
+    QUIZ_GRADER_MAX_CONCURRENCY = int(os.getenv("QUIZ_GRADER_MAX_CONCURRENCY", 4))  # 동시에 진행하는 QuizGrader 요청 수
     
     # CORS
     CORS_ORIGINS = ["*"]  # In production, specify exact origins
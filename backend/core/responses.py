@@ -0,0 +1,60 @@
+"""
+JSON 응답
+기본 JSONResponse(json.dumps)보다 빠른 직렬화 경로
+
+- FastJSONResponse: 앱 기본 응답 클래스 (orjson 설치 시 orjson, 없으면 표준 json으로 동작)
+- adapter_response: 미리 만든 Pydantic TypeAdapter로 바로 JSON bytes를 만들어 반환
+  (response_model 검증 + jsonable_encoder 단계를 건너뜀, 핫 경로용)
+
+사용 예시:
+    return adapter_response(single_learning_page_adapter, page)
+"""
+
+import json
+import logging
+from typing import Any, Optional, Dict
+from fastapi.responses import JSONResponse, Response
+from pydantic import TypeAdapter
+
+logger = logging.getLogger(__name__)
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+    logger.warning("orjson not installed. Falling back to the standard json module.")
+
+
+def dumps(content: Any) -> bytes:
+    """JSON 직렬화 (한글 등은 이스케이프하지 않음, JSONResponse와 같은 출력)"""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(content, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(content, ensure_ascii=False, allow_nan=False, separators=(",", ":")).encode("utf-8")
+
+
+class FastJSONResponse(JSONResponse):
+    """orjson으로 렌더링하는 JSONResponse"""
+
+    def render(self, content: Any) -> bytes:
+        return dumps(content)
+
+
+def adapter_response(
+    adapter: TypeAdapter,
+    value: Any,
+    status_code: int = 200,
+    headers: Optional[Dict[str, str]] = None
+) -> Response:
+    """TypeAdapter로 직렬화한 JSON 응답"""
+    return Response(
+        content=adapter.dump_json(value),
+        status_code=status_code,
+        headers=headers,
+        media_type="application/json"
+    )
+
+
+def raw_json_response(body: bytes, headers: Optional[Dict[str, str]] = None) -> Response:
+    """이미 직렬화된 JSON(캐시 등)을 그대로 반환"""
+    return Response(content=body, headers=headers, media_type="application/json")
@@ -1,16 +1,54 @@
 """
 Socket.IO Manager
 실시간 이벤트 전송을 위한 Socket.IO 관리
+
+uvicorn 워커를 여러 개 띄울 때는 SOCKETIO_CLIENT_MANAGER=redis로 설정합니다.
+어느 워커에서 emit하든 Redis pub/sub을 거쳐 모든 워커의 룸 멤버에게 전달되고,
+enter_room/leave_room도 다른 워커에 연결된 sid에 대해 동작합니다.
 """
 
 import socketio
 import logging
+from typing import Optional, Iterable, Dict, Any
+from core.config import settings
+from utils.room_registry import room_registry
 
 logger = logging.getLogger(__name__)
 
+
+def create_client_manager(kind: str = settings.SOCKETIO_CLIENT_MANAGER,
+                          url: str = settings.SOCKETIO_MESSAGE_QUEUE,
+                          channel: str = settings.SOCKETIO_CHANNEL,
+                          write_only: bool = False) -> Optional[socketio.AsyncManager]:
+    """
+    Socket.IO 클라이언트 매니저 생성
+
+    Args:
+        kind: memory(단일 프로세스, 기본 매니저) 또는 redis(Redis pub/sub으로 모든 워커에 전달)
+        url: Redis URL (redis일 때)
+        channel: pub/sub 채널
+        write_only: 이벤트 발행만 하는 프로세스(벤치마크, 외부 워커 등)에서 True
+
+    Returns:
+        AsyncManager 또는 None (memory일 때 AsyncServer 기본 매니저 사용)
+    """
+    if kind == "memory":
+        return None
+    if kind == "redis":
+        return socketio.AsyncRedisManager(url, channel=channel, write_only=write_only)
+    raise ValueError(f"지원하지 않는 SOCKETIO_CLIENT_MANAGER: {kind}")
+
+
+client_manager = create_client_manager()
+
+# 여러 워커에 걸친 룸 멤버십은 redis 매니저일 때만 Redis에 기록
+# (memory일 때는 이 프로세스의 매니저가 곧 전체 멤버십)
+track_rooms = client_manager is not None
+
 # Socket.IO 서버 생성 (ASGI mode for FastAPI)
 sio = socketio.AsyncServer(
     async_mode='asgi',
+    client_manager=client_manager,
     cors_allowed_origins='*',  # 프로덕션에서는 특정 도메인으로 제한
     logger=True,
     engineio_logger=True
@@ -20,6 +58,34 @@ sio = socketio.AsyncServer(
 socket_app = socketio.ASGIApp(sio)
 
 
+def chapter_room(chapter_id: int) -> str:
+    """챕터 룸 이름"""
+    return f"chapter_{chapter_id}"
+
+
+async def get_room_size(room: str) -> int:
+    """
+    룸에 참여 중인 클라이언트 수 (모든 워커 합산)
+
+    Returns:
+        int: 클라이언트 수 (redis 레지스트리 조회 실패 시 -1)
+    """
+    return (await get_room_sizes([room]))[room]
+
+
+async def get_room_sizes(rooms: Iterable[str]) -> Dict[str, int]:
+    """
+    여러 룸의 클라이언트 수 (redis일 때 pipeline 1회 왕복)
+
+    Returns:
+        Dict: 룸 이름 → 클라이언트 수 (redis 레지스트리 조회 실패 시 -1)
+    """
+    rooms = list(rooms)
+    if track_rooms:
+        return await room_registry.sizes(rooms)
+    return {room: sum(1 for _ in sio.manager.get_participants('/', room)) for room in rooms}
+
+
 @sio.event
 async def connect(sid, environ):
     """클라이언트 연결 시"""
@@ -31,6 +97,9 @@ async def connect(sid, environ):
 async def disconnect(sid):
     """클라이언트 연결 해제 시"""
     logger.info(f"Client disconnected: {sid}")
+    if track_rooms:
+        # 매니저가 룸에서 제거하기 전이므로 참여 중이던 룸을 조회할 수 있음
+        await room_registry.leave_all(sid, [room for room in sio.rooms(sid) if room != sid])
 
 
 @sio.event
@@ -38,8 +107,10 @@ async def join_chapter(sid, data):
     """특정 챕터 룸에 참여"""
     chapter_id = data.get('chapter_id')
     if chapter_id:
-        room = f"chapter_{chapter_id}"
+        room = chapter_room(chapter_id)
         await sio.enter_room(sid, room)
+        if track_rooms:
+            await room_registry.join(room, sid)
         logger.info(f"Client {sid} joined room: {room}")
         await sio.emit('joined_chapter', {'chapter_id': chapter_id}, room=sid)
 
@@ -49,64 +120,86 @@ async def leave_chapter(sid, data):
     """챕터 룸에서 나가기"""
     chapter_id = data.get('chapter_id')
     if chapter_id:
-        room = f"chapter_{chapter_id}"
+        room = chapter_room(chapter_id)
         await sio.leave_room(sid, room)
+        if track_rooms:
+            await room_registry.leave(room, sid)
         logger.info(f"Client {sid} left room: {room}")
 
 
 # ==================== 이벤트 전송 함수들 ====================
 
-async def emit_chapter_processing_started(chapter_id: int, title: str):
-    """챕터 생성 시작 알림 (DB 저장 완료, AI 처리 시작 전)"""
-    room = f"chapter_{chapter_id}"
-    await sio.emit('chapter_processing_started', {
+def chapter_processing_started_payload(chapter_id: int, title: str) -> Dict[str, Any]:
+    """챕터 생성 시작 이벤트 데이터"""
+    return {
         'chapter_id': chapter_id,
         'title': title,
         'status': 'processing_started',
         'message': f'챕터 "{title}" 생성이 시작되었습니다. AI가 콘텐츠를 생성 중입니다...'
-    }, room=room)
-    logger.info(f"Emitted chapter_processing_started to room {room}")
+    }
 
 
-async def emit_concept_processing(chapter_id: int, concept_id: int):
-    """개념 정리 AI 처리 시작 알림 (Kafka 요청 전송됨)"""
-    room = f"chapter_{chapter_id}"
-    await sio.emit('concept_processing', {
+def concept_processing_payload(chapter_id: int, concept_id: int) -> Dict[str, Any]:
+    """개념 정리 처리 중 이벤트 데이터"""
+    return {
         'chapter_id': chapter_id,
         'concept_id': concept_id,
         'status': 'processing',
         'message': '개념 정리를 AI가 생성 중입니다...'
-    }, room=room)
-    logger.info(f"Emitted concept_processing to room {room}")
+    }
 
 
-async def emit_exercise_processing(chapter_id: int, exercise_id: int):
-    """실습 과제 AI 처리 시작 알림 (Kafka 요청 전송됨)"""
-    room = f"chapter_{chapter_id}"
-    await sio.emit('exercise_processing', {
+def exercise_processing_payload(chapter_id: int, exercise_id: int) -> Dict[str, Any]:
+    """실습 과제 처리 중 이벤트 데이터"""
+    return {
         'chapter_id': chapter_id,
         'exercise_id': exercise_id,
         'status': 'processing',
         'message': '실습 과제를 AI가 생성 중입니다...'
-    }, room=room)
-    logger.info(f"Emitted exercise_processing to room {room}")
+    }
 
 
-async def emit_quiz_processing(chapter_id: int, quiz_count: int):
-    """퀴즈 AI 처리 시작 알림 (Kafka 요청 전송됨)"""
-    room = f"chapter_{chapter_id}"
-    await sio.emit('quiz_processing', {
+def quiz_processing_payload(chapter_id: int, quiz_count: int) -> Dict[str, Any]:
+    """퀴즈 처리 중 이벤트 데이터"""
+    return {
         'chapter_id': chapter_id,
         'quiz_count': quiz_count,
         'status': 'processing',
         'message': f'형성평가 {quiz_count}개를 AI가 생성 중입니다...'
-    }, room=room)
+    }
+
+
+async def emit_chapter_processing_started(chapter_id: int, title: str):
+    """챕터 생성 시작 알림 (DB 저장 완료, AI 처리 시작 전)"""
+    room = chapter_room(chapter_id)
+    await sio.emit('chapter_processing_started', chapter_processing_started_payload(chapter_id, title), room=room)
+    logger.info(f"Emitted chapter_processing_started to room {room}")
+
+
+async def emit_concept_processing(chapter_id: int, concept_id: int):
+    """개념 정리 AI 처리 시작 알림 (Kafka 요청 전송됨)"""
+    room = chapter_room(chapter_id)
+    await sio.emit('concept_processing', concept_processing_payload(chapter_id, concept_id), room=room)
+    logger.info(f"Emitted concept_processing to room {room}")
+
+
+async def emit_exercise_processing(chapter_id: int, exercise_id: int):
+    """실습 과제 AI 처리 시작 알림 (Kafka 요청 전송됨)"""
+    room = chapter_room(chapter_id)
+    await sio.emit('exercise_processing', exercise_processing_payload(chapter_id, exercise_id), room=room)
+    logger.info(f"Emitted exercise_processing to room {room}")
+
+
+async def emit_quiz_processing(chapter_id: int, quiz_count: int):
+    """퀴즈 AI 처리 시작 알림 (Kafka 요청 전송됨)"""
+    room = chapter_room(chapter_id)
+    await sio.emit('quiz_processing', quiz_processing_payload(chapter_id, quiz_count), room=room)
     logger.info(f"Emitted quiz_processing to room {room}")
 
 
 async def emit_concept_completed(chapter_id: int, concept_id: int):
     """개념 정리 완료 알림 (n8n webhook에서 호출)"""
-    room = f"chapter_{chapter_id}"
+    room = chapter_room(chapter_id)
     await sio.emit('concept_completed', {
         'chapter_id': chapter_id,
         'concept_id': concept_id,
@@ -118,7 +211,7 @@ async def emit_concept_completed(chapter_id: int, concept_id: int):
 
 async def emit_exercise_completed(chapter_id: int, exercise_id: int):
     """실습 과제 완료 알림 (n8n webhook에서 호출)"""
-    room = f"chapter_{chapter_id}"
+    room = chapter_room(chapter_id)
     await sio.emit('exercise_completed', {
         'chapter_id': chapter_id,
         'exercise_id': exercise_id,
@@ -130,7 +223,7 @@ async def emit_exercise_completed(chapter_id: int, exercise_id: int):
 
 async def emit_quiz_completed(chapter_id: int, quiz_count: int):
     """퀴즈 완료 알림 (n8n webhook에서 호출)"""
-    room = f"chapter_{chapter_id}"
+    room = chapter_room(chapter_id)
     await sio.emit('quiz_completed', {
         'chapter_id': chapter_id,
         'quiz_count': quiz_count,
@@ -140,23 +233,43 @@ async def emit_quiz_completed(chapter_id: int, quiz_count: int):
     logger.info(f"Emitted quiz_completed to room {room}")
 
 
-async def emit_all_completed(chapter_id: int):
-    """모든 콘텐츠 생성 완료 알림 (모든 webhook 완료 후)"""
-    room = f"chapter_{chapter_id}"
-    await sio.emit('all_completed', {
+def all_completed_payload(chapter_id: int) -> Dict[str, Any]:
+    """모든 콘텐츠 생성 완료 이벤트 데이터"""
+    return {
         'chapter_id': chapter_id,
         'status': 'all_completed',
         'message': '모든 콘텐츠 생성이 완료되었습니다!'
-    }, room=room)
+    }
+
+
+async def emit_all_completed(chapter_id: int):
+    """모든 콘텐츠 생성 완료 알림 (모든 webhook 완료 후)"""
+    room = chapter_room(chapter_id)
+    await sio.emit('all_completed', all_completed_payload(chapter_id), room=room)
     logger.info(f"Emitted all_completed to room {room}")
 
 
-async def emit_progress_update(chapter_id: int, progress: int, message: str):
-    """진행 상황 업데이트 (선택적 사용)"""
-    room = f"chapter_{chapter_id}"
-    await sio.emit('progress_update', {
+async def emit_progress_update(chapter_id: int, progress: Optional[int], message: str,
+                               resource: Optional[str] = None, seq: Optional[int] = None,
+                               delta: Optional[str] = None):
+    """
+    진행 상황 업데이트
+
+    생성 스트리밍 중에는 새로 생성된 텍스트 조각(delta)과 순번(seq)을 함께 보내며,
+    클라이언트는 seq 순서대로 delta를 이어 붙여 표시합니다.
+    조각마다 호출되므로 INFO 로그는 남기지 않습니다.
+
+    Args:
+        progress: 0-100 (모르면 None)
+        resource: 스트리밍 중인 리소스 (concept 등)
+    """
+    room = chapter_room(chapter_id)
+    payload = {
         'chapter_id': chapter_id,
         'progress': progress,  # 0-100
         'message': message
-    }, room=room)
-    logger.info(f"Emitted progress_update to room {room}: {progress}%")
+    }
+    if delta is not None:
+        payload.update(resource=resource, seq=seq, delta=delta)
+    await sio.emit('progress_update', payload, room=room)
+    logger.debug(f"Emitted progress_update to room {room}: {progress}%")
@@ -6,12 +6,15 @@ SQLAlchemy를 사용한 MySQL 연결 + Redis 연결
 from sqlalchemy import create_engine
 from sqlalchemy.orm import sessionmaker, Session
 from sqlalchemy.pool import QueuePool
-from typing import Generator
+from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker, AsyncSession
+from typing import Generator, AsyncGenerator, Dict, Any
 import redis
+import redis.asyncio as aioredis
 from core.config import settings
 
 # 데이터베이스 URL 생성
 DATABASE_URL = settings.DATABASE_URL
+ASYNC_DATABASE_URL = settings.ASYNC_DATABASE_URL
 
 # SQLAlchemy 엔진 생성
 engine = create_engine(
@@ -38,14 +41,49 @@ SessionLocal = sessionmaker(
     bind=engine
 )
 
-# Redis 클라이언트 생성
-redis_client = redis.Redis(
-    host=settings.REDIS_HOST,
-    port=settings.REDIS_PORT,
-    db=settings.REDIS_DB,
-    decode_responses=True  # 문자열로 자동 디코딩
+# 비동기 SQLAlchemy 엔진 생성 (async 라우터 전용, 이벤트 루프를 막지 않음)
+async_engine = create_async_engine(
+    ASYNC_DATABASE_URL,
+    pool_size=5,
+    max_overflow=10,
+    pool_pre_ping=True,
+    pool_recycle=300,
+    pool_timeout=30,
+    echo=False,
+    connect_args={
+        "connect_timeout": 10,
+        "charset": "utf8mb4"
+    }
+)
+
+# AsyncSessionLocal 클래스 생성
+# commit 후 속성 접근 시 lazy load(암묵적 I/O)가 일어나지 않도록 expire_on_commit=False
+AsyncSessionLocal = async_sessionmaker(
+    bind=async_engine,
+    class_=AsyncSession,
+    autoflush=False,
+    expire_on_commit=False
 )
 
+# Redis 커넥션 풀 설정 (sync/async 공통)
+REDIS_POOL_OPTIONS = {
+    "host": settings.REDIS_HOST,
+    "port": settings.REDIS_PORT,
+    "db": settings.REDIS_DB,
+    "max_connections": settings.REDIS_MAX_CONNECTIONS,
+    "socket_timeout": settings.REDIS_SOCKET_TIMEOUT,
+    "socket_connect_timeout": settings.REDIS_CONNECT_TIMEOUT,
+    "decode_responses": True  # 문자열로 자동 디코딩
+}
+
+# Redis 클라이언트 생성 (sync 라우트/스레드용)
+redis_pool = redis.ConnectionPool(**REDIS_POOL_OPTIONS)
+redis_client = redis.Redis(connection_pool=redis_pool)
+
+# 비동기 Redis 클라이언트 생성 (async 라우트용, 이벤트 루프를 막지 않음)
+async_redis_pool = aioredis.ConnectionPool(**REDIS_POOL_OPTIONS)
+async_redis_client = aioredis.Redis(connection_pool=async_redis_pool)
+
 
 def get_db() -> Generator[Session, None, None]:
     """
@@ -67,6 +105,23 @@ def get_db() -> Generator[Session, None, None]:
         db.close()
 
 
+async def get_async_db() -> AsyncGenerator[AsyncSession, None]:
+    """
+    비동기 데이터베이스 세션 의존성
+    async def 라우터에서 사용 (DB 왕복 동안 이벤트 루프가 Socket.IO 등 다른 작업을 처리)
+
+    Usage:
+        @app.post("/chapters")
+        async def create_chapter(db: AsyncSession = Depends(get_async_db)):
+            ...
+
+    Yields:
+        AsyncSession: 비동기 데이터베이스 세션
+    """
+    async with AsyncSessionLocal() as db:
+        yield db
+
+
 def init_db():
     """
     데이터베이스 초기화
@@ -107,3 +162,38 @@ def get_redis() -> redis.Redis:
         redis.Redis: Redis 클라이언트
     """
     return redis_client
+
+
+def get_async_redis() -> aioredis.Redis:
+    """
+    비동기 Redis 클라이언트 의존성
+
+    Usage:
+        @app.post("/login")
+        async def login(redis: aioredis.Redis = Depends(get_async_redis)):
+            await redis.setex(...)
+
+    Returns:
+        aioredis.Redis: 비동기 Redis 클라이언트 (공유 커넥션 풀)
+    """
+    return async_redis_client
+
+
+def get_redis_pool_metrics() -> Dict[str, Any]:
+    """
+    Redis 커넥션 풀 사용량
+
+    Returns:
+        Dict: sync/async 풀별 max/created/in_use/available 커넥션 수
+    """
+    metrics = {}
+    for name, pool in (("sync", redis_pool), ("async", async_redis_pool)):
+        in_use = len(pool._in_use_connections)
+        available = len(pool._available_connections)
+        metrics[name] = {
+            "max": pool.max_connections,
+            "created": in_use + available,
+            "in_use": in_use,
+            "available": available,
+        }
+    return metrics
@@ -3,7 +3,7 @@ SQLAlchemy 데이터베이스 모델 (단일 질문-학습 모드)
 질문 1개 → Chapter 1개 → Concept 1개 + Exercise 1개 + Quiz 1개
 """
 
-from sqlalchemy import Column, Integer, String, Text, DateTime, Boolean, Enum, ForeignKey, JSON, UniqueConstraint
+from sqlalchemy import Column, Integer, String, Text, DateTime, Boolean, Enum, ForeignKey, JSON, UniqueConstraint, Index
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import relationship
 from datetime import datetime
@@ -32,6 +32,14 @@ class QuizTypeEnum(str, enum.Enum):
     boolean = "boolean"
 
 
+class CompletionBit(enum.IntFlag):
+    """챕터 리소스 생성 완료 비트 (Chapter.completion_mask)"""
+    concept = 1
+    exercise = 2
+    quiz = 4
+    all = concept | exercise | quiz
+
+
 class Member(Base):
     """회원 모델"""
     __tablename__ = "member"
@@ -72,12 +80,17 @@ class Course(Base):
 class Chapter(Base):
     """챕터 모델 (단일 모드: 질문 1개 = 챕터 1개)"""
     __tablename__ = "chapter"
+    __table_args__ = (
+        # 사용자별 최신순 목록 (keyset 페이지네이션의 (created_at, id) 정렬/범위 조건과 같은 순서)
+        Index('ix_chapter_owner_created', 'owner_id', 'created_at', 'id'),
+    )
 
     id = Column(Integer, primary_key=True, autoincrement=True)
     owner_id = Column(Integer, ForeignKey("member.id"), nullable=False)
     title = Column(String(255), nullable=False)  # 학생이 입력한 질문
     description = Column(Text, nullable=True)  # AI가 생성한 요약/설명
     status = Column(Enum(StatusEnum), default=StatusEnum.pending)  # AI 생성 상태
+    completion_mask = Column(Integer, default=0, server_default="0", nullable=False)  # 생성 완료된 리소스 비트 (CompletionBit)
     is_active = Column(Boolean, default=True)
     created_at = Column(DateTime, default=datetime.utcnow)
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
@@ -158,3 +171,26 @@ class Quiz(Base):
 
     def __repr__(self):
         return f"<Quiz(id={self.id}, chapter_id={self.chapter_id}, type={self.type})>"
+
+
+class Outbox(Base):
+    """
+    트랜잭셔널 아웃박스 모델
+    Chapter/Concept/Exercise/Quiz와 같은 트랜잭션에 Kafka 발송 메시지를 기록하고,
+    outbox_relay가 우선순위/사용자별 공정 순서로 읽어 발송한 뒤 ack된 행을 삭제합니다 (at-least-once).
+    """
+    __tablename__ = "outbox"
+
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    topic = Column(String(255), nullable=False)
+    message_key = Column(String(255), nullable=False)
+    payload = Column(JSON, nullable=False)
+    user_id = Column(Integer, nullable=True)  # 요청한 사용자 (relay의 사용자별 공정 발송 기준)
+    priority = Column(String(16), default="normal", nullable=False)  # high(개념 정리) / normal(실습, 퀴즈)
+    attempts = Column(Integer, default=0, nullable=False)  # 발송 실패 횟수
+    claimed_until = Column(DateTime, nullable=True)  # relay가 발송 중인 행 (이 시각까지 다른 relay가 가져가지 않음)
+    failed_at = Column(DateTime, nullable=True)  # OUTBOX_MAX_ATTEMPTS번 실패해 발송을 포기한 시각
+    created_at = Column(DateTime, default=datetime.utcnow)
+
+    def __repr__(self):
+        return f"<Outbox(id={self.id}, topic={self.topic}, message_key={self.message_key}, attempts={self.attempts})>"
@@ -0,0 +1,380 @@
+"""
+Kafka Consumer Worker
+n8n-responses 토픽에서 AI 생성 결과를 읽어 MySQL에 일괄 반영하는 독립 실행 워커
+
+HTTP webhook(/v1/chapter/{id}/concept-finish 등)을 거치지 않는 고처리량 수집 경로:
+1. n8n-responses에서 최대 KAFKA_CONSUMER_BATCH_SIZE개 메시지를 마이크로 배치로 수집
+2. 배치당 하나의 트랜잭션으로 concept/exercise/quiz를 upsert (테이블별 multi-row INSERT ... ON DUPLICATE KEY UPDATE)
+   - 스키마/퀴즈 유형/컬럼 길이를 통과하지 못한 메시지는 파싱 단계에서 로깅 후 건너뜀
+   - 배치 반영이 KAFKA_CONSUMER_MAX_ATTEMPTS번 연속 실패하면 결과를 하나씩 반영하고,
+     하나만으로도 계속 실패하는 결과는 n8n-responses-dlq로 보냄 (한 메시지가 파티션을 막지 않도록)
+3. DB commit 이후에만 오프셋 commit (at-least-once, upsert라 재처리해도 안전)
+4. 완료 Socket.IO 이벤트 발송 (SOCKETIO_CLIENT_MANAGER=redis일 때 API 서버의 클라이언트에 전달)
+
+메시지 형식:
+    {
+        "message_id": "uuid",
+        "workflow_type": "concept",   # concept, exercise, quiz
+        "chapter_id": 456,
+        "data": {"title": "...", "content": "..."}  # 각 webhook 스키마와 동일
+    }
+
+실행:
+    python kafka_consumer.py
+"""
+
+import asyncio
+import json
+import logging
+from typing import Dict, Any, List, Tuple
+
+from pydantic import ValidationError
+from sqlalchemy import select, update
+from sqlalchemy.dialects.mysql import insert as mysql_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+
+from core.config import settings
+from db import models
+from db.database import AsyncSessionLocal, async_engine
+from api.v1.schemas import ConceptWebhook, ExerciseWebhook, QuizWebhook
+from utils.kafka_manager import kafka_manager
+from utils.learning_page_cache import learning_page_cache
+from utils.generation_cache import generation_cache
+from utils.generation_scheduler import inflight_limiter, lease_member
+from core.socketio_manager import (
+    emit_concept_completed,
+    emit_exercise_completed,
+    emit_quiz_completed,
+    emit_all_completed
+)
+
+logger = logging.getLogger(__name__)
+
+# workflow_type별 페이로드 스키마
+RESPONSE_SCHEMAS = {
+    "concept": ConceptWebhook,
+    "exercise": ExerciseWebhook,
+    "quiz": QuizWebhook,
+}
+
+# 길이 제한이 있는 컬럼에 저장되는 페이로드 필드 (workflow_type → [(필드, 컬럼)])
+LIMITED_FIELDS = {
+    "concept": [("title", models.Concept.title)],
+    "exercise": [("question", models.Exercise.title), ("answer", models.Exercise.contents)],
+    "quiz": [("correct_answer", models.Quiz.correct_answer)],
+}
+
+# DB 실패 시 재시도 전 대기 시간 (초, 재시도할 때마다 배수로 증가)
+RETRY_BACKOFF = 1.0
+
+
+def validate_payload(workflow_type: str, payload: Any):
+    """
+    DB에 저장할 수 없는 페이로드 검사 (재처리해도 같은 오류로 배치 전체를 실패시키므로)
+
+    Raises:
+        ValueError: 퀴즈 유형이 QuizTypeEnum에 없거나 길이 제한을 넘는 필드가 있는 경우
+    """
+    if workflow_type == "quiz":
+        models.QuizTypeEnum(payload.type)
+    for field, column in LIMITED_FIELDS[workflow_type]:
+        value = getattr(payload, field)
+        if value is not None and len(value) > column.type.length:
+            raise ValueError(f"{field} is longer than {column.type.length} characters ({len(value)})")
+
+
+def parse_batch(messages) -> Dict[str, Dict[int, Any]]:
+    """
+    Kafka 메시지 배치를 workflow_type별 {chapter_id: payload}로 변환
+    같은 챕터에 대한 결과가 여러 개면 마지막 메시지가 우선합니다.
+    파싱/검증에 실패한 메시지는 로깅 후 건너뜁니다 (재처리해도 실패하므로).
+    """
+    results: Dict[str, Dict[int, Any]] = {workflow_type: {} for workflow_type in RESPONSE_SCHEMAS}
+
+    for msg in messages:
+        if msg.error():
+            logger.error(f"Kafka 메시지 오류: {msg.error()}")
+            continue
+        try:
+            message = json.loads(msg.value())
+            workflow_type = message["workflow_type"]
+            schema = RESPONSE_SCHEMAS[workflow_type]
+            payload = schema(**message["data"])
+            validate_payload(workflow_type, payload)
+            results[workflow_type][int(message["chapter_id"])] = payload
+        except (ValueError, KeyError, TypeError, ValidationError) as e:
+            logger.error(f"잘못된 응답 메시지 건너뜀 - Offset: {msg.partition()}:{msg.offset()}, Error: {e}")
+
+    return results
+
+
+def upsert(db, model, rows: List[Dict[str, Any]], columns: List[str]):
+    """chapter_id 기준 upsert 문 (MySQL: ON DUPLICATE KEY UPDATE, 그 외(SQLite): ON CONFLICT DO UPDATE)"""
+    if db.get_bind().dialect.name == "mysql":
+        stmt = mysql_insert(model).values(rows)
+        return stmt.on_duplicate_key_update({column: stmt.inserted[column] for column in columns})
+    stmt = sqlite_insert(model).values(rows)
+    return stmt.on_conflict_do_update(
+        index_elements=["chapter_id"],
+        set_={column: stmt.excluded[column] for column in columns}
+    )
+
+
+async def ingest_batch(results: Dict[str, Dict[int, Any]]) -> Tuple[Dict[str, Dict[int, int]], List[int]]:
+    """
+    파싱된 결과를 하나의 트랜잭션으로 upsert
+
+    Returns:
+        (workflow_type별 {chapter_id: row_id}, 이번 배치로 모두 완료된 chapter_id 목록)
+    """
+    chapter_ids = set()
+    for payloads in results.values():
+        chapter_ids.update(payloads)
+    if not chapter_ids:
+        return {}, []
+
+    async with AsyncSessionLocal() as db:
+        # 존재하지 않는 챕터는 FK 오류로 배치 전체를 실패시키므로 미리 제외
+        existing = set((await db.scalars(
+            select(models.Chapter.id).where(models.Chapter.id.in_(chapter_ids))
+        )).all())
+        missing = chapter_ids - existing
+        if missing:
+            logger.error(f"존재하지 않는 챕터 결과 건너뜀: {sorted(missing)}")
+
+        concepts = {cid: p for cid, p in results["concept"].items() if cid in existing}
+        exercises = {cid: p for cid, p in results["exercise"].items() if cid in existing}
+        quizzes = {cid: p for cid, p in results["quiz"].items() if cid in existing}
+
+        if concepts:
+            await db.execute(upsert(db, models.Concept, [
+                {"chapter_id": cid, "title": p.title, "content": p.content, "is_complete": True}
+                for cid, p in concepts.items()
+            ], ["title", "content", "is_complete"]))
+
+        if exercises:
+            await db.execute(upsert(db, models.Exercise, [
+                {"chapter_id": cid, "title": p.question, "contents": p.answer, "is_complete": True}
+                for cid, p in exercises.items()
+            ], ["title", "contents", "is_complete"]))
+
+        if quizzes:
+            # options는 webhook(quiz_finish_webhook)과 같은 JSON 문자열로 저장
+            await db.execute(upsert(db, models.Quiz, [
+                {"chapter_id": cid, "question": p.question, "correct_answer": p.correct_answer,
+                 "options": json.dumps(p.options) if p.options else None, "type": models.QuizTypeEnum(p.type)}
+                for cid, p in quizzes.items()
+            ], ["question", "correct_answer", "options", "type"]))
+
+        # 이벤트 발송용 row id 조회
+        row_ids: Dict[str, Dict[int, int]] = {}
+        for workflow_type, model, payloads in (
+            ("concept", models.Concept, concepts),
+            ("exercise", models.Exercise, exercises),
+            ("quiz", models.Quiz, quizzes),
+        ):
+            if payloads:
+                rows = await db.execute(
+                    select(model.chapter_id, model.id).where(model.chapter_id.in_(payloads))
+                )
+                row_ids[workflow_type] = {chapter_id: row_id for chapter_id, row_id in rows}
+
+        # 리소스별 완료 비트 설정 후, 이번 배치로 모든 비트가 채워진 pending 챕터를 완료 처리
+        # (완료 비트 UPDATE가 row lock을 잡으므로 동시에 들어온 webhook과 중복 완료되지 않음)
+        for bit, payloads in (
+            (models.CompletionBit.concept, concepts),
+            (models.CompletionBit.exercise, exercises),
+            (models.CompletionBit.quiz, quizzes),
+        ):
+            if payloads:
+                await db.execute(
+                    update(models.Chapter)
+                    .where(models.Chapter.id.in_(payloads))
+                    .values(completion_mask=models.Chapter.completion_mask.op("|")(int(bit)))
+                )
+
+        touched = set(concepts) | set(exercises) | set(quizzes)
+        completed_ids: List[int] = []
+        if touched:
+            completed_ids = list((await db.scalars(
+                select(models.Chapter.id).where(
+                    models.Chapter.id.in_(touched),
+                    models.Chapter.completion_mask == int(models.CompletionBit.all),
+                    models.Chapter.status == models.StatusEnum.pending
+                )
+            )).all())
+            if completed_ids:
+                await db.execute(
+                    update(models.Chapter)
+                    .where(models.Chapter.id.in_(completed_ids))
+                    .values(status=models.StatusEnum.completed)
+                )
+
+        await db.commit()
+
+    return row_ids, completed_ids
+
+
+async def ingest_rows(results: Dict[str, Dict[int, Any]]) -> Tuple[Dict[str, Dict[int, int]], List[int]]:
+    """
+    배치 반영이 계속 실패할 때 결과를 하나씩 반영 (다른 결과가 함께 막히지 않도록)
+    하나만으로도 KAFKA_CONSUMER_MAX_ATTEMPTS번 실패한 결과는 dead-letter 토픽으로 보내고 건너뜁니다.
+
+    Returns:
+        ingest_batch()와 같은 형식 (반영된 결과만 포함)
+    """
+    row_ids: Dict[str, Dict[int, int]] = {}
+    completed_ids: List[int] = []
+    for workflow_type, payloads in results.items():
+        for chapter_id, payload in payloads.items():
+            single = {key: {} for key in RESPONSE_SCHEMAS}
+            single[workflow_type][chapter_id] = payload
+            for attempt in range(1, settings.KAFKA_CONSUMER_MAX_ATTEMPTS + 1):
+                try:
+                    ids, completed = await ingest_batch(single)
+                except Exception as e:
+                    if attempt == settings.KAFKA_CONSUMER_MAX_ATTEMPTS:
+                        await dead_letter(workflow_type, chapter_id, payload, e)
+                        break
+                    await asyncio.sleep(RETRY_BACKOFF * attempt)
+                    continue
+                for key, rows in ids.items():
+                    row_ids.setdefault(key, {}).update(rows)
+                completed_ids.extend(completed)
+                break
+    return row_ids, completed_ids
+
+
+async def dead_letter(workflow_type: str, chapter_id: int, payload: Any, error: Exception):
+    """
+    반영할 수 없는 결과를 dead-letter 토픽으로 발송 (n8n-responses와 같은 형식 + error, 원인 해결 후 재발행 가능)
+    """
+    message = {
+        "workflow_type": workflow_type,
+        "chapter_id": chapter_id,
+        "data": payload.model_dump(),
+        "error": str(error)
+    }
+    logger.error(f"반영할 수 없는 결과를 dead-letter로 보냄 - Chapter: {chapter_id}, Type: {workflow_type}, Error: {error}")
+    try:
+        await (await kafka_manager.publish_async(
+            kafka_manager.TOPICS["N8N_RESPONSES_DLQ"], f"{workflow_type}:{chapter_id}", message
+        ))
+    except Exception as e:
+        logger.error(f"dead-letter 발송 실패 - Message: {message}, Error: {e}")
+
+
+async def emit_batch_events(row_ids: Dict[str, Dict[int, int]], completed_ids: List[int]):
+    """배치 반영 결과에 해당하는 Socket.IO 이벤트 발송"""
+    for chapter_id, concept_id in row_ids.get("concept", {}).items():
+        await emit_concept_completed(chapter_id, concept_id)
+    for chapter_id, exercise_id in row_ids.get("exercise", {}).items():
+        await emit_exercise_completed(chapter_id, exercise_id)
+    for chapter_id in row_ids.get("quiz", {}):
+        await emit_quiz_completed(chapter_id, 1)
+    for chapter_id in completed_ids:
+        await emit_all_completed(chapter_id)
+
+
+def rewind(consumer, messages):
+    """배치 처리 실패 시 파티션별 첫 오프셋으로 되돌려 다음 poll에서 재처리"""
+    from confluent_kafka import TopicPartition
+
+    first_offsets: Dict[Tuple[str, int], int] = {}
+    for msg in messages:
+        if msg.error():
+            continue
+        key = (msg.topic(), msg.partition())
+        first_offsets[key] = min(first_offsets.get(key, msg.offset()), msg.offset())
+    for (topic, partition), offset in first_offsets.items():
+        consumer.seek(TopicPartition(topic, partition, offset))
+
+
+async def run_worker():
+    """n8n-responses 소비 루프"""
+    consumer = kafka_manager.get_consumer(
+        [kafka_manager.TOPICS["N8N_RESPONSES"]],
+        group_id=settings.KAFKA_CONSUMER_GROUP,
+        extra_config={
+            'enable.auto.commit': False,
+            'auto.offset.reset': 'earliest'
+        }
+    )
+    if consumer is None:
+        logger.error("Kafka Consumer를 생성할 수 없어 워커를 종료합니다.")
+        return
+
+    if settings.SOCKETIO_CLIENT_MANAGER != "redis":
+        logger.warning("SOCKETIO_CLIENT_MANAGER가 redis가 아니어서 완료 이벤트가 API 서버 클라이언트에 전달되지 않습니다.")
+
+    loop = asyncio.get_running_loop()
+    logger.info(f"n8n-responses 소비 시작 - Group: {settings.KAFKA_CONSUMER_GROUP}, "
+                f"Batch: {settings.KAFKA_CONSUMER_BATCH_SIZE}")
+
+    failures = 0  # 같은 배치의 연속 반영 실패 횟수
+    try:
+        while True:
+            messages = await loop.run_in_executor(
+                None,
+                consumer.consume,
+                settings.KAFKA_CONSUMER_BATCH_SIZE,
+                settings.KAFKA_CONSUMER_BATCH_TIMEOUT
+            )
+            if not messages:
+                continue
+
+            results = parse_batch(messages)
+            try:
+                row_ids, completed_ids = await ingest_batch(results)
+                failures = 0
+            except Exception as e:
+                failures += 1
+                if failures < settings.KAFKA_CONSUMER_MAX_ATTEMPTS:
+                    logger.error(f"배치 DB 반영 실패, 재처리 예정 ({len(messages)}건, {failures}회): {e}")
+                    rewind(consumer, messages)
+                    await asyncio.sleep(RETRY_BACKOFF * failures)
+                    continue
+                # 같은 배치가 계속 실패하면 원인이 된 결과만 dead-letter로 보내고 나머지는 반영
+                logger.error(f"배치 DB 반영 {failures}회 실패, 결과별로 반영 ({len(messages)}건): {e}")
+                row_ids, completed_ids = await ingest_rows(results)
+                failures = 0
+
+            # DB commit 이후에만 오프셋 commit
+            try:
+                await loop.run_in_executor(None, lambda: consumer.commit(asynchronous=False))
+            except Exception as e:
+                # 커밋 실패 시 재전달될 수 있지만 upsert라 중복 반영은 안전
+                logger.error(f"오프셋 commit 실패: {e}")
+
+            # 반영된 챕터의 학습 페이지 캐시 무효화
+            touched = set()
+            for chapter_rows in row_ids.values():
+                touched.update(chapter_rows)
+            if touched:
+                await learning_page_cache.invalidate_many_async(list(touched))
+
+            # 생성 스케줄러의 발송 중 슬롯 반납
+            await inflight_limiter.release([
+                lease_member(chapter_id, workflow_type)
+                for workflow_type, chapter_rows in row_ids.items()
+                for chapter_id in chapter_rows
+            ])
+
+            # 완료된 챕터의 생성 결과를 같은 질문에 재사용하도록 저장
+            if completed_ids:
+                async with AsyncSessionLocal() as db:
+                    await generation_cache.store_completed(completed_ids, db)
+
+            await emit_batch_events(row_ids, completed_ids)
+            logger.info(f"배치 반영 완료 - Messages: {len(messages)}, Completed chapters: {len(completed_ids)}")
+    finally:
+        consumer.close()
+        await async_engine.dispose()
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    try:
+        asyncio.run(run_worker())
+    except KeyboardInterrupt:
+        pass
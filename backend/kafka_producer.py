@@ -15,5 +15,8 @@ from utils.kafka_manager import (
     notify_content_update,
     create_concept_request,
     create_exercise_request,
-    create_quiz_request
-)
\ No newline at end of file
+    create_quiz_request,
+    create_concept_request_async,
+    create_exercise_request_async,
+    create_quiz_request_async
+)
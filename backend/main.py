@@ -6,6 +6,7 @@ Socket.IO와 통합된 메인 애플리케이션
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from contextlib import asynccontextmanager
+import asyncio
 import uvicorn
 
 # 라우터 import (api/v1 구조 사용)
@@ -19,6 +20,7 @@ from api.v1.quizzes import router as quizzes_router
 
 # Socket.IO import
 from core.socketio_manager import socket_app, sio
+from core.responses import FastJSONResponse
 
 # Kafka producer import
 from kafka_producer import close_kafka_producer
@@ -39,11 +41,48 @@ async def lifespan(app: FastAPI):
         print("Database initialized successfully!")
     except Exception as e:
         print(f"Database initialization failed: {e}")
+
+    # 비밀번호 해싱 프로세스 풀 (리스너/폴러 스레드보다 먼저 생성)
+    from utils.password_hasher import password_hasher
+    password_hasher.start()
+
+    # 로그아웃 시 토큰 캐시 무효화 메시지 수신
+    from utils.token_cache import token_cache
+    token_cache.start_listener()
+
+    # Socket.IO 상태 이벤트 발송 큐
+    from utils.emission_queue import emission_queue
+    emission_queue.start()
+
+    # 유사 질문 색인을 백그라운드에서 미리 채움 (첫 질문 등록 요청이 색인 구축을 기다리지 않도록)
+    from utils.similar_question_index import similar_question_index
+    similar_index_warm_up = asyncio.create_task(similar_question_index.warm_up())
     
     yield
     # 종료 시
     print("Shutting down FastAPI application...")
+    similar_index_warm_up.cancel()
+    await emission_queue.stop()
     close_kafka_producer()
+    token_cache.stop_listener()
+
+    # 모으던 재채점 답안 발송 후 QuizGrader 커넥션 풀 정리
+    from utils.grading_dispatcher import grading_dispatcher
+    from utils.quiz_grader import quiz_grader
+    grading_dispatcher.stop()
+    quiz_grader.close()
+
+    # 비밀번호 해싱 프로세스 풀 종료
+    password_hasher.shutdown()
+
+    # Redis 커넥션 풀 정리
+    from db.database import async_redis_pool, redis_pool
+    await async_redis_pool.disconnect()
+    redis_pool.disconnect()
+
+    # 비동기 DB 커넥션 풀 정리
+    from db.database import async_engine
+    await async_engine.dispose()
 
 
 # FastAPI 앱 생성
@@ -51,7 +90,8 @@ app = FastAPI(
     title="AI Learning Platform API",
     description="N8N + Gemini + Kafka를 사용한 AI 기반 학습 플랫폼",
     version="1.0.0",
-    lifespan=lifespan
+    lifespan=lifespan,
+    default_response_class=FastJSONResponse  # orjson 직렬화
 )
 
 # CORS 설정
@@ -61,6 +101,7 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["X-Next-Cursor"],  # 챕터 목록 keyset 페이지네이션 커서
 )
 
 # 라우터 등록
@@ -76,6 +117,35 @@ app.include_router(quizzes_router.router)
 app.mount("/socket.io", socket_app)
 
 
+@app.get("/metrics")
+def get_metrics():
+    """커넥션 풀 등 운영 지표 조회"""
+    from db.database import get_redis_pool_metrics
+    from utils.emission_queue import emission_queue
+    from utils.generation_cache import generation_cache
+    from utils.similar_question_index import similar_question_index
+    from utils.quiz_grader import quiz_grader
+    from utils.grading_dispatcher import grading_dispatcher
+    from utils.generation_scheduler import get_scheduler_metrics
+    from utils.rate_limiter import generation_limiter
+    from utils.password_hasher import password_hasher
+    from utils.learning_page_cache import learning_page_cache
+    from utils.answer_key_cache import answer_key_cache
+    return {
+        "redis_pool": get_redis_pool_metrics(),
+        "emission_queue": emission_queue.stats,
+        "generation_cache": generation_cache.get_metrics(),
+        "similar_question_index": similar_question_index.get_metrics(),
+        "quiz_grader": quiz_grader.stats,
+        "grading_dispatcher": grading_dispatcher.get_metrics(),
+        "generation_scheduler": get_scheduler_metrics(),
+        "generation_limiter": generation_limiter.get_metrics(),
+        "password_hasher": password_hasher.get_metrics(),
+        "learning_page_cache": learning_page_cache.stats,
+        "answer_key_cache": answer_key_cache.stats
+    }
+
+
 if __name__ == "__main__":
     # 개발 서버 실행
     uvicorn.run(
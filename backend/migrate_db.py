@@ -0,0 +1,90 @@
+"""
+Database migration script
+init_db(create_all)는 없는 테이블만 만들고 기존 테이블은 바꾸지 않으므로,
+이미 운영 중인 DB에 models.py에서 추가된 컬럼/인덱스를 반영합니다.
+이미 반영된 항목은 건너뛰므로 여러 번 실행해도 안전합니다.
+
+- chapter.completion_mask (리소스 완료 비트, 기존 챕터는 리소스 완료 여부로 채움)
+- ix_chapter_owner_created (owner_id, created_at, id) - 챕터 목록 keyset 페이지네이션
+- outbox 테이블 및 user_id, priority, claimed_until, failed_at 컬럼
+
+실행:
+    python migrate_db.py
+"""
+
+from sqlalchemy import Engine, inspect, text
+from sqlalchemy.schema import CreateIndex
+
+from db import models
+from db.database import engine
+
+# (테이블, 컬럼, 컬럼 정의) - models.py 선언과 같은 정의
+COLUMNS = [
+    ("chapter", "completion_mask", "INT NOT NULL DEFAULT 0"),
+    ("outbox", "user_id", "INT NULL"),
+    ("outbox", "priority", "VARCHAR(16) NOT NULL DEFAULT 'normal'"),
+    ("outbox", "claimed_until", "DATETIME NULL"),
+    ("outbox", "failed_at", "DATETIME NULL"),
+]
+
+# completion_mask 추가 전의 완료 판정(개념/실습 is_complete, 퀴즈 question)으로 기존 챕터의 비트를 채움
+BACKFILL_COMPLETION_MASK = f"""
+UPDATE chapter SET completion_mask =
+    CASE WHEN EXISTS (SELECT 1 FROM concept WHERE concept.chapter_id = chapter.id AND concept.is_complete)
+         THEN {int(models.CompletionBit.concept)} ELSE 0 END
+  + CASE WHEN EXISTS (SELECT 1 FROM exercise WHERE exercise.chapter_id = chapter.id AND exercise.is_complete)
+         THEN {int(models.CompletionBit.exercise)} ELSE 0 END
+  + CASE WHEN EXISTS (SELECT 1 FROM quiz WHERE quiz.chapter_id = chapter.id AND quiz.question IS NOT NULL)
+         THEN {int(models.CompletionBit.quiz)} ELSE 0 END
+"""
+
+
+def migrate(bind: Engine = engine):
+    """
+    models.py와 DB 스키마 차이 반영
+
+    Returns:
+        List: 실행한 변경 설명 목록
+    """
+    applied = []
+
+    # 없는 테이블(outbox 등)은 현재 모델 정의 그대로 생성
+    existing_tables = set(inspect(bind).get_table_names())
+    models.Base.metadata.create_all(bind=bind)
+    applied += [f"create table {name}" for name in models.Base.metadata.tables if name not in existing_tables]
+
+    with bind.begin() as conn:
+        inspector = inspect(conn)
+        for table, column, definition in COLUMNS:
+            if column in {c["name"] for c in inspector.get_columns(table)}:
+                continue
+            conn.execute(text(f"ALTER TABLE {table} ADD COLUMN {column} {definition}"))
+            applied.append(f"add column {table}.{column}")
+            if (table, column) == ("chapter", "completion_mask"):
+                conn.execute(text(BACKFILL_COMPLETION_MASK))
+
+        # 인덱스가 없거나 컬럼 구성이 다르면 (예: 이전 (owner_id, created_at)) 다시 생성
+        for table in models.Base.metadata.sorted_tables:
+            current = {index["name"]: index["column_names"] for index in inspector.get_indexes(table.name)}
+            for index in table.indexes:
+                columns = [column.name for column in index.columns]
+                if current.get(index.name) == columns:
+                    continue
+                if index.name in current and conn.dialect.name == "mysql":
+                    # 외래 키(owner_id)가 쓰는 인덱스는 따로 DROP할 수 없어 한 문장으로 교체
+                    conn.execute(text(
+                        f"ALTER TABLE {table.name} DROP INDEX {index.name}, "
+                        f"ADD INDEX {index.name} ({', '.join(columns)})"
+                    ))
+                else:
+                    if index.name in current:
+                        conn.execute(text(f"DROP INDEX {index.name}"))
+                    conn.execute(CreateIndex(index))
+                applied.append(f"create index {index.name} ({', '.join(columns)})")
+
+    return applied
+
+
+if __name__ == "__main__":
+    for change in migrate() or ["nothing to migrate"]:
+        print(change)
@@ -0,0 +1,218 @@
+"""
+Outbox Relay
+outbox 테이블에 기록된 메시지를 AI 생성 스케줄러 순서대로 Kafka로 발송하는 독립 실행 프로세스
+
+create_chapter는 Chapter/Concept/Exercise/Quiz와 같은 트랜잭션에 outbox 행만 기록하므로
+브로커 지연/장애가 HTTP 응답 경로에 영향을 주지 않습니다.
+
+n8n은 n8n-requests 토픽을 도착 순서대로 처리하므로, 발송 순서와 시점을 여기서 정합니다.
+(utils/generation_scheduler 참고)
+- 새 outbox 행을 id 순으로 읽어 (우선순위 등급, user_id)별 가중 공정 큐에 적재
+- 발송 중인 생성이 전체 GENERATION_MAX_INFLIGHT, 사용자별 GENERATION_MAX_INFLIGHT_PER_USER 미만일 때만 발송
+  → 일괄 등록한 교사의 요청이 다른 사용자의 요청을 막지 않고, Gemini 할당량을 넘겨 실패시키지 않음
+
+동작 (at-least-once):
+1. 공정 큐에서 남은 슬롯만큼 꺼낸 행을 FOR UPDATE SKIP LOCKED로 잠그고, 발송 중 임대를 획득한 행에
+   claimed_until(OUTBOX_CLAIM_TIMEOUT 후)을 기록해 바로 커밋 (relay 여러 개 실행 가능)
+2. 트랜잭션 없이 큐에 적재한 뒤 브로커 ack를 한 번에 대기 (브로커가 느려도 행 잠금/DB 커넥션을 잡지 않음)
+3. 새 트랜잭션에서 ack된 행만 삭제, 실패한 행은 attempts를 증가시키고 선점/임대를 풀어 큐에 되돌림
+   OUTBOX_MAX_ATTEMPTS번 실패한 행은 failed_at을 기록하고 더 이상 발송하지 않음 (NULL로 되돌리면 재발송)
+4. 발송 후 결과 반영 전에 죽으면 claimed_until이 지난 뒤 다시 발송됨
+   (message_id가 같으므로 소비 측에서 중복 식별 가능)
+
+relay마다 공정 큐를 따로 가지므로 relay가 여러 개면 공정성은 relay 단위로 근사되고,
+발송 중 상한은 Redis 임대로 전체가 공유합니다.
+
+실행:
+    python outbox_relay.py
+"""
+
+import asyncio
+import logging
+import time
+from datetime import datetime, timedelta
+
+from sqlalchemy import select, update, delete, or_
+
+from core.config import settings
+from db import models
+from db.database import AsyncSessionLocal, async_engine
+from utils.kafka_manager import kafka_manager
+from utils.generation_scheduler import FairQueue, inflight_limiter, lease_member, NORMAL
+
+logger = logging.getLogger(__name__)
+
+
+def queue_item(row: models.Outbox):
+    """outbox 행 → 공정 큐 항목 (outbox id, user_id, 등급), 사용자 정보가 없던 행은 user_id 0"""
+    return row.id, row.user_id or 0, row.priority or NORMAL
+
+
+def row_lease(row: models.Outbox) -> str:
+    """outbox 행이 요청하는 생성의 임대 식별자"""
+    return lease_member(row.payload.get("chapter_id"), row.payload.get("workflow_type"))
+
+
+async def load_pending(queue: FairQueue, cursor: int) -> int:
+    """
+    cursor 이후에 기록된 outbox 행을 공정 큐에 적재 (잠그지 않고 id, user_id, 등급만 조회)
+
+    Returns:
+        int: 마지막으로 읽은 outbox id (다음 호출의 cursor)
+    """
+    async with AsyncSessionLocal() as db:
+        while len(queue) < settings.OUTBOX_MAX_PENDING:
+            rows = (await db.execute(
+                select(models.Outbox.id, models.Outbox.user_id, models.Outbox.priority)
+                .where(models.Outbox.id > cursor, models.Outbox.failed_at.is_(None))
+                .order_by(models.Outbox.id)
+                .limit(settings.OUTBOX_BATCH_SIZE)
+            )).all()
+            for row in rows:
+                queue.push(*queue_item(row))
+            if rows:
+                cursor = rows[-1].id
+            if len(rows) < settings.OUTBOX_BATCH_SIZE:
+                break
+    return cursor
+
+
+async def relay_batch(queue: FairQueue) -> int:
+    """
+    공정 큐에서 발송 가능한 만큼 꺼내 한 배치 발송
+
+    Returns:
+        int: 발송을 시도한 outbox 행 수 (0이면 비었거나 발송 중 상한에 도달)
+    """
+    if not queue:
+        return 0
+    inflight, user_inflight = await inflight_limiter.counts(queue.user_ids())
+    limit = min(settings.OUTBOX_BATCH_SIZE, settings.GENERATION_MAX_INFLIGHT - inflight)
+    if limit <= 0:
+        return 0
+    user_slots = {
+        user_id: settings.GENERATION_MAX_INFLIGHT_PER_USER - count
+        for user_id, count in user_inflight.items()
+    }
+    picked = queue.pop(limit, user_slots, settings.GENERATION_MAX_INFLIGHT_PER_USER)
+    if not picked:
+        return 0
+
+    # 1) 짧은 트랜잭션으로 발송할 행을 선점하고 바로 커밋 (브로커 ack를 기다리는 동안 잠금/커넥션을 잡지 않음)
+    now = datetime.utcnow()
+    async with AsyncSessionLocal() as db:
+        locked = {
+            row.id: row
+            for row in (await db.scalars(
+                select(models.Outbox)
+                .where(
+                    models.Outbox.id.in_([row_id for row_id, _, _ in picked]),
+                    models.Outbox.failed_at.is_(None),
+                    or_(models.Outbox.claimed_until.is_(None), models.Outbox.claimed_until < now)
+                )
+                .with_for_update(skip_locked=True)
+            )).all()
+        }
+        # 없는 행은 이미 발송되었거나 다른 relay가 발송 중 (남아 있으면 다음 재조회 때 다시 적재)
+        rows = [locked[row_id] for row_id, _, _ in picked if row_id in locked]
+
+        # 다른 relay가 그 사이 슬롯을 가져갔으면 임대를 받지 못한 행은 다음 poll로 미룸
+        acquired = await inflight_limiter.acquire([(row_lease(row), row.user_id or 0) for row in rows])
+        sending = [row for row in rows if row_lease(row) in acquired]
+        queue.requeue([queue_item(row) for row in rows if row_lease(row) not in acquired])
+        if sending:
+            await db.execute(
+                update(models.Outbox)
+                .where(models.Outbox.id.in_([row.id for row in sending]))
+                .values(claimed_until=now + timedelta(seconds=settings.OUTBOX_CLAIM_TIMEOUT))
+            )
+        await db.commit()
+    if not sending:
+        return 0
+
+    # 2) 트랜잭션 밖에서 발송하고 ack를 한 번에 대기
+    futures = [
+        await kafka_manager.publish_async(row.topic, row.message_key, row.payload)
+        for row in sending
+    ]
+    results = await asyncio.gather(*futures, return_exceptions=True)
+
+    acked_ids = []
+    failed = []
+    for row, result in zip(sending, results):
+        if isinstance(result, Exception):
+            failed.append(row)
+            logger.error(f"Outbox 발송 실패 - ID: {row.id}, Key: {row.message_key}, Error: {result}")
+        else:
+            acked_ids.append(row.id)
+    # 이번 실패로 OUTBOX_MAX_ATTEMPTS에 도달한 행은 더 이상 재시도하지 않음
+    abandoned = [row for row in failed if row.attempts + 1 >= settings.OUTBOX_MAX_ATTEMPTS]
+
+    # 3) 짧은 트랜잭션으로 결과 반영 (ack된 행 삭제, 실패한 행은 선점 해제 + attempts 증가)
+    async with AsyncSessionLocal() as db:
+        if acked_ids:
+            await db.execute(delete(models.Outbox).where(models.Outbox.id.in_(acked_ids)))
+        if failed:
+            await db.execute(
+                update(models.Outbox)
+                .where(models.Outbox.id.in_([row.id for row in failed]))
+                .values(attempts=models.Outbox.attempts + 1, claimed_until=None)
+            )
+        if abandoned:
+            await db.execute(
+                update(models.Outbox)
+                .where(models.Outbox.id.in_([row.id for row in abandoned]))
+                .values(failed_at=datetime.utcnow())
+            )
+        await db.commit()
+
+    if failed:
+        await inflight_limiter.release([row_lease(row) for row in failed])
+        queue.requeue([queue_item(row) for row in failed if row not in abandoned])
+    for row in abandoned:
+        logger.error(
+            f"Outbox 발송 포기 ({settings.OUTBOX_MAX_ATTEMPTS}회 실패) - ID: {row.id}, Key: {row.message_key}, "
+            f"Chapter: {row.payload.get('chapter_id')} (failed_at을 NULL로 되돌리면 다시 발송)"
+        )
+
+    logger.info(f"Outbox 발송 - Acked: {len(acked_ids)}, Failed: {len(failed)}, Pending: {len(queue)}")
+    return len(sending)
+
+
+async def run_relay():
+    """outbox polling 루프"""
+    logger.info(
+        f"Outbox relay 시작 - Batch: {settings.OUTBOX_BATCH_SIZE}, "
+        f"Max inflight: {settings.GENERATION_MAX_INFLIGHT} (per user {settings.GENERATION_MAX_INFLIGHT_PER_USER})"
+    )
+    queue = FairQueue()
+    cursor = 0
+    rescan_at = time.monotonic() + settings.OUTBOX_RESCAN_INTERVAL
+    try:
+        while True:
+            try:
+                # 잠겨 있어 건너뛴 행, 대기열이 가득 차 읽지 못한 행을 주기적으로 처음부터 다시 적재
+                # (이미 대기 중인 행은 push()가 무시)
+                if time.monotonic() >= rescan_at:
+                    cursor = 0
+                    rescan_at = time.monotonic() + settings.OUTBOX_RESCAN_INTERVAL
+                cursor = await load_pending(queue, cursor)
+                count = await relay_batch(queue)
+                await inflight_limiter.publish_depths(queue.depths())
+            except Exception as e:
+                logger.error(f"Outbox relay 오류: {e}")
+                count = 0
+            # 가득 찬 배치였으면 바로 다음 배치, 아니면 잠시 대기 (상한에 도달했으면 완료 응답을 기다림)
+            if count < settings.OUTBOX_BATCH_SIZE:
+                await asyncio.sleep(settings.OUTBOX_POLL_INTERVAL)
+    finally:
+        kafka_manager.close_connections()
+        await async_engine.dispose()
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    try:
+        asyncio.run(run_relay())
+    except KeyboardInterrupt:
+        pass
@@ -24,6 +24,7 @@ CREATE TABLE `chapter` (
 	`description`	TEXT	NULL,
 	`order_index`	INT	NULL,
 	`is_active`	BOOLEAN	NULL,
+	`completion_mask`	INT	NOT NULL	DEFAULT 0,
 	`created_at`	DATETIME	NULL,
 	`updated_at`	DATETIME	NULL	DEFAULT CURRENT_TIMESTAMP
 );
@@ -66,6 +67,19 @@ CREATE TABLE `quiz` (
 	`updated_at`	DATETIME	NULL	DEFAULT CURRENT_TIMESTAMP
 );
 
+CREATE TABLE `outbox` (
+	`id`	INT	NOT NULL,
+	`topic`	VARCHAR(255)	NOT NULL,
+	`message_key`	VARCHAR(255)	NOT NULL,
+	`payload`	JSON	NOT NULL,
+	`user_id`	INT	NULL,
+	`priority`	VARCHAR(16)	NOT NULL	DEFAULT 'normal',
+	`attempts`	INT	NOT NULL	DEFAULT 0,
+	`claimed_until`	DATETIME	NULL,
+	`failed_at`	DATETIME	NULL,
+	`created_at`	DATETIME	NULL
+);
+
 ALTER TABLE `member` ADD CONSTRAINT `PK_MEMBER` PRIMARY KEY (
 	`id`
 );
@@ -99,6 +113,16 @@ ALTER TABLE `quiz` ADD CONSTRAINT `PK_QUIZ` PRIMARY KEY (
 	`owner_id`
 );
 
+ALTER TABLE `outbox` ADD CONSTRAINT `PK_OUTBOX` PRIMARY KEY (
+	`id`
+);
+
+CREATE INDEX `ix_chapter_owner_created` ON `chapter` (
+	`owner_id`,
+	`created_at`,
+	`id`
+);
+
 ALTER TABLE `course` ADD CONSTRAINT `FK_member_TO_course_1` FOREIGN KEY (
 	`owner_id`
 )
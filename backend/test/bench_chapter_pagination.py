@@ -0,0 +1,103 @@
+"""
+Chapter list pagination benchmark
+한 사용자가 챕터 N개를 가진 테이블에서 OFFSET과 커서(keyset) 방식의 깊은 페이지 조회 시간을 비교
+
+기본은 임시 SQLite 파일을 사용하며, BENCH_DATABASE_URL을 지정하면 해당 DB(MySQL 등)에 테이블을 만들어 측정합니다.
+(ix_chapter_owner_created 인덱스는 모델 선언으로 함께 생성됨)
+
+실행:
+    python test/bench_chapter_pagination.py [행 수]
+"""
+
+import os
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+
+backend_dir = Path(__file__).parent.parent
+if str(backend_dir) not in sys.path:
+    sys.path.insert(0, str(backend_dir))
+
+from sqlalchemy import create_engine, insert
+from sqlalchemy.orm import sessionmaker
+
+from db import models
+from utils.pagination import keyset_before
+
+PAGE_SIZE = 20
+INSERT_BATCH = 10000
+
+
+def populate(engine, rows: int) -> int:
+    models.Base.metadata.drop_all(bind=engine)
+    models.Base.metadata.create_all(bind=engine)
+    with engine.begin() as conn:
+        conn.execute(insert(models.Member.__table__), [{"email": "bench@example.com", "password": "x"}])
+        owner_id = conn.execute(models.Member.__table__.select()).first().id
+        base = datetime(2020, 1, 1)
+        for start in range(0, rows, INSERT_BATCH):
+            conn.execute(insert(models.Chapter.__table__), [
+                {
+                    "owner_id": owner_id,
+                    "title": f"질문 {i}",
+                    "status": models.StatusEnum.completed,
+                    "completion_mask": 7,
+                    "is_active": True,
+                    "created_at": base + timedelta(seconds=i),
+                }
+                for i in range(start, min(start + INSERT_BATCH, rows))
+            ])
+    return owner_id
+
+
+def base_query(db, owner_id):
+    return (db.query(models.Chapter)
+            .filter(models.Chapter.owner_id == owner_id)
+            .order_by(models.Chapter.created_at.desc(), models.Chapter.id.desc()))
+
+
+def timed(fn, repeat: int = 5) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - started)
+    return best
+
+
+def main(rows: int):
+    url = os.getenv("BENCH_DATABASE_URL")
+    tmpdir = None
+    if url is None:
+        tmpdir = tempfile.TemporaryDirectory()
+        url = f"sqlite:///{tmpdir.name}/bench.db"
+    engine = create_engine(url)
+
+    print(f"Populating {rows} chapters ({engine.dialect.name})...")
+    owner_id = populate(engine, rows)
+    db = sessionmaker(bind=engine)()
+
+    print(f"Page size: {PAGE_SIZE}")
+    for depth in (0, rows // 100, rows // 10, rows // 2, rows - PAGE_SIZE):
+        offset_time = timed(lambda: base_query(db, owner_id).offset(depth).limit(PAGE_SIZE).all())
+
+        # 커서는 직전 페이지의 마지막 항목 (API가 X-Next-Cursor로 돌려주는 값과 동일)
+        if depth:
+            last = base_query(db, owner_id).offset(depth - 1).limit(1).one()
+            after = keyset_before(models.Chapter.created_at, models.Chapter.id, last.created_at, last.id)
+        else:
+            after = True
+        cursor_time = timed(lambda: base_query(db, owner_id).filter(after).limit(PAGE_SIZE).all())
+
+        print(f"  depth {depth:>9}   offset {offset_time * 1000:9.2f} ms   cursor {cursor_time * 1000:7.2f} ms")
+
+    db.close()
+    engine.dispose()
+    if tmpdir is not None:
+        tmpdir.cleanup()
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000)
@@ -0,0 +1,74 @@
+"""
+Login throughput benchmark
+비밀번호 검증을 스레드풀(기존 sync 라우트 방식)과 전용 프로세스 풀에서 실행했을 때
+초당 로그인 처리량과, 그동안 다른 sync 라우트가 스레드를 얻기까지의 지연을 비교
+
+실행:
+    python test/bench_password_hashing.py [동시 로그인 수]
+"""
+
+import asyncio
+import sys
+import time
+from pathlib import Path
+
+backend_dir = Path(__file__).parent.parent
+if str(backend_dir) not in sys.path:
+    sys.path.insert(0, str(backend_dir))
+
+from fastapi.concurrency import run_in_threadpool
+
+from api.v1.auth.router import get_password_hash, verify_password
+from utils.password_hasher import PasswordHasher
+
+PASSWORD = "testpass123"
+
+
+async def probe_threadpool_latency(stop: asyncio.Event, samples: list):
+    """다른 sync 라우트를 흉내 내어 스레드풀 작업 하나가 완료되기까지 걸리는 시간 측정"""
+    while not stop.is_set():
+        started = time.perf_counter()
+        await run_in_threadpool(lambda: None)
+        samples.append(time.perf_counter() - started)
+        await asyncio.sleep(0.01)
+
+
+async def run_logins(verify, hashed: str, concurrency: int):
+    stop = asyncio.Event()
+    samples = []
+    probe = asyncio.create_task(probe_threadpool_latency(stop, samples))
+
+    started = time.perf_counter()
+    results = await asyncio.gather(*(verify(PASSWORD, hashed) for _ in range(concurrency)))
+    elapsed = time.perf_counter() - started
+
+    stop.set()
+    await probe
+    assert all(results)
+
+    samples.sort()
+    p99 = samples[int(len(samples) * 0.99) - 1] if samples else 0.0
+    return concurrency / elapsed, p99
+
+
+async def main(concurrency: int):
+    hashed = get_password_hash(PASSWORD)
+
+    async def verify_in_threadpool(plain, hashed_password):
+        return await run_in_threadpool(verify_password, plain, hashed_password)
+
+    hasher = PasswordHasher()
+    await hasher.verify(PASSWORD, hashed)  # 프로세스 풀 워밍업
+
+    print(f"Concurrent logins: {concurrency}")
+    for name, verify in (("threadpool (inline)", verify_in_threadpool),
+                         ("process pool", hasher.verify)):
+        throughput, p99 = await run_logins(verify, hashed, concurrency)
+        print(f"  {name:<20} {throughput:8.1f} logins/s   other-route threadpool p99: {p99 * 1000:8.1f} ms")
+
+    print(f"  process pool metrics: {hasher.get_metrics()}")
+    hasher.shutdown()
+
+
+if __name__ == "__main__":
+    asyncio.run(main(int(sys.argv[1]) if len(sys.argv) > 1 else 200))
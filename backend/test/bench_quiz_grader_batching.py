@@ -0,0 +1,66 @@
+"""
+QuizGrader micro-batching benchmark
+동시에 재채점을 요청하는 호출자 수를 고정하고 묶음 크기별 처리량(grades/sec)을 비교
+
+- 채점기는 StubQuizGrader (요청 1회 지연 + 답안당 지연으로 LLM 왕복을 흉내)
+- batch size 1 = 답안마다 QuizGrader 요청 1회 (묶지 않은 기존 방식)
+
+실행:
+    python test/bench_quiz_grader_batching.py [호출자 수] [호출자당 답안 수]
+"""
+
+import sys
+import threading
+import time
+from pathlib import Path
+
+backend_dir = Path(__file__).parent.parent
+if str(backend_dir) not in sys.path:
+    sys.path.insert(0, str(backend_dir))
+
+from utils.grading_dispatcher import GradingDispatcher
+from utils.quiz_grader import StubQuizGrader
+
+LATENCY = 0.2  # 요청 1회 (LLM 왕복)
+PER_ITEM = 0.002  # 답안 1개당 추가 생성 시간
+MAX_CONCURRENCY = 4
+BATCH_SIZES = (1, 4, 16, 64)
+
+
+def run(batch_size: int, callers: int, per_caller: int):
+    grader = StubQuizGrader(latency=LATENCY, per_item=PER_ITEM)
+    dispatcher = GradingDispatcher(
+        grader, max_batch_size=batch_size, max_wait=0.02, max_concurrency=MAX_CONCURRENCY, timeout=600
+    )
+    item = {"quiz": "불변 자료형은?", "answer": "튜풀", "correct_answer": "튜플"}
+
+    def caller():
+        for _ in range(per_caller):
+            dispatcher.grade([item])
+
+    threads = [threading.Thread(target=caller) for _ in range(callers)]
+    start = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    elapsed = time.perf_counter() - start
+    dispatcher.stop()
+
+    total = callers * per_caller
+    print(f"  batch size {batch_size:>3}   {total / elapsed:8.1f} grades/sec   "
+          f"requests {grader.stats['requests']:>4}   elapsed {elapsed:6.2f}s")
+
+
+def main(callers: int, per_caller: int):
+    print(f"callers: {callers}, answers per caller: {per_caller}, "
+          f"latency: {LATENCY}s + {PER_ITEM}s/answer, concurrency: {MAX_CONCURRENCY}")
+    for batch_size in BATCH_SIZES:
+        run(batch_size, callers, per_caller)
+
+
+if __name__ == "__main__":
+    main(
+        int(sys.argv[1]) if len(sys.argv) > 1 else 64,
+        int(sys.argv[2]) if len(sys.argv) > 2 else 5
+    )
@@ -0,0 +1,112 @@
+"""
+JSON serialization benchmark
+엔드포인트별 응답 직렬화 비용을 기존 경로와 새 경로로 비교
+
+- before: response_model 검증 + jsonable_encoder + JSONResponse(json.dumps) (FastAPI 기본 경로)
+- after:  미리 만든 TypeAdapter.dump_json / orjson (FastJSONResponse)
+- learning page 캐시 히트는 before가 캐시 JSON 파싱 후 재직렬화, after가 캐시 bytes 그대로 반환
+
+실행:
+    python test/bench_serialization.py [반복 횟수]
+"""
+
+import sys
+import timeit
+from datetime import datetime
+from pathlib import Path
+
+backend_dir = Path(__file__).parent.parent
+if str(backend_dir) not in sys.path:
+    sys.path.insert(0, str(backend_dir))
+
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
+from pydantic import TypeAdapter
+
+from api.v1.schemas import (
+    SingleLearningPage, ConceptDTO, ExerciseDTO, QuizDTO, ChapterListItem,
+    CourseDetailResponse, CourseDetail,
+    single_learning_page_adapter, chapter_list_adapter, course_detail_response_adapter
+)
+from core.responses import FastJSONResponse, ORJSON_AVAILABLE, dumps, adapter_response, raw_json_response
+
+
+# FastAPI는 라우트 등록 시 response_model 필드를 한 번 만들고, 요청마다 검증 + jsonable_encoder를 수행
+RESPONSE_FIELDS = {
+    SingleLearningPage: TypeAdapter(SingleLearningPage),
+    ChapterListItem: TypeAdapter(list[ChapterListItem]),
+    CourseDetailResponse: TypeAdapter(CourseDetailResponse),
+}
+
+
+def default_path(model_type, value):
+    """FastAPI 기본: response_model로 검증 → jsonable_encoder → json.dumps"""
+    validated = RESPONSE_FIELDS[model_type].validate_python(value, from_attributes=True)
+    return JSONResponse(jsonable_encoder(validated)).body
+
+
+def sample_learning_page() -> SingleLearningPage:
+    return SingleLearningPage(
+        chapter_id=1,
+        title="파이썬 리스트와 튜플 차이가 뭐예요?",
+        description="자세히 알려주세요",
+        status="completed",
+        concept=ConceptDTO(id=1, title="리스트와 튜플", content="리스트는 가변, 튜플은 불변입니다. " * 200, is_complete=True),
+        exercise=ExerciseDTO(id=1, question="튜플을 수정하면 어떻게 되나요?", is_complete=True),
+        quiz=QuizDTO(id=1, question="다음 중 불변 자료형은?", options=["list", "tuple", "dict", "set"], type="multiple")
+    )
+
+
+def sample_chapters(count: int = 20):
+    return [
+        ChapterListItem(id=i, title=f"질문 {i}", description=None, status="completed",
+                        is_active=True, created_at=datetime(2024, 1, 1, 12, i % 60))
+        for i in range(count)
+    ]
+
+
+def sample_course() -> CourseDetailResponse:
+    return CourseDetailResponse(course=CourseDetail(
+        id=1, title="파이썬 기초", description="변수부터 클래스까지", difficulty="easy",
+        owner_id=1, created_at=datetime(2024, 1, 1), updated_at=datetime(2024, 1, 2)
+    ))
+
+
+def report(name: str, before, after, number: int):
+    before_us = min(timeit.repeat(before, number=number, repeat=3)) / number * 1e6
+    after_us = min(timeit.repeat(after, number=number, repeat=3)) / number * 1e6
+    print(f"  {name:<28} before {before_us:8.1f} us   after {after_us:8.1f} us   x{before_us / after_us:5.1f}")
+
+
+def main(number: int):
+    page = sample_learning_page()
+    cached = single_learning_page_adapter.dump_json(page)
+    chapters = sample_chapters()
+    course = sample_course()
+    course_rows = [jsonable_encoder(course.course) for _ in range(1000)]
+
+    print(f"orjson available: {ORJSON_AVAILABLE}, iterations: {number}")
+    report("GET learning (miss)",
+           lambda: default_path(SingleLearningPage, page),
+           lambda: adapter_response(single_learning_page_adapter, page).body, number)
+    report("GET learning (cache hit)",
+           lambda: default_path(SingleLearningPage, SingleLearningPage.model_validate_json(cached)),
+           lambda: raw_json_response(cached).body, number)
+    report("GET chapter list (20)",
+           lambda: default_path(ChapterListItem, chapters),
+           lambda: adapter_response(
+               chapter_list_adapter, chapter_list_adapter.validate_python(chapters, from_attributes=True)
+           ).body, number)
+    report("GET course detail",
+           lambda: default_path(CourseDetailResponse, course),
+           lambda: adapter_response(course_detail_response_adapter, course).body, number)
+    report("dict route (1000 courses)",
+           lambda: JSONResponse(course_rows).body,
+           lambda: FastJSONResponse(course_rows).body, max(1, number // 100))
+    report("course stream row",
+           lambda: JSONResponse(course_rows[0]).body,
+           lambda: dumps(course_rows[0]), number)
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 2000)
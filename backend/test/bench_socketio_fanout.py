@@ -0,0 +1,111 @@
+"""
+Socket.IO fan-out benchmark
+Redis 클라이언트 매니저로 N개 워커 프로세스에 이벤트를 fan-out할 때의 처리량 측정
+
+각 워커 프로세스는 AsyncServer(redis 매니저)를 띄우고 클라이언트 C개를 같은 챕터 룸에 참여시킨 뒤,
+Engine.IO 전송을 카운터로 바꿔 실제 소켓 I/O 없이 전달 건수만 셉니다.
+메인 프로세스는 write-only 매니저로 이벤트 E개를 발행하고, 모든 워커가 E × C건을 받을 때까지의 시간을 잽니다.
+
+실행 (로컬 Redis 필요, SOCKETIO_MESSAGE_QUEUE):
+    python test/bench_socketio_fanout.py [워커 수] [워커당 클라이언트 수] [이벤트 수]
+"""
+
+import asyncio
+import multiprocessing
+import sys
+import time
+import uuid
+from pathlib import Path
+
+backend_dir = Path(__file__).parent.parent
+if str(backend_dir) not in sys.path:
+    sys.path.insert(0, str(backend_dir))
+
+import socketio
+
+from core.socketio_manager import create_client_manager
+
+ROOM = "chapter_bench"
+
+
+def run_worker(channel: str, clients: int, events: int, ready, results):
+    """워커 프로세스: 룸 멤버 C개를 두고 E × C건을 받을 때까지 대기"""
+
+    async def main():
+        server = socketio.AsyncServer(async_mode='asgi',
+                                      client_manager=create_client_manager("redis", channel=channel))
+        expected = clients * events
+        received = 0
+        done = asyncio.Event()
+
+        async def count(eio_sid, _):
+            nonlocal received
+            received += 1
+            if received >= expected:
+                done.set()
+
+        server.eio.send = count
+        server.eio.send_packet = count
+        server.manager.set_server(server)
+        server.manager.initialize()
+
+        for i in range(clients):
+            sid = await server.manager.connect(f"eio-{i}", "/")
+            await server.manager.enter_room(sid, "/", ROOM)
+
+        await asyncio.sleep(0.5)  # pub/sub 구독 대기
+        ready.put(True)
+        try:
+            await asyncio.wait_for(done.wait(), timeout=60)
+        except asyncio.TimeoutError:
+            pass
+        results.put((time.perf_counter(), received))
+        await server.shutdown()
+
+    asyncio.run(main())
+
+
+async def emit_all(channel: str, events: int):
+    manager = create_client_manager("redis", channel=channel, write_only=True)
+    for i in range(events):
+        await manager.emit('progress_update', {'chapter_id': 0, 'progress': i % 100}, namespace='/', room=ROOM)
+
+
+def bench(workers: int, clients: int, events: int):
+    channel = f"socketio-bench-{uuid.uuid4().hex}"
+    ctx = multiprocessing.get_context("spawn")
+    ready, results = ctx.Queue(), ctx.Queue()
+    procs = [ctx.Process(target=run_worker, args=(channel, clients, events, ready, results))
+             for _ in range(workers)]
+    for proc in procs:
+        proc.start()
+    for _ in procs:
+        ready.get()
+
+    started = time.perf_counter()
+    asyncio.run(emit_all(channel, events))
+    finished = [results.get() for _ in procs]
+    for proc in procs:
+        proc.join()
+
+    # perf_counter는 시스템 전역 단조 시계이므로 프로세스 간 비교 가능 (Linux/macOS)
+    elapsed = max(t for t, _ in finished) - started
+    delivered = sum(n for _, n in finished)
+    return elapsed, delivered
+
+
+def main():
+    max_workers = int(sys.argv[1]) if len(sys.argv) > 1 else 4
+    clients = int(sys.argv[2]) if len(sys.argv) > 2 else 50
+    events = int(sys.argv[3]) if len(sys.argv) > 3 else 1000
+
+    print(f"Clients per worker: {clients}, events: {events}")
+    for workers in range(1, max_workers + 1):
+        elapsed, delivered = bench(workers, clients, events)
+        expected = workers * clients * events
+        print(f"  workers={workers:<3} {events / elapsed:10.1f} emits/s   "
+              f"{delivered / elapsed:12.1f} deliveries/s   delivered {delivered}/{expected}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,143 @@
+"""
+pytest 공통 설정
+backend 디렉토리를 import 경로에 추가 (api/__init__.py와 동일한 방식)
+
+공통 fixture:
+    engine / session_factory              → 동기 라우트용 in-memory SQLite (테이블 생성 완료)
+    async_engine / async_session_factory  → async 라우트용 aiosqlite
+                                            (기본 in-memory, 트랜잭션끼리 경합시키려면 "file"로 indirect 파라미터화)
+    make_client                           → 라우터를 올리고 DB/인증 의존성을 교체한 TestClient 생성
+
+마커:
+    @pytest.mark.redis  → 로컬 Redis(SOCKETIO_MESSAGE_QUEUE)가 필요한 테스트 (없으면 건너뜀)
+"""
+
+import asyncio
+import sys
+from functools import lru_cache
+from pathlib import Path
+
+import pytest
+import redis.asyncio as aioredis
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine
+from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+backend_dir = Path(__file__).parent.parent
+if str(backend_dir) not in sys.path:
+    sys.path.insert(0, str(backend_dir))
+
+from core.config import settings  # noqa: E402 (backend 경로 추가 이후)
+from db import models  # noqa: E402
+from db.database import get_db, get_async_db  # noqa: E402
+from utils.auth_middleware import require_auth  # noqa: E402
+
+
+def pytest_configure(config):
+    config.addinivalue_line("markers", "redis: 로컬 Redis(SOCKETIO_MESSAGE_QUEUE)가 필요한 테스트 (없으면 건너뜀)")
+
+
+@lru_cache(maxsize=1)
+def redis_available() -> bool:
+    """로컬 Redis(SOCKETIO_MESSAGE_QUEUE) 연결 가능 여부 (세션당 한 번만 확인)"""
+    async def ping():
+        client = aioredis.Redis.from_url(settings.SOCKETIO_MESSAGE_QUEUE, socket_connect_timeout=0.5)
+        try:
+            return await client.ping()
+        except Exception:
+            return False
+        finally:
+            await client.aclose()
+    return asyncio.run(ping())
+
+
+def pytest_runtest_setup(item):
+    if item.get_closest_marker("redis") and not redis_available():
+        pytest.skip("local Redis not available")
+
+
+@pytest.fixture
+def engine():
+    """동기 라우트용 in-memory SQLite 엔진"""
+    engine = create_engine(
+        "sqlite://",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool
+    )
+    models.Base.metadata.create_all(bind=engine)
+    yield engine
+    engine.dispose()
+
+
+@pytest.fixture
+def session_factory(engine):
+    return sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+
+@pytest.fixture
+def async_engine(request):
+    """
+    async 라우트용 aiosqlite 엔진
+
+    기본은 연결 하나를 공유하는 in-memory DB이고,
+    @pytest.mark.parametrize("async_engine", ["file"], indirect=True)로 지정하면
+    연결마다 별도 트랜잭션을 갖는 임시 파일 DB를 사용합니다 (쓰기 트랜잭션은 파일 잠금으로 직렬화).
+    """
+    if getattr(request, "param", "memory") == "file":
+        path = request.getfixturevalue("tmp_path") / "test.db"
+        engine = create_async_engine(f"sqlite+aiosqlite:///{path}", connect_args={"timeout": 30})
+    else:
+        engine = create_async_engine("sqlite+aiosqlite://", poolclass=StaticPool)
+
+    async def create_tables():
+        async with engine.begin() as conn:
+            await conn.run_sync(models.Base.metadata.create_all)
+
+    asyncio.run(create_tables())
+    yield engine
+    asyncio.run(engine.dispose())
+
+
+@pytest.fixture
+def async_session_factory(async_engine):
+    return async_sessionmaker(async_engine, expire_on_commit=False)
+
+
+@pytest.fixture
+def make_client():
+    """
+    TestClient 생성 함수
+
+    Args (생성 함수):
+        *routers: 올릴 APIRouter
+        db: get_db를 대신할 sessionmaker
+        async_db: get_async_db를 대신할 async_sessionmaker
+        user_id: require_auth가 돌려줄 사용자
+    """
+    def make(*routers, db=None, async_db=None, user_id: int = 1) -> TestClient:
+        app = FastAPI()
+        for router in routers:
+            app.include_router(router)
+
+        if db is not None:
+            def override_get_db():
+                session = db()
+                try:
+                    yield session
+                finally:
+                    session.close()
+            app.dependency_overrides[get_db] = override_get_db
+
+        if async_db is not None:
+            async def override_get_async_db():
+                async with async_db() as session:
+                    yield session
+            app.dependency_overrides[get_async_db] = override_get_async_db
+
+        app.dependency_overrides[require_auth] = lambda: {"user_id": user_id, "email": "test@example.com"}
+        return TestClient(app)
+
+    return make
@@ -0,0 +1,115 @@
+"""
+Answer grader tests
+로컬 채점 엔진의 판정/신뢰도와, 확신하지 못한 답안만 QuizGrader로 넘기는지 확인
+"""
+
+import json
+
+import httpx
+import pytest
+
+from api.v1.quizzes import router as quizzes_router
+from utils.answer_grader import decompose_jamo, grade_answer, normalize_short_answer, parse_number
+from utils.quiz_grader import quiz_grader, parse_score
+
+
+def short(answer):
+    return {"answer": answer, "type": "short", "explanation": None, "question": "문제"}
+
+
+def test_normalization():
+    assert decompose_jamo("튜플") == "ㅌㅠㅍㅡㄹ"
+    assert normalize_short_answer(" 튜플 입니다. ") == "튜플"
+    assert normalize_short_answer("LEN()") == "len"
+    assert parse_number("1,000개") == (1000.0, "개")
+    assert parse_number("3.14") == (3.14, "")
+
+
+@pytest.mark.parametrize("key, answer, expected", [
+    (short("튜플"), "튜플이요", (True, 1.0)),
+    (short("3.14"), "3.140", (True, 1.0)),
+    (short("10개"), "11개", (False, 1.0)),
+    (short("continue"), "break", (False, 1.0)),
+    ({"answer": "o", "type": "boolean"}, "맞습니다", (True, 1.0)),
+    ({"answer": "o", "type": "boolean"}, "X", (False, 1.0)),
+    ({"answer": "tuple", "type": "multiple"}, "list", (False, 1.0)),
+    ({"answer": "tuple", "type": "multiple"}, " Tuple ", (True, 1.0)),
+])
+def test_confident_local_verdicts(key, answer, expected):
+    assert grade_answer(key, answer) == expected
+
+
+@pytest.mark.parametrize("key, answer", [
+    (short("1.5"), "15"),
+    (short("3.14"), "314"),
+    (short("python 3.8"), "python38"),
+    ({"answer": "1.5", "type": "multiple"}, "15"),
+    ({"answer": "3.14", "type": "multiple"}, "314"),
+    ({"answer": "튜플", "type": "multiple"}, "튜플."),
+])
+def test_punctuation_inside_numbers_is_significant(key, answer):
+    assert grade_answer(key, answer) == (False, 1.0)
+
+
+def test_typo_is_accepted_and_ambiguous_answer_has_low_confidence():
+    is_correct, confidence = grade_answer(short("객체지향 프로그래밍"), "객체 지향 프로그레밍")
+    assert is_correct and confidence >= 0.85
+
+    for answer in ("튜풀", "tuple"):
+        assert grade_answer(short("튜플"), answer)[1] < 0.8
+    assert grade_answer({"answer": "o", "type": "boolean"}, "잘 모르겠어요")[1] == 0.0
+
+
+def test_parse_score():
+    assert parse_score(80) == 80.0
+    assert parse_score("75%") == 75.0
+    assert parse_score("correct") == 100.0
+    assert parse_score("n/a") is None
+
+
+def test_only_low_confidence_answers_are_escalated(monkeypatch):
+    requests = []
+
+    def fake_grade(items):
+        requests.append(items)
+        return [90.0 for _ in items]
+
+    monkeypatch.setattr(quiz_grader, "url", "http://n8n/webhook/grade1")
+    monkeypatch.setattr(quiz_grader, "grade", fake_grade)
+
+    results = quizzes_router.grade([
+        (short("튜플"), "튜플"),
+        (short("튜플"), "튜풀"),
+        (short("튜플"), "리스트"),
+    ])
+
+    assert [r.graded_by for r in results] == ["local", "quiz_grader", "local"]
+    assert [r.is_correct for r in results] == [True, True, False]
+    assert results[1].score == 90
+    assert requests == [[{"quiz": "문제", "answer": "튜풀", "correct_answer": "튜플"}]]
+
+
+def test_local_verdict_when_quiz_grader_disabled(monkeypatch):
+    monkeypatch.setattr(quiz_grader, "url", "")
+
+    result = quizzes_router.grade([(short("튜플"), "튜풀")])[0]
+
+    assert result.graded_by == "local"
+    assert result.is_correct is True
+    assert result.confidence == 0.5
+
+
+def test_quiz_grader_client_matches_scores_by_id(monkeypatch):
+    def handler(request):
+        contents = json.loads(request.content)["output"]["contents"]
+        return httpx.Response(200, json={"scores": [
+            {"id": item["id"], "score": "100" if item["answer"] == "튜풀" else 0} for item in reversed(contents)
+        ]})
+
+    monkeypatch.setattr(quiz_grader, "url", "http://n8n/webhook/grade1")
+    monkeypatch.setattr(quiz_grader, "_client", httpx.Client(transport=httpx.MockTransport(handler)))
+
+    assert quiz_grader.grade([
+        {"quiz": "문제", "answer": "튜풀", "correct_answer": "튜플"},
+        {"quiz": "문제", "answer": "딕셔너리", "correct_answer": "튜플"},
+    ]) == [100.0, 0.0]
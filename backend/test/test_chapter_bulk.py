@@ -0,0 +1,85 @@
+"""
+Chapter bulk creation tests
+질문 목록이 테이블별 여러 행 INSERT 몇 번으로 등록되고, 입력 순서대로 id가 돌아오는지 확인 (in-memory SQLite)
+"""
+
+import asyncio
+
+import pytest
+from sqlalchemy import event, select, func
+from sqlalchemy.ext.asyncio import async_sessionmaker
+
+from api.v1.chapters import router as chapters_router
+from core.config import settings
+from db import models
+
+QUESTIONS = [{"title": f"질문 {i}", "description": ""} for i in range(30)]
+
+
+@pytest.fixture
+def client(make_client, async_session_factory):
+    async def add_member():
+        async with async_session_factory() as db:
+            db.add(models.Member(email="test@example.com", password="hashed"))
+            await db.commit()
+    asyncio.run(add_member())
+    return make_client(chapters_router.router, async_db=async_session_factory)
+
+
+def count_rows(async_engine, model) -> int:
+    async def count():
+        async with async_sessionmaker(async_engine)() as db:
+            return await db.scalar(select(func.count()).select_from(model))
+    return asyncio.run(count())
+
+
+def load_titles(async_engine, chapter_ids):
+    async def load():
+        async with async_sessionmaker(async_engine)() as db:
+            return dict((await db.execute(
+                select(models.Chapter.id, models.Chapter.title).where(models.Chapter.id.in_(chapter_ids))
+            )).all())
+    return asyncio.run(load())
+
+
+def check_created(async_engine, chapters):
+    assert len(chapters) == len(QUESTIONS)
+    titles = load_titles(async_engine, [c["chapter_id"] for c in chapters])
+    assert [titles[c["chapter_id"]] for c in chapters] == [q["title"] for q in QUESTIONS]
+    for model in (models.Chapter, models.Concept, models.Exercise, models.Quiz):
+        assert count_rows(async_engine, model) == len(QUESTIONS)
+    assert count_rows(async_engine, models.Outbox) == len(QUESTIONS) * 3
+
+
+def test_bulk_create_uses_multi_row_inserts(async_engine, client):
+    inserts = []
+
+    @event.listens_for(async_engine.sync_engine, "before_cursor_execute")
+    def _count(conn, cursor, statement, parameters, context, executemany):
+        if statement.lstrip().upper().startswith("INSERT"):
+            inserts.append(statement)
+
+    response = client.post("/v1/chapter/bulk", json={"owner_id": 1, "questions": QUESTIONS})
+
+    assert response.status_code == 200
+    chapters = response.json()["chapters"]
+    assert all(c["status"] == "pending" for c in chapters)
+    assert len(inserts) == 5  # chapter, concept, exercise, quiz, outbox
+    check_created(async_engine, chapters)
+
+
+def test_bulk_create_without_returning_falls_back_when_ids_are_not_consecutive(async_engine, client, monkeypatch):
+    # SQLite의 lastrowid는 여러 행 INSERT의 마지막 id이므로 MySQL 경로의 검증이 실패 → 행마다 INSERT
+    monkeypatch.setattr(async_engine.sync_engine.dialect, "insert_returning", False)
+
+    response = client.post("/v1/chapter/bulk", json={"owner_id": 1, "questions": QUESTIONS})
+
+    assert response.status_code == 200
+    check_created(async_engine, response.json()["chapters"])
+
+
+def test_bulk_create_limits(client, monkeypatch):
+    monkeypatch.setattr(settings, "CHAPTER_BULK_MAX_SIZE", 10)
+
+    assert client.post("/v1/chapter/bulk", json={"owner_id": 1, "questions": []}).status_code == 400
+    assert client.post("/v1/chapter/bulk", json={"owner_id": 1, "questions": QUESTIONS}).status_code == 400
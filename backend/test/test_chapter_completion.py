@@ -0,0 +1,63 @@
+"""
+Chapter completion tests
+같은 챕터의 리소스 완료 webhook이 동시에(각자 트랜잭션으로) 도착해도
+pending → completed 전환이 정확히 한 번만 일어나는지 확인 (파일 SQLite, 쓰기 트랜잭션이 직렬화됨)
+"""
+
+import asyncio
+import itertools
+
+import pytest
+from sqlalchemy import select
+
+from api.v1.chapters.router import mark_resource_completed
+from db import models
+
+CHAPTERS = 5
+
+
+@pytest.fixture
+def pending_chapters(async_session_factory):
+    async def setup():
+        async with async_session_factory() as db:
+            db.add(models.Member(email="test@example.com", password="hashed"))
+            db.add_all([
+                models.Chapter(id=chapter_id, owner_id=1, title=f"질문 {chapter_id}",
+                               status=models.StatusEnum.pending, completion_mask=0)
+                for chapter_id in range(1, CHAPTERS + 1)
+            ])
+            await db.commit()
+
+    asyncio.run(setup())
+
+
+@pytest.mark.parametrize("async_engine", ["file"], indirect=True)
+def test_concurrent_webhooks_complete_chapter_exactly_once(async_session_factory, pending_chapters):
+    # 재전송까지 섞어 챕터마다 리소스별 webhook 2번씩
+    calls = [
+        (chapter_id, bit)
+        for chapter_id, bit, _ in itertools.product(
+            range(1, CHAPTERS + 1),
+            [models.CompletionBit.concept, models.CompletionBit.exercise, models.CompletionBit.quiz],
+            range(2)
+        )
+    ]
+
+    async def webhook(chapter_id, bit):
+        async with async_session_factory() as db:
+            completed = await mark_resource_completed(chapter_id, bit, db)
+            await db.commit()
+            return chapter_id, completed
+
+    async def scenario():
+        results = await asyncio.gather(*(webhook(chapter_id, bit) for chapter_id, bit in calls))
+        async with async_session_factory() as db:
+            chapters = (await db.scalars(select(models.Chapter))).all()
+        return results, chapters
+
+    results, chapters = asyncio.run(scenario())
+
+    completions = [chapter_id for chapter_id, completed in results if completed]
+    assert sorted(completions) == list(range(1, CHAPTERS + 1))
+    assert all(chapter.status == models.StatusEnum.completed for chapter in chapters)
+    assert all(chapter.completion_mask == int(models.CompletionBit.all) for chapter in chapters)
@@ -0,0 +1,82 @@
+"""
+Chapter list pagination tests
+커서 페이지네이션이 OFFSET과 같은 순서를 빠짐없이 반환하는지 확인 (in-memory SQLite)
+"""
+
+from datetime import datetime, timedelta
+
+import pytest
+from sqlalchemy.dialects import mysql
+
+from api.v1.chapters import router as chapters_router
+from db import models
+from utils.pagination import keyset_before
+
+
+@pytest.fixture
+def owner_id(session_factory):
+    db = session_factory()
+    member = models.Member(email="test@example.com", password="hashed")
+    db.add(member)
+    db.flush()
+    base = datetime(2024, 1, 1)
+    # created_at이 같은 챕터가 섞여 있어도 id로 순서가 결정되어야 함
+    db.add_all([
+        models.Chapter(owner_id=member.id, title=f"질문 {i}", created_at=base + timedelta(minutes=i // 2))
+        for i in range(7)
+    ])
+    db.commit()
+    owner_id = member.id
+    db.close()
+    return owner_id
+
+
+@pytest.fixture
+def client(make_client, session_factory):
+    return make_client(chapters_router.router, db=session_factory)
+
+
+def test_cursor_pages_match_offset_order(client, owner_id):
+    expected = [c["id"] for c in client.get(f"/v1/chapter/?owner_id={owner_id}&limit=100").json()]
+
+    seen = []
+    cursor = None
+    while True:
+        url = f"/v1/chapter/?owner_id={owner_id}&limit=3"
+        response = client.get(url + (f"&cursor={cursor}" if cursor else ""))
+        assert response.status_code == 200
+        seen += [c["id"] for c in response.json()]
+        cursor = response.headers.get("X-Next-Cursor")
+        if cursor is None:
+            break
+
+    assert seen == expected
+    assert len(seen) == 7
+
+
+def test_skip_still_supported(client, owner_id):
+    first_page = client.get(f"/v1/chapter/?owner_id={owner_id}&limit=2").json()
+    second_page = client.get(f"/v1/chapter/?owner_id={owner_id}&limit=2&skip=2").json()
+    assert [c["id"] for c in first_page + second_page] == \
+        [c["id"] for c in client.get(f"/v1/chapter/?owner_id={owner_id}&limit=4").json()]
+
+
+def test_zero_limit_returns_empty_page(client, owner_id):
+    response = client.get(f"/v1/chapter/?owner_id={owner_id}&limit=0")
+
+    assert response.status_code == 200
+    assert response.json() == []
+    assert "X-Next-Cursor" not in response.headers
+
+
+def test_invalid_cursor(client):
+    response = client.get("/v1/chapter/?cursor=not-a-cursor")
+    assert response.status_code == 400
+
+
+def test_keyset_condition_is_expanded_for_mysql():
+    condition = keyset_before(models.Chapter.created_at, models.Chapter.id, datetime(2024, 1, 1), 3)
+
+    # 행 값 비교 대신 인덱스 범위로 쓸 수 있는 OR 조건
+    assert str(condition.compile(dialect=mysql.dialect())) == \
+        "chapter.created_at < %s OR chapter.created_at = %s AND chapter.id < %s"
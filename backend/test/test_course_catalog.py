@@ -0,0 +1,64 @@
+"""
+Course catalog streaming tests
+강의 목록이 JSON 배열/NDJSON으로 스트리밍되고 필터가 적용되는지 확인 (in-memory SQLite)
+"""
+
+import json
+
+import pytest
+
+from api.v1.courses import router as courses_router
+from core.config import settings
+from db import models
+
+
+@pytest.fixture
+def client(make_client, session_factory, monkeypatch):
+    db = session_factory()
+    members = [models.Member(email=f"owner{i}@example.com", password="hashed") for i in range(2)]
+    db.add_all(members)
+    db.flush()
+    difficulties = list(models.DifficultyEnum)
+    db.add_all([
+        models.Course(title=f"강의 {i}", owner_id=members[i % 2].id, difficulty=difficulties[i % 3])
+        for i in range(12)
+    ])
+    db.commit()
+    db.close()
+
+    # 여러 청크로 나뉘어 전송되도록 배치 크기를 줄임
+    monkeypatch.setattr(settings, "COURSE_STREAM_BATCH_SIZE", 5)
+    monkeypatch.setattr(courses_router, "SessionLocal", session_factory)
+    return make_client(courses_router.router, db=session_factory)
+
+
+def test_default_response_is_json_array(client):
+    response = client.get("/v1/course/")
+    assert response.status_code == 200
+    courses = response.json()
+    assert [c["title"] for c in courses] == [f"강의 {i}" for i in range(12)]
+    assert courses[0]["difficulty"] == "easy"
+
+
+def test_ndjson_with_filters(client):
+    response = client.get(
+        "/v1/course/?difficulty=hard&owner_id=2",
+        headers={"Accept": "application/x-ndjson"}
+    )
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("application/x-ndjson")
+    courses = [json.loads(line) for line in response.text.splitlines()]
+    # i % 3 == 2 (hard) 이고 i % 2 == 1 (owner 2)
+    assert [c["title"] for c in courses] == ["강의 5", "강의 11"]
+
+
+def test_empty_catalog(client):
+    assert client.get("/v1/course/?owner_id=999").json() == []
+
+
+def test_course_detail_has_no_orm_state(client):
+    response = client.get("/v1/course/1")
+    assert response.status_code == 200
+    course = response.json()["course"]
+    assert course["title"] == "강의 0"
+    assert "_sa_instance_state" not in course
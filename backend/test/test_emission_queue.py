@@ -0,0 +1,72 @@
+"""
+Emission queue tests
+챕터별 상태 이벤트가 chapter_status 프레임 하나로 묶이고, 빈 룸은 건너뛰는지 확인
+"""
+
+import asyncio
+
+import pytest
+
+from utils import emission_queue as emission_queue_module
+from utils.emission_queue import EmissionQueue
+
+
+@pytest.fixture
+def sent(monkeypatch):
+    sent = []
+
+    async def emit(event, data, room=None):
+        sent.append((event, data, room))
+
+    async def get_room_sizes(rooms):
+        # chapter_2 룸에는 아무도 없음
+        return {room: 0 if room == "chapter_2" else 1 for room in rooms}
+
+    monkeypatch.setattr(emission_queue_module.sio, "emit", emit)
+    monkeypatch.setattr(emission_queue_module, "get_room_sizes", get_room_sizes)
+    return sent
+
+
+def test_events_are_coalesced_per_chapter(sent):
+    async def scenario():
+        queue = EmissionQueue(maxsize=10, flush_interval=0.01)
+        queue.start()
+        queue.enqueue(1, "chapter_processing_started", {"status": "processing_started"})
+        queue.enqueue(1, "concept_processing", {"status": "processing"})
+        queue.enqueue(2, "chapter_processing_started", {"status": "processing_started"})
+        await asyncio.sleep(0.1)
+        await queue.stop()
+        return queue.stats
+
+    stats = asyncio.run(scenario())
+    assert sent == [(
+        "chapter_status",
+        {
+            "chapter_id": 1,
+            "status": "processing",
+            "events": [
+                {"event": "chapter_processing_started", "status": "processing_started"},
+                {"event": "concept_processing", "status": "processing"},
+            ],
+        },
+        "chapter_1",
+    )]
+    assert stats["coalesced"] == 1
+    assert stats["skipped_empty"] == 1
+
+
+def test_queue_is_bounded(sent):
+    async def scenario():
+        queue = EmissionQueue(maxsize=1, flush_interval=0.01)
+        accepted = [
+            queue.enqueue(1, "a", {}),
+            queue.enqueue(1, "b", {}),  # 이미 대기 중인 챕터는 상한과 무관하게 합쳐짐
+            queue.enqueue(3, "a", {}),
+        ]
+        await queue.stop()  # 태스크 없이도 남은 이벤트 발송
+        return accepted, queue.stats
+
+    accepted, stats = asyncio.run(scenario())
+    assert accepted == [True, True, False]
+    assert stats["dropped"] == 1
+    assert [frame["chapter_id"] for _, frame, _ in sent] == [1]
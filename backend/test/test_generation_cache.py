@@ -0,0 +1,80 @@
+"""
+Generation cache tests
+같은 질문이면 같은 키가 되고, 캐시 히트 시 AI 생성 요청 없이 완료된 챕터가 만들어지는지 확인 (in-memory SQLite)
+"""
+
+import asyncio
+
+import pytest
+from sqlalchemy import select, func
+
+from api.v1.chapters import router as chapters_router
+from db import models
+from utils.generation_cache import generation_cache, question_digest
+
+GENERATION = {
+    "concept": {"title": "리스트와 튜플", "content": "리스트는 가변, 튜플은 불변"},
+    "exercise": {"title": "튜플을 수정해 보세요", "contents": "TypeError가 발생합니다"},
+    "quiz": {
+        "question": "불변 자료형은?",
+        "options": ["list", "tuple"],
+        "correct_answer": "tuple",
+        "explanation": "튜플은 불변",
+        "type": "multiple"
+    }
+}
+
+
+def test_question_digest_ignores_formatting():
+    assert question_digest("파이썬 리스트와 튜플 차이가 뭐예요?", None) == \
+        question_digest("  파이썬  리스트와 튜플 차이가 뭐예요  ", "")
+    assert question_digest("What is a Tuple?", None) == question_digest("what is a tuple", None)
+    assert question_digest("리스트", None) != question_digest("튜플", None)
+
+
+@pytest.fixture
+def client(make_client, async_session_factory):
+    async def add_member():
+        async with async_session_factory() as db:
+            db.add(models.Member(email="test@example.com", password="hashed"))
+            await db.commit()
+    asyncio.run(add_member())
+    return make_client(chapters_router.router, async_db=async_session_factory)
+
+
+def count_outbox(async_session_factory) -> int:
+    async def count():
+        async with async_session_factory() as db:
+            return await db.scalar(select(func.count()).select_from(models.Outbox))
+    return asyncio.run(count())
+
+
+def test_cache_hit_completes_chapter_without_generation_request(client, async_session_factory, monkeypatch):
+    async def cached(title, description):
+        return GENERATION
+    monkeypatch.setattr(generation_cache, "get", cached)
+
+    response = client.post("/v1/chapter/", json={"owner_id": 1, "title": "리스트와 튜플 차이?"})
+
+    assert response.status_code == 200
+    assert response.json()["status"] == "completed"
+    assert count_outbox(async_session_factory) == 0
+
+    async def load():
+        async with async_session_factory() as db:
+            chapter = await db.get(models.Chapter, response.json()["chapter_id"])
+            quiz = await db.scalar(select(models.Quiz).where(models.Quiz.chapter_id == chapter.id))
+            return chapter.completion_mask, quiz.correct_answer
+    assert asyncio.run(load()) == (int(models.CompletionBit.all), "tuple")
+
+
+def test_cache_miss_requests_generation(client, async_session_factory, monkeypatch):
+    async def missing(title, description):
+        return None
+    monkeypatch.setattr(generation_cache, "get", missing)
+
+    response = client.post("/v1/chapter/", json={"owner_id": 1, "title": "새로운 질문"})
+
+    assert response.status_code == 200
+    assert response.json()["status"] == "pending"
+    assert count_outbox(async_session_factory) == 3
@@ -0,0 +1,188 @@
+"""
+Generation scheduler tests
+공정 큐가 사용자/우선순위별로 번갈아 꺼내고, relay가 발송 중 상한을 지키는지 확인
+(relay는 in-memory SQLite, Redis 임대 스크립트는 로컬 Redis 필요)
+"""
+
+import asyncio
+import uuid
+
+import pytest
+import redis.asyncio as aioredis
+from sqlalchemy import select
+
+import outbox_relay
+from core.config import settings
+from db import models
+from utils import generation_scheduler
+from utils.generation_scheduler import FairQueue, InflightLimiter, HIGH, NORMAL, lease_member
+from utils.kafka_manager import kafka_manager
+
+
+def test_bulk_user_does_not_block_other_users():
+    queue = FairQueue()
+    for row_id in range(1, 101):
+        queue.push(row_id, 1, NORMAL)  # 교사 일괄 등록
+    queue.push(101, 2, NORMAL)
+    queue.push(102, 3, NORMAL)
+
+    picked = [row_id for row_id, _, _ in queue.pop(4, {}, 10)]
+
+    assert picked[:3] == [1, 101, 102]
+    assert len(queue) == 98
+
+
+def test_high_priority_gets_weighted_share():
+    queue = FairQueue()
+    for row_id in range(100):
+        queue.push(row_id, 1, HIGH if row_id % 2 else NORMAL)
+
+    priorities = [priority for _, _, priority in queue.pop(50, {}, 100)]
+
+    assert priorities.count(HIGH) == 40
+    assert priorities.count(NORMAL) == 10
+    assert queue.depths() == {HIGH: 10, NORMAL: 40, "users": 1}
+
+
+def test_users_at_cap_are_skipped_and_requeued_items_go_first():
+    queue = FairQueue()
+    for row_id in range(1, 6):
+        queue.push(row_id, 1, NORMAL)
+    queue.push(6, 2, NORMAL)
+    queue.push(7, 2, NORMAL)
+
+    picked = queue.pop(10, {1: 0}, 1)
+    assert picked == [(6, 2, NORMAL)]
+
+    queue.requeue(picked)
+    queue.push(6, 2, NORMAL)  # 이미 대기 중이면 무시
+    assert [row_id for row_id, _, _ in queue.pop(10, {1: 2}, 1)] == [1, 6, 2]
+    assert len(queue) == 4
+
+
+@pytest.fixture
+def pending_outbox(async_session_factory, monkeypatch):
+    async def setup():
+        async with async_session_factory() as db:
+            for user_id, chapters in ((1, range(1, 11)), (2, [11])):
+                for chapter_id in chapters:
+                    for message in kafka_manager.build_generation_messages(user_id, chapter_id, "질문"):
+                        db.add(models.Outbox(
+                            topic=kafka_manager.TOPICS["N8N_REQUESTS"],
+                            message_key=message["message_id"],
+                            payload=message,
+                            user_id=message["user_id"],
+                            priority=message["priority"]
+                        ))
+            await db.commit()
+
+    asyncio.run(setup())
+    monkeypatch.setattr(outbox_relay, "AsyncSessionLocal", async_session_factory)
+
+
+class MemoryLimiter:
+    """Redis 대신 dict로 발송 중 생성을 세는 임대 관리자 (relay 흐름만 확인)"""
+
+    def __init__(self, max_inflight, max_inflight_per_user):
+        self.max_inflight = max_inflight
+        self.max_inflight_per_user = max_inflight_per_user
+        self.leases = {}
+
+    async def counts(self, user_ids):
+        per_user = {user_id: list(self.leases.values()).count(user_id) for user_id in user_ids}
+        return len(self.leases), per_user
+
+    async def acquire(self, entries):
+        acquired = set()
+        for member, user_id in entries:
+            if len(self.leases) < self.max_inflight and \
+                    list(self.leases.values()).count(user_id) < self.max_inflight_per_user:
+                self.leases[member] = user_id
+                acquired.add(member)
+        return acquired
+
+    async def release(self, members):
+        for member in members:
+            self.leases.pop(member, None)
+
+
+def test_relay_respects_inflight_caps(async_session_factory, pending_outbox, monkeypatch):
+    limiter = MemoryLimiter(max_inflight=5, max_inflight_per_user=3)
+    monkeypatch.setattr(outbox_relay, "inflight_limiter", limiter)
+    monkeypatch.setattr(settings, "GENERATION_MAX_INFLIGHT", 5)
+    monkeypatch.setattr(settings, "GENERATION_MAX_INFLIGHT_PER_USER", 3)
+
+    async def scenario():
+        queue = FairQueue()
+        await outbox_relay.load_pending(queue, 0)
+        first = await outbox_relay.relay_batch(queue)
+        blocked = await outbox_relay.relay_batch(queue)
+        sent = dict(limiter.leases)
+        await limiter.release([lease_member(1, "concept"), lease_member(11, "concept")])
+        after_release = await outbox_relay.relay_batch(queue)
+        async with async_session_factory() as db:
+            remaining = len((await db.scalars(select(models.Outbox.id))).all())
+        return first, blocked, sent, after_release, remaining, queue.depths()
+
+    first, blocked, sent, after_release, remaining, depths = asyncio.run(scenario())
+
+    assert (first, blocked, after_release) == (5, 0, 2)
+    # 사용자 2의 요청 3개가 사용자 1의 30개 뒤에 줄 서지 않고 바로 발송됨
+    assert sorted(sent.values()) == [1, 1, 1, 2, 2]
+    # 개념 정리(high)가 먼저 발송됨
+    assert lease_member(1, "concept") in sent and lease_member(11, "concept") in sent
+    assert remaining == 33 - 7
+    assert depths[HIGH] + depths[NORMAL] == remaining
+
+
+def run_with_limiter(scenario):
+    async def main():
+        client = aioredis.Redis.from_url(settings.SOCKETIO_MESSAGE_QUEUE)
+        prefix = f"test-{uuid.uuid4().hex}"
+        keys = {
+            "INFLIGHT_KEY": f"{prefix}:inflight",
+            "OWNER_KEY": f"{prefix}:owner",
+            "USER_INFLIGHT_PREFIX": f"{prefix}:user:",
+        }
+        saved = {name: getattr(generation_scheduler, name) for name in keys}
+        for name, key in keys.items():
+            setattr(generation_scheduler, name, key)
+        try:
+            limiter = InflightLimiter(client, max_inflight=3, max_inflight_per_user=2, lease_ttl=60)
+            return await scenario(limiter)
+        finally:
+            for name, key in saved.items():
+                setattr(generation_scheduler, name, key)
+            stale = await client.keys(f"{prefix}:*")
+            if stale:
+                await client.delete(*stale)
+            await client.aclose()
+    return asyncio.run(main())
+
+
+@pytest.mark.redis
+def test_limiter_caps_global_and_per_user_inflight():
+    async def scenario(limiter):
+        acquired = await limiter.acquire([("1:concept", 1), ("1:exercise", 1), ("1:quiz", 1), ("2:concept", 2)])
+        again = await limiter.acquire([("1:concept", 1), ("3:concept", 3)])
+        counts = await limiter.counts([1, 2, 3])
+        await limiter.release(["1:concept", "unknown"])
+        after_release = await limiter.counts([1, 2, 3])
+        return acquired, again, counts, after_release
+
+    acquired, again, counts, after_release = run_with_limiter(scenario)
+
+    assert acquired == {"1:concept", "1:exercise", "2:concept"}
+    assert again == {"1:concept"}  # 재발송은 갱신, 전체 상한이라 사용자 3은 대기
+    assert counts == (3, {1: 2, 2: 1, 3: 0})
+    assert after_release == (2, {1: 1, 2: 1, 3: 0})
+
+
+@pytest.mark.redis
+def test_limiter_reclaims_expired_leases():
+    async def scenario(limiter):
+        await limiter.acquire([("1:concept", 1), ("1:exercise", 1)])
+        limiter.lease_ttl = -1  # 모든 임대를 만료된 것으로 취급
+        return await limiter.counts([1])
+
+    assert run_with_limiter(scenario) == (0, {1: 0})
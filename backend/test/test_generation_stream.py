@@ -0,0 +1,66 @@
+"""
+Generation stream buffer tests
+조각 순번에 따라 이어 붙이기/재전송 무시/누락 감지가 원자적으로 동작하는지 확인 (로컬 Redis 필요)
+"""
+
+import asyncio
+import uuid
+
+import pytest
+import redis.asyncio as aioredis
+
+from core.config import settings
+from utils.generation_stream import GenerationStream, APPENDED, DUPLICATE, GAP
+
+pytestmark = pytest.mark.redis
+
+
+def run_with_stream(scenario):
+    async def main():
+        client = aioredis.Redis.from_url(settings.SOCKETIO_MESSAGE_QUEUE)
+        resource = f"test-{uuid.uuid4().hex}"
+        try:
+            return await scenario(GenerationStream(client, ttl=60), resource)
+        finally:
+            keys = await client.keys(f"generation_stream:{resource}:*")
+            if keys:
+                await client.delete(*keys)
+            await client.aclose()
+    return asyncio.run(main())
+
+
+def test_chunks_are_appended_in_order_and_retries_ignored():
+    async def scenario(stream, resource):
+        results = [
+            await stream.append(resource, 1, 0, "리스트는 "),
+            await stream.append(resource, 1, 1, "가변, "),
+            await stream.append(resource, 1, 1, "가변, "),  # 재전송
+            await stream.append(resource, 1, 2, "튜플은 불변"),
+        ]
+        return results, await stream.read(resource, 1)
+
+    results, content = run_with_stream(scenario)
+    assert [status for status, _ in results] == [APPENDED, APPENDED, DUPLICATE, APPENDED]
+    assert content == "리스트는 가변, 튜플은 불변"
+
+
+def test_gap_is_rejected_with_last_seq():
+    async def scenario(stream, resource):
+        await stream.append(resource, 1, 0, "a")
+        gap = await stream.append(resource, 1, 2, "c")
+        return gap, await stream.read(resource, 1)
+
+    gap, content = run_with_stream(scenario)
+    assert gap == (GAP, 0)
+    assert content == "a"
+
+
+def test_final_chunk_retry_after_clear_is_duplicate():
+    async def scenario(stream, resource):
+        await stream.append(resource, 1, 0, "done")
+        await stream.clear(resource, 1)
+        return await stream.append(resource, 1, 0, "done"), await stream.read(resource, 1)
+
+    retry, content = run_with_stream(scenario)
+    assert retry == (DUPLICATE, 0)
+    assert content is None
@@ -0,0 +1,81 @@
+"""
+Grading dispatcher tests
+동시에 들어온 재채점 답안이 QuizGrader 요청 몇 번으로 묶이고, 결과가 각 호출자에게 돌아가는지 확인
+"""
+
+import threading
+
+import pytest
+
+from utils.grading_dispatcher import GradingDispatcher
+from utils.quiz_grader import StubQuizGrader
+
+
+def item(answer, correct_answer="튜플"):
+    return {"quiz": "불변 자료형은?", "answer": answer, "correct_answer": correct_answer}
+
+
+@pytest.fixture
+def dispatcher():
+    dispatcher = GradingDispatcher(
+        StubQuizGrader(latency=0.05), max_batch_size=8, max_wait=0.1, max_concurrency=2, timeout=5
+    )
+    yield dispatcher
+    dispatcher.stop()
+
+
+def test_concurrent_callers_share_batches(dispatcher):
+    results = {}
+
+    def call(index):
+        answer = "튜플" if index % 2 == 0 else "리스트"
+        results[index] = dispatcher.grade([item(answer)])[0]
+
+    threads = [threading.Thread(target=call, args=(i,)) for i in range(16)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert results == {i: 100.0 if i % 2 == 0 else 0.0 for i in range(16)}
+    assert dispatcher.grader.stats["requests"] < 16
+    assert dispatcher.stats["largest_batch"] <= 8
+
+
+def test_results_keep_caller_order(dispatcher):
+    assert dispatcher.grade([item("리스트"), item("튜플"), item("튜 플")]) == [0.0, 100.0, 100.0]
+
+
+def test_grader_failure_returns_none(dispatcher, monkeypatch):
+    def broken(items):
+        raise RuntimeError("n8n down")
+    monkeypatch.setattr(dispatcher.grader, "grade", broken)
+
+    assert dispatcher.grade([item("튜플"), item("리스트")]) == [None, None]
+
+
+def test_timeout_returns_none():
+    dispatcher = GradingDispatcher(
+        StubQuizGrader(latency=0.5), max_batch_size=8, max_wait=0.01, max_concurrency=1, timeout=0.1
+    )
+    try:
+        assert dispatcher.grade([item("튜플")]) == [None]
+        assert dispatcher.stats["timeouts"] == 1
+    finally:
+        dispatcher.stop()
+
+
+def test_abandoned_items_are_not_sent():
+    dispatcher = GradingDispatcher(
+        StubQuizGrader(latency=0.5), max_batch_size=8, max_wait=0.01, max_concurrency=1, timeout=0.1
+    )
+    try:
+        # 첫 묶음이 채점되는 동안 두 번째 묶음은 발송 대기 중에 시간 초과
+        assert dispatcher.grade([item("튜플")]) == [None]
+        assert dispatcher.grade([item("리스트"), item("튜플")]) == [None, None]
+    finally:
+        dispatcher.stop()
+
+    assert dispatcher.grader.stats["requests"] == 1
+    assert dispatcher.get_metrics()["abandoned"] == 2
+    assert dispatcher.get_metrics()["timeouts"] == 3
@@ -0,0 +1,123 @@
+"""
+Kafka consumer tests
+잘못된 응답 메시지는 파싱 단계에서 걸러지고, 반영되지 않는 결과 하나가 배치 전체를 막지 않는지 확인 (in-memory SQLite)
+"""
+
+import asyncio
+import json
+
+import pytest
+from sqlalchemy import select
+
+import kafka_consumer
+from api.v1.schemas import ConceptWebhook, ExerciseWebhook, QuizWebhook
+from db import models
+
+
+class FakeMessage:
+    def __init__(self, value, offset=0):
+        self._value = value if isinstance(value, bytes) else json.dumps(value).encode()
+        self._offset = offset
+
+    def error(self):
+        return None
+
+    def value(self):
+        return self._value
+
+    def partition(self):
+        return 0
+
+    def offset(self):
+        return self._offset
+
+
+def response(workflow_type, chapter_id, data):
+    return {"message_id": "m", "workflow_type": workflow_type, "chapter_id": chapter_id, "data": data}
+
+
+def test_parse_batch_skips_payloads_that_cannot_be_stored():
+    messages = [
+        FakeMessage(response("concept", 1, {"title": "리스트", "content": "가변"})),
+        FakeMessage(response("quiz", 1, {"question": "Q", "correct_answer": "A", "type": "essay"})),
+        FakeMessage(response("exercise", 1, {"question": "Q", "answer": "x" * 256})),
+        FakeMessage(response("exercise", 2, {"question": "Q", "answer": "x" * 255})),
+        FakeMessage(response("unknown", 1, {})),
+        FakeMessage(b"not json"),
+    ]
+
+    results = kafka_consumer.parse_batch(messages)
+
+    assert list(results["concept"]) == [1]
+    assert list(results["exercise"]) == [2]
+    assert results["quiz"] == {}
+
+
+@pytest.fixture
+def pending_chapters(async_session_factory, monkeypatch):
+    async def setup():
+        async with async_session_factory() as db:
+            db.add(models.Member(email="test@example.com", password="hashed"))
+            for chapter_id in (1, 2):
+                db.add(models.Chapter(id=chapter_id, owner_id=1, title=f"질문 {chapter_id}",
+                                      status=models.StatusEnum.pending, completion_mask=0, is_active=True))
+                db.add_all([
+                    models.Concept(chapter_id=chapter_id, is_complete=False),
+                    models.Exercise(chapter_id=chapter_id, is_complete=False),
+                    models.Quiz(chapter_id=chapter_id, type=models.QuizTypeEnum.multiple),
+                ])
+            await db.commit()
+
+    asyncio.run(setup())
+    monkeypatch.setattr(kafka_consumer, "AsyncSessionLocal", async_session_factory)
+
+
+def full_results(chapter_ids):
+    return {
+        "concept": {cid: ConceptWebhook(title="리스트", content="가변") for cid in chapter_ids},
+        "exercise": {cid: ExerciseWebhook(question="실습", answer="정답") for cid in chapter_ids},
+        "quiz": {cid: QuizWebhook(question="Q", correct_answer="A", type="short", options=["A", "B"])
+                 for cid in chapter_ids},
+    }
+
+
+def test_ingest_batch_upserts_and_completes_chapters(async_session_factory, pending_chapters):
+    row_ids, completed_ids = asyncio.run(kafka_consumer.ingest_batch(full_results([1, 2, 99])))
+
+    assert sorted(completed_ids) == [1, 2]
+    assert sorted(row_ids["quiz"]) == [1, 2]
+
+    async def load():
+        async with async_session_factory() as db:
+            quiz = await db.scalar(select(models.Quiz).where(models.Quiz.chapter_id == 1))
+            chapter = await db.get(models.Chapter, 1)
+            return quiz.type, quiz.options, chapter.status
+    # options는 webhook과 같은 인코딩 (json.dumps)
+    assert asyncio.run(load()) == (models.QuizTypeEnum.short, json.dumps(["A", "B"]), models.StatusEnum.completed)
+
+
+def test_ingest_rows_dead_letters_only_the_failing_result(pending_chapters, monkeypatch):
+    monkeypatch.setattr(kafka_consumer, "RETRY_BACKOFF", 0)
+    ingest_batch = kafka_consumer.ingest_batch
+    attempts = []
+    dead_letters = []
+
+    async def flaky_ingest(results):
+        if 2 in results["quiz"]:
+            attempts.append(2)
+            raise RuntimeError("Data too long")
+        return await ingest_batch(results)
+
+    async def record_dead_letter(workflow_type, chapter_id, payload, error):
+        dead_letters.append((workflow_type, chapter_id, str(error)))
+
+    monkeypatch.setattr(kafka_consumer, "ingest_batch", flaky_ingest)
+    monkeypatch.setattr(kafka_consumer, "dead_letter", record_dead_letter)
+
+    row_ids, completed_ids = asyncio.run(kafka_consumer.ingest_rows(full_results([1, 2])))
+
+    assert completed_ids == [1]
+    assert sorted(row_ids["concept"]) == [1, 2]
+    assert 2 not in row_ids["quiz"]
+    assert len(attempts) == kafka_consumer.settings.KAFKA_CONSUMER_MAX_ATTEMPTS
+    assert dead_letters == [("quiz", 2, "Data too long")]
@@ -0,0 +1,180 @@
+"""
+Kafka manager tests
+로컬 큐가 가득 찼을 때(BufferError) poll로 비우며 재시도하고, KAFKA_BACKPRESSURE_TIMEOUT이 지나면
+메시지를 버리는지, 종료 시 남은 메시지를 flush하는지, publish_async의 future가 poller 스레드의
+delivery 콜백으로 완료되는지 확인 (confluent_kafka Producer는 가짜로 대체)
+"""
+
+import asyncio
+import gc
+import threading
+import time
+
+import pytest
+
+import utils.kafka_manager as kafka_module
+from core.config import settings
+from utils.kafka_manager import KafkaManager, KafkaDeliveryError
+
+
+class FakeMessage:
+    def __init__(self, topic, key):
+        self._topic = topic
+        self._key = key
+
+    def topic(self):
+        return self._topic
+
+    def key(self):
+        return self._key
+
+
+class FakeProducer:
+    """
+    poll()이 한 번 실행될 때까지 BufferError를 내는 Producer
+    (stuck=True면 poll 후에도 계속 가득 찬 상태, failing_keys의 메시지는 전달 실패로 보고)
+    """
+
+    def __init__(self, config=None, full=True, stuck=False, failing_keys=()):
+        self.full = full
+        self.stuck = stuck
+        self.failing_keys = set(failing_keys)
+        self.queue = []
+        self.polls = 0
+        self.flushes = []
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self.queue)
+
+    def produce(self, topic, key, value, on_delivery):
+        with self._lock:
+            if self.full:
+                raise BufferError("Local: Queue full")
+            self.queue.append((FakeMessage(topic, key), on_delivery))
+
+    def poll(self, timeout=0):
+        with self._lock:
+            self.polls += 1
+            self.full = self.stuck
+            delivered, self.queue = self.queue, []
+        if not delivered and timeout:
+            time.sleep(min(timeout, 0.01))
+        for msg, on_delivery in delivered:
+            on_delivery("broker error" if msg.key() in self.failing_keys else None, msg)
+        return len(delivered)
+
+    def flush(self, timeout=None):
+        self.flushes.append(timeout)
+        self.poll(0)
+        return len(self.queue)
+
+
+@pytest.fixture
+def manager():
+    manager = KafkaManager()
+    yield manager
+    manager.close_connections()
+
+
+@pytest.fixture
+def use_producer(manager, monkeypatch):
+    """get_producer()가 가짜 Producer를 만들고 실제 poller 스레드를 띄우도록 설정"""
+    def use(producer):
+        monkeypatch.setattr(kafka_module, "KAFKA_AVAILABLE", True)
+        monkeypatch.setattr(kafka_module, "Producer", lambda config: producer)
+        return producer
+    return use
+
+
+def test_produce_retries_until_poll_frees_queue(manager):
+    producer = FakeProducer()
+
+    manager._produce(producer, "n8n-requests", "key-1", "{}")
+
+    assert producer.polls == 1 and len(producer) == 1
+    assert manager.get_metrics()["produced"] == 1 and manager.get_metrics()["dropped"] == 0
+
+
+def test_produce_async_retries_until_queue_frees(manager):
+    producer = FakeProducer()
+
+    async def scenario():
+        # 이벤트 루프를 막지 않고 기다리는 동안 poller가 큐를 비움
+        loop = asyncio.get_running_loop()
+        loop.call_later(0.05, producer.poll)
+        await manager._produce_async(producer, "n8n-requests", "key-1", "{}")
+
+    asyncio.run(scenario())
+
+    assert len(producer) == 1 and manager.get_metrics()["produced"] == 1
+
+
+def test_produce_raises_after_backpressure_timeout(manager, monkeypatch):
+    monkeypatch.setattr(settings, "KAFKA_BACKPRESSURE_TIMEOUT", 0.3)
+    producer = FakeProducer(stuck=True)
+
+    with pytest.raises(BufferError):
+        manager._produce(producer, "n8n-requests", "key-1", "{}")
+    with pytest.raises(BufferError):
+        asyncio.run(manager._produce_async(producer, "n8n-requests", "key-2", "{}"))
+
+    assert producer.polls >= 2
+    assert manager.get_metrics() == {"produced": 0, "delivered": 0, "failed": 0, "dropped": 2}
+
+
+def test_close_connections_flushes_pending_messages(manager, use_producer, monkeypatch):
+    producer = use_producer(FakeProducer(full=False))
+    # poller가 먼저 전달하지 않도록 정지 상태에서 적재
+    monkeypatch.setattr(manager, "_start_poller", lambda: None)
+
+    manager.send_n8n_request("concept", 1, 10, {"question": "파이썬"})
+    manager.send_content_update_notification("concept", 3, 1, "completed")
+    assert len(producer) == 2
+
+    manager.close_connections()
+
+    assert producer.flushes == [settings.KAFKA_FLUSH_TIMEOUT]
+    assert len(producer) == 0 and manager.producer is None
+    assert manager.get_metrics()["delivered"] == 2
+
+
+def test_publish_async_future_follows_delivery_callback(manager, use_producer):
+    use_producer(FakeProducer(full=False, failing_keys={"bad"}))
+
+    async def scenario():
+        acked = await manager.publish_async("n8n-requests", "good", {"n": 1})
+        failed = await manager.publish_async("n8n-requests", "bad", {"n": 2})
+        # 두 future 모두 poller 스레드의 delivery 콜백이 call_soon_threadsafe로 완료
+        return await asyncio.wait_for(asyncio.gather(acked, failed, return_exceptions=True), 2)
+
+    acked, failed = asyncio.run(scenario())
+
+    assert acked == "good"
+    assert isinstance(failed, KafkaDeliveryError)
+    metrics = manager.get_metrics()
+    assert metrics["delivered"] == 1 and metrics["failed"] == 1
+
+
+@pytest.mark.parametrize("options", [
+    {"full": False, "failing_keys": {"bad"}},  # 브로커가 전달 실패 보고
+    {"stuck": True},                           # 로컬 큐 포화로 적재 실패
+])
+def test_unawaited_failure_is_not_reported_again(manager, use_producer, options, monkeypatch):
+    monkeypatch.setattr(settings, "KAFKA_BACKPRESSURE_TIMEOUT", 0.1)
+    use_producer(FakeProducer(**options))
+    unhandled = []
+
+    async def scenario():
+        loop = asyncio.get_running_loop()
+        loop.set_exception_handler(lambda loop, context: unhandled.append(context))
+        future = await manager.publish_async("n8n-requests", "bad", {"n": 1})
+        while not future.done():
+            await asyncio.sleep(0.01)
+        await asyncio.sleep(0)
+        del future
+        gc.collect()
+
+    asyncio.run(scenario())
+
+    assert unhandled == []
@@ -0,0 +1,91 @@
+"""
+Learning page cache tests
+버전 키 무효화 후 이전 버전의 페이지가 보이지 않고, 버전 키가 만료·축출되어도
+예전 버전이 다시 쓰이지 않는지 확인 (버전을 공유하는 정답 캐시 포함, 로컬 Redis 필요)
+"""
+
+import random
+
+import pytest
+import redis
+import redis.asyncio as aioredis
+
+from api.v1.schemas import SingleLearningPage
+from core.config import settings
+from utils.answer_key_cache import AnswerKeyCache
+from utils.learning_page_cache import LearningPageCache, VERSION_KEY
+
+
+@pytest.fixture
+def cache():
+    client = redis.Redis.from_url(settings.SOCKETIO_MESSAGE_QUEUE)
+    async_client = aioredis.Redis.from_url(settings.SOCKETIO_MESSAGE_QUEUE)
+    chapter_id = random.randint(10 ** 8, 10 ** 9)
+    yield LearningPageCache(client, async_client, ttl=60), chapter_id
+    keys = client.keys(f"learning_page:*:{chapter_id}*") + client.keys(f"answer_key:*:{chapter_id}:*")
+    if keys:
+        client.delete(*keys)
+    client.close()
+
+
+def page(chapter_id, title):
+    return SingleLearningPage(chapter_id=chapter_id, title=title, status="completed")
+
+
+@pytest.mark.redis
+def test_invalidate_hides_late_write_to_previous_version(cache):
+    cache, chapter_id = cache
+    cached, version = cache.get(chapter_id)
+    assert cached is None
+
+    cache.invalidate(chapter_id)
+    # 무효화 직전에 DB를 읽은 요청이 늦게 채운 값
+    cache.set(chapter_id, version, page(chapter_id, "이전"))
+
+    cached, new_version = cache.get(chapter_id)
+    assert cached is None and new_version != version
+    cache.set(chapter_id, new_version, page(chapter_id, "최신"))
+    assert cache.get(chapter_id)[0].title == "최신"
+
+
+@pytest.mark.redis
+def test_lost_version_key_does_not_revive_old_pages(cache):
+    cache, chapter_id = cache
+    seen = []
+    for title in ("첫 번째", "두 번째"):
+        _, version = cache.get(chapter_id)
+        cache.set(chapter_id, version, page(chapter_id, title))
+        seen.append(version)
+        cache.invalidate(chapter_id)
+
+    # 버전 키 만료/축출 후 다시 무효화
+    cache.client.delete(VERSION_KEY.format(chapter_id=chapter_id))
+    cache.invalidate(chapter_id)
+    cached, version = cache.get(chapter_id)
+    assert cached is None and version not in seen
+
+    cache.client.delete(VERSION_KEY.format(chapter_id=chapter_id))
+    cached, version = cache.get(chapter_id)
+    assert cached is None and version not in seen
+    assert cache.client.ttl(VERSION_KEY.format(chapter_id=chapter_id)) == -1
+
+
+@pytest.mark.redis
+def test_answer_keys_outliving_version_key_are_not_reused(cache):
+    cache, chapter_id = cache
+    # 정답 TTL(1시간)이 버전 키보다 오래 남는 상황
+    answer_keys = AnswerKeyCache(cache.client, ttl=3600)
+    _, missing = answer_keys.get_many([chapter_id])
+    answer_keys.set_many({chapter_id: {"answer": "튜플"}}, missing)
+    cache.invalidate(chapter_id)
+    _, missing = answer_keys.get_many([chapter_id])
+    answer_keys.set_many({chapter_id: {"answer": "리스트"}}, missing)
+
+    cache.client.delete(VERSION_KEY.format(chapter_id=chapter_id))
+    cache.invalidate(chapter_id)
+    found, missing = answer_keys.get_many([chapter_id])
+    assert found == {} and chapter_id in missing
+
+    cache.client.delete(VERSION_KEY.format(chapter_id=chapter_id))
+    found, missing = answer_keys.get_many([chapter_id])
+    assert found == {} and chapter_id in missing
@@ -0,0 +1,66 @@
+"""
+Learning page query count tests
+GET /v1/chapter/{id}/learning이 SELECT 1회로 처리되는지 확인 (in-memory SQLite)
+"""
+
+import pytest
+from sqlalchemy import event
+
+from api.v1.chapters import router as chapters_router
+from db import models
+from utils.learning_page_cache import learning_page_cache
+
+
+@pytest.fixture
+def chapter_id(session_factory):
+    db = session_factory()
+    member = models.Member(email="test@example.com", password="hashed")
+    db.add(member)
+    db.flush()
+    chapter = models.Chapter(owner_id=member.id, title="파이썬 변수란?", status=models.StatusEnum.completed)
+    db.add(chapter)
+    db.flush()
+    db.add_all([
+        models.Concept(chapter_id=chapter.id, title="변수", content="내용", is_complete=True),
+        models.Exercise(chapter_id=chapter.id, title="문제", contents="정답", is_complete=True),
+        models.Quiz(chapter_id=chapter.id, question="질문", options=["a", "b"], correct_answer="a"),
+    ])
+    db.commit()
+    chapter_id = chapter.id
+    db.close()
+    return chapter_id
+
+
+@pytest.fixture
+def client(make_client, session_factory, monkeypatch):
+    # Redis 캐시는 건너뛰고 DB 조회 경로만 측정
+    monkeypatch.setattr(learning_page_cache, "get_json", lambda chapter_id: (None, None))
+    return make_client(chapters_router.router, db=session_factory)
+
+
+def count_statements(engine):
+    statements = []
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def _count(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    return statements
+
+
+def test_learning_page_uses_single_select(engine, client, chapter_id):
+    statements = count_statements(engine)
+
+    response = client.get(f"/v1/chapter/{chapter_id}/learning")
+
+    assert response.status_code == 200
+    data = response.json()
+    assert data["concept"]["title"] == "변수"
+    assert data["exercise"]["question"] == "문제"
+    assert data["quiz"]["options"] == ["a", "b"]
+    assert len([s for s in statements if s.lstrip().upper().startswith("SELECT")]) == 1
+
+
+def test_learning_page_not_found(client):
+    response = client.get("/v1/chapter/9999/learning")
+    assert response.status_code == 404
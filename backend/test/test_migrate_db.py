@@ -0,0 +1,62 @@
+"""
+Database migration tests
+create_all로 만들어진 이전 스키마에 새 컬럼/인덱스가 추가되고, 여러 번 실행해도 안전한지 확인 (in-memory SQLite)
+"""
+
+import pytest
+from sqlalchemy import create_engine, inspect, text
+from sqlalchemy.pool import StaticPool
+
+from db import models
+from migrate_db import migrate
+
+# completion_mask, outbox 스케줄링 컬럼 추가 전, (owner_id, created_at) 인덱스만 있던 스키마
+OLD_SCHEMA = [
+    "CREATE TABLE member (id INTEGER PRIMARY KEY, email VARCHAR(255) NOT NULL, password VARCHAR(255) NOT NULL,"
+    " created_at DATETIME, updated_at DATETIME)",
+    "CREATE TABLE chapter (id INTEGER PRIMARY KEY, owner_id INTEGER NOT NULL, title VARCHAR(255) NOT NULL,"
+    " description TEXT, status VARCHAR(9), is_active BOOLEAN, created_at DATETIME, updated_at DATETIME)",
+    "CREATE INDEX ix_chapter_owner_created ON chapter (owner_id, created_at)",
+    "CREATE TABLE concept (id INTEGER PRIMARY KEY, chapter_id INTEGER NOT NULL, title VARCHAR(255), content TEXT,"
+    " is_complete BOOLEAN, created_at DATETIME, updated_at DATETIME)",
+    "CREATE TABLE exercise (id INTEGER PRIMARY KEY, chapter_id INTEGER NOT NULL, title VARCHAR(255),"
+    " contents VARCHAR(255), is_complete BOOLEAN, created_at DATETIME, updated_at DATETIME)",
+    "CREATE TABLE quiz (id INTEGER PRIMARY KEY, chapter_id INTEGER NOT NULL, question TEXT, options JSON,"
+    " correct_answer VARCHAR(255), explanation TEXT, type VARCHAR(8), created_at DATETIME, updated_at DATETIME)",
+    "CREATE TABLE outbox (id INTEGER PRIMARY KEY, topic VARCHAR(255) NOT NULL, message_key VARCHAR(255) NOT NULL,"
+    " payload JSON NOT NULL, attempts INTEGER NOT NULL, created_at DATETIME)",
+    "INSERT INTO member (id, email, password) VALUES (1, 'test@example.com', 'hashed')",
+    "INSERT INTO chapter (id, owner_id, title, status) VALUES (1, 1, '완료', 'completed'), (2, 1, '생성 중', 'pending')",
+    "INSERT INTO concept (chapter_id, is_complete) VALUES (1, 1), (2, 1)",
+    "INSERT INTO exercise (chapter_id, is_complete) VALUES (1, 1), (2, 0)",
+    "INSERT INTO quiz (chapter_id, question) VALUES (1, '불변 자료형은?'), (2, NULL)",
+]
+
+
+@pytest.fixture
+def legacy_engine():
+    """테이블을 만들지 않은 in-memory SQLite에 이전 스키마를 직접 생성"""
+    engine = create_engine("sqlite://", poolclass=StaticPool)
+    with engine.begin() as conn:
+        for statement in OLD_SCHEMA:
+            conn.execute(text(statement))
+    yield engine
+    engine.dispose()
+
+
+def test_migrate_adds_columns_indexes_and_backfills(legacy_engine):
+    applied = migrate(legacy_engine)
+
+    assert "add column chapter.completion_mask" in applied
+    assert "create index ix_chapter_owner_created (owner_id, created_at, id)" in applied
+    inspector = inspect(legacy_engine)
+    assert {"user_id", "priority", "claimed_until", "failed_at"} <= {c["name"] for c in inspector.get_columns("outbox")}
+    indexes = {index["name"]: index["column_names"] for index in inspector.get_indexes("chapter")}
+    assert indexes["ix_chapter_owner_created"] == ["owner_id", "created_at", "id"]
+
+    with legacy_engine.connect() as conn:
+        masks = conn.execute(text("SELECT id, completion_mask FROM chapter ORDER BY id")).all()
+    assert masks == [(1, int(models.CompletionBit.all)), (2, int(models.CompletionBit.concept))]
+
+    # 이미 반영된 DB에는 아무것도 하지 않음
+    assert migrate(legacy_engine) == []
@@ -0,0 +1,110 @@
+"""
+Outbox relay tests
+발송 전에 선점을 커밋해 브로커 ack를 기다리는 동안 트랜잭션을 잡지 않고,
+계속 실패하는 행은 OUTBOX_MAX_ATTEMPTS번 뒤 포기하는지 확인 (in-memory SQLite)
+"""
+
+import asyncio
+
+import pytest
+from sqlalchemy import select
+
+import outbox_relay
+from core.config import settings
+from db import models
+from utils.generation_scheduler import FairQueue
+from utils.kafka_manager import kafka_manager
+
+
+class UnlimitedLimiter:
+    """발송 중 상한 없이 임대를 내주는 대역"""
+
+    def __init__(self):
+        self.released = []
+
+    async def counts(self, user_ids):
+        return 0, {}
+
+    async def acquire(self, entries):
+        return {member for member, _ in entries}
+
+    async def release(self, members):
+        self.released.extend(members)
+
+
+@pytest.fixture
+def pending_outbox(async_session_factory, monkeypatch):
+    async def setup():
+        async with async_session_factory() as db:
+            for message in kafka_manager.build_generation_messages(1, 1, "질문"):
+                db.add(models.Outbox(
+                    topic=kafka_manager.TOPICS["N8N_REQUESTS"],
+                    message_key=message["message_id"],
+                    payload=message,
+                    user_id=message["user_id"],
+                    priority=message["priority"]
+                ))
+            await db.commit()
+
+    asyncio.run(setup())
+    monkeypatch.setattr(outbox_relay, "AsyncSessionLocal", async_session_factory)
+    monkeypatch.setattr(outbox_relay, "inflight_limiter", UnlimitedLimiter())
+
+
+def load_rows(async_session_factory):
+    async def load():
+        async with async_session_factory() as db:
+            return (await db.scalars(select(models.Outbox).order_by(models.Outbox.id))).all()
+    return asyncio.run(load())
+
+
+def test_claim_is_committed_before_waiting_for_acks(async_session_factory, pending_outbox, monkeypatch):
+    seen_while_publishing = []
+
+    async def publish(topic, key, message):
+        # 발송 중에 다른 세션(다른 relay)에서 선점이 보여야 트랜잭션 밖에서 ack를 기다리는 것
+        async with async_session_factory() as db:
+            claimed = await db.scalar(select(models.Outbox.claimed_until).where(models.Outbox.message_key == key))
+        seen_while_publishing.append(claimed)
+        future = asyncio.get_running_loop().create_future()
+        future.set_result(key)
+        return future
+
+    monkeypatch.setattr(kafka_manager, "publish_async", publish)
+
+    async def scenario():
+        queue = FairQueue()
+        await outbox_relay.load_pending(queue, 0)
+        return await outbox_relay.relay_batch(queue)
+
+    assert asyncio.run(scenario()) == 3
+    assert len(seen_while_publishing) == 3 and all(seen_while_publishing)
+    assert load_rows(async_session_factory) == []
+
+
+def test_rows_are_abandoned_after_max_attempts(async_session_factory, pending_outbox, monkeypatch):
+    monkeypatch.setattr(settings, "OUTBOX_MAX_ATTEMPTS", 2)
+
+    async def publish(topic, key, message):
+        future = asyncio.get_running_loop().create_future()
+        future.set_exception(RuntimeError("broker down"))
+        return future
+
+    monkeypatch.setattr(kafka_manager, "publish_async", publish)
+
+    async def scenario():
+        queue = FairQueue()
+        await outbox_relay.load_pending(queue, 0)
+        sent = [await outbox_relay.relay_batch(queue) for _ in range(3)]
+        reloaded = FairQueue()
+        await outbox_relay.load_pending(reloaded, 0)
+        return sent, len(queue), len(reloaded)
+
+    sent, pending, reloaded = asyncio.run(scenario())
+
+    assert sent == [3, 3, 0]
+    assert (pending, reloaded) == (0, 0)
+    rows = load_rows(async_session_factory)
+    assert [(row.attempts, row.claimed_until) for row in rows] == [(2, None)] * 3
+    assert all(row.failed_at is not None for row in rows)
+    assert len(outbox_relay.inflight_limiter.released) == 6
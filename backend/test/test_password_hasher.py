@@ -0,0 +1,54 @@
+"""
+Password hasher tests
+awaitable API로 해싱/검증한 결과가 기존 동기 함수와 호환되고,
+워커보다 많은 요청이 몰리면 pending/queued 지표에 대기열이 드러나는지 확인
+"""
+
+import asyncio
+
+import pytest
+
+from api.v1.auth.router import verify_password
+from utils.password_hasher import PasswordHasher
+
+PASSWORD = "testpass123"
+
+
+@pytest.fixture
+def hasher():
+    hasher = PasswordHasher(max_workers=1)
+    hasher.start()
+    yield hasher
+    hasher.shutdown()
+
+
+def test_hash_and_verify_round_trip(hasher):
+    async def run():
+        hashed = await hasher.hash(PASSWORD)
+        return hashed, await hasher.verify(PASSWORD, hashed), await hasher.verify("wrong", hashed)
+
+    hashed, ok, wrong = asyncio.run(run())
+
+    assert ok is True and wrong is False
+    assert verify_password(PASSWORD, hashed)
+    metrics = hasher.get_metrics()
+    assert metrics["submitted"] == metrics["completed"] == 3
+    assert metrics["pending"] == 0 and metrics["queued"] == 0
+
+
+def test_metrics_expose_queue_depth(hasher):
+    async def run():
+        hashed = await hasher.hash(PASSWORD)
+        tasks = [asyncio.create_task(hasher.verify(PASSWORD, hashed)) for _ in range(3)]
+        await asyncio.sleep(0)
+        during = hasher.get_metrics()
+        return during, await asyncio.gather(*tasks)
+
+    during, results = asyncio.run(run())
+
+    assert results == [True, True, True]
+    assert during["workers"] == 1
+    assert during["pending"] == 3 and during["queued"] == 2
+    after = hasher.get_metrics()
+    assert after["pending"] == 0 and after["queued"] == 0
+    assert after["max_pending"] == 3 and after["completed"] == 4
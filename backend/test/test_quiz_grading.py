@@ -0,0 +1,110 @@
+"""
+Quiz grading tests
+정답 캐시에 없는 챕터만 IN 쿼리 1회로 조회하고, 일괄 채점이 항목별로 결과를 돌려주는지 확인 (in-memory SQLite)
+"""
+
+import pytest
+from sqlalchemy import event
+
+from api.v1.quizzes import router as quizzes_router
+from db import models
+from utils.answer_key_cache import answer_key_cache
+
+
+@pytest.fixture
+def chapter_ids(session_factory):
+    db = session_factory()
+    member = models.Member(email="test@example.com", password="hashed")
+    db.add(member)
+    db.flush()
+    ready, pending, no_quiz = (models.Chapter(owner_id=member.id, title=f"질문 {i}") for i in range(3))
+    db.add_all([ready, pending, no_quiz])
+    db.flush()
+    db.add_all([
+        models.Quiz(chapter_id=ready.id, question="불변 자료형은?", correct_answer=" Tuple ", explanation="튜플은 불변"),
+        models.Quiz(chapter_id=pending.id),
+    ])
+    db.commit()
+    ids = ready.id, pending.id, no_quiz.id
+    db.close()
+    return ids
+
+
+@pytest.fixture
+def cache(monkeypatch):
+    """Redis 대신 dict에 저장하는 정답 캐시"""
+    store = {}
+
+    def get_many(chapter_ids):
+        chapter_ids = list(chapter_ids)
+        found = {c: store[c] for c in chapter_ids if c in store}
+        return found, {c: "0" for c in chapter_ids if c not in store}
+
+    def set_many(answer_keys, versions):
+        store.update({c: key for c, key in answer_keys.items() if versions.get(c) is not None})
+
+    monkeypatch.setattr(answer_key_cache, "get_many", get_many)
+    monkeypatch.setattr(answer_key_cache, "set_many", set_many)
+    return store
+
+
+@pytest.fixture
+def client(make_client, session_factory, cache):
+    return make_client(quizzes_router.router, db=session_factory)
+
+
+def count_selects(engine):
+    statements = []
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def _count(conn, cursor, statement, parameters, context, executemany):
+        if statement.lstrip().upper().startswith("SELECT"):
+            statements.append(statement)
+
+    return statements
+
+
+def test_submit_uses_cached_answer_key(engine, client, chapter_ids, cache):
+    ready_id = chapter_ids[0]
+    selects = count_selects(engine)
+
+    first = client.post(f"/v1/quiz/{ready_id}/submit", json={"answer": "tuple", "member_id": 1})
+    second = client.post(f"/v1/quiz/{ready_id}/submit", json={"answer": "list", "member_id": 1})
+
+    assert first.json() == {
+        "is_correct": True, "score": 100, "explanation": "튜플은 불변", "confidence": 1.0, "graded_by": "local"
+    }
+    assert second.json()["is_correct"] is False
+    assert len(selects) == 1
+    assert cache[ready_id]["answer"] == "tuple"
+
+
+def test_submit_errors(client, chapter_ids):
+    _, pending_id, no_quiz_id = chapter_ids
+    assert client.post(f"/v1/quiz/{pending_id}/submit", json={"answer": "a", "member_id": 1}).status_code == 400
+    assert client.post(f"/v1/quiz/{no_quiz_id}/submit", json={"answer": "a", "member_id": 1}).status_code == 404
+    assert client.post("/v1/quiz/9999/submit", json={"answer": "a", "member_id": 1}).status_code == 404
+
+
+def test_batch_grades_with_single_query(engine, client, chapter_ids, cache):
+    ready_id, pending_id, no_quiz_id = chapter_ids
+    selects = count_selects(engine)
+
+    response = client.post("/v1/quiz/submit-batch", json={
+        "submissions": [
+            {"chapter_id": ready_id, "answer": "TUPLE"},
+            {"chapter_id": ready_id, "answer": "list"},
+            {"chapter_id": pending_id, "answer": "a"},
+            {"chapter_id": no_quiz_id, "answer": "a"},
+            {"chapter_id": 9999, "answer": "a"},
+        ]
+    })
+
+    assert response.status_code == 200
+    results = response.json()["results"]
+    assert [r["is_correct"] for r in results] == [True, False, None, None, None]
+    assert [r["error"] for r in results] == [
+        None, None, "Quiz is not ready yet", "Quiz not found", "Chapter not found"
+    ]
+    assert len(selects) == 1
+    assert list(cache) == [ready_id]
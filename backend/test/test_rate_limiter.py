@@ -0,0 +1,164 @@
+"""
+Generation admission control tests
+토큰이 부족하면 질문 등록 라우트가 429 + Retry-After를 돌려주고,
+검증에 실패하거나 캐시로 바로 완료되는 요청은 차감하지 않는지 확인 (in-memory SQLite)
+(토큰 버킷 스크립트는 로컬 Redis 필요)
+"""
+
+import asyncio
+import uuid
+
+import pytest
+import redis.asyncio as aioredis
+
+from api.v1.chapters import router as chapters_router
+from core.config import settings
+from utils import rate_limiter
+from utils.generation_cache import generation_cache
+from utils.similar_question_index import SimilarQuestionIndex
+from utils.rate_limiter import TokenBucketLimiter, generation_limiter, USER, GLOBAL
+
+
+GENERATION = {
+    "concept": {"title": "리스트와 튜플", "content": "리스트는 가변, 튜플은 불변"},
+    "exercise": {"title": "튜플을 수정해 보세요", "contents": "TypeError가 발생합니다"},
+    "quiz": {"question": "불변 자료형은?", "options": ["list", "tuple"], "correct_answer": "tuple",
+             "explanation": "튜플은 불변", "type": "multiple"}
+}
+
+
+@pytest.fixture
+def client(make_client, async_session_factory, monkeypatch):
+    async def missing(title, description):
+        return None
+    monkeypatch.setattr(generation_cache, "get", missing)
+    monkeypatch.setattr(chapters_router, "similar_question_index", SimilarQuestionIndex(100, 60))
+    return make_client(chapters_router.router, async_db=async_session_factory, user_id=7)
+
+
+def reject_with(monkeypatch, scope, retry_after):
+    calls = []
+
+    async def rejected(user_id, cost=1):
+        calls.append((user_id, cost))
+        return False, scope, retry_after
+    monkeypatch.setattr(generation_limiter, "acquire", rejected)
+    return calls
+
+
+def test_rejected_question_gets_retry_after(client, monkeypatch):
+    calls = reject_with(monkeypatch, USER, 2.3)
+
+    response = client.post("/v1/chapter/", json={"owner_id": 7, "title": "리스트와 튜플 차이?"})
+
+    assert response.status_code == 429
+    assert response.headers["Retry-After"] == "3"
+    assert response.json()["detail"]["scope"] == USER
+    assert calls == [(7, 1)]
+
+
+def test_bulk_is_charged_per_question(client, monkeypatch):
+    calls = reject_with(monkeypatch, GLOBAL, 0.2)
+
+    response = client.post("/v1/chapter/bulk", json={
+        "owner_id": 7,
+        "questions": [{"title": f"질문 {index}"} for index in range(5)]
+    })
+
+    assert response.status_code == 429
+    assert response.headers["Retry-After"] == "1"
+    assert calls == [(7, 5)]
+
+
+def test_oversized_bulk_is_not_charged(client, monkeypatch):
+    calls = reject_with(monkeypatch, USER, 1)
+
+    response = client.post("/v1/chapter/bulk", json={
+        "owner_id": 7,
+        "questions": [{"title": "질문"}] * (settings.CHAPTER_BULK_MAX_SIZE + 1)
+    })
+
+    assert response.status_code == 400
+    assert calls == []
+
+
+def test_invalid_body_is_not_charged(client, monkeypatch):
+    calls = reject_with(monkeypatch, USER, 1)
+
+    assert client.post("/v1/chapter/", json={"owner_id": 7}).status_code == 422
+    assert client.post("/v1/chapter/bulk", json={"owner_id": 7, "questions": [{}]}).status_code == 422
+    assert calls == []
+
+
+def test_cache_hit_is_not_charged(client, monkeypatch):
+    calls = reject_with(monkeypatch, USER, 1)
+
+    async def cached(title, description):
+        return GENERATION
+    monkeypatch.setattr(generation_cache, "get", cached)
+
+    response = client.post("/v1/chapter/", json={"owner_id": 7, "title": "리스트와 튜플 차이?"})
+
+    assert response.status_code == 200
+    assert response.json()["status"] == "completed"
+    assert calls == []
+
+
+def run_with_limiter(scenario, **limits):
+    async def main():
+        client = aioredis.Redis.from_url(settings.SOCKETIO_MESSAGE_QUEUE)
+        prefix = f"test-{uuid.uuid4().hex}"
+        saved = rate_limiter.USER_BUCKET_KEY, rate_limiter.GLOBAL_BUCKET_KEY
+        rate_limiter.USER_BUCKET_KEY = f"{prefix}:user:{{user_id}}"
+        rate_limiter.GLOBAL_BUCKET_KEY = f"{prefix}:global"
+        try:
+            return await scenario(TokenBucketLimiter(client, **limits))
+        finally:
+            rate_limiter.USER_BUCKET_KEY, rate_limiter.GLOBAL_BUCKET_KEY = saved
+            keys = await client.keys(f"{prefix}:*")
+            if keys:
+                await client.delete(*keys)
+            await client.aclose()
+    return asyncio.run(main())
+
+
+@pytest.mark.redis
+def test_user_bucket_allows_burst_then_rejects():
+    async def scenario(limiter):
+        results = [await limiter.acquire(1) for _ in range(4)]
+        other_user = await limiter.acquire(2)
+        return results, other_user
+
+    results, other_user = run_with_limiter(
+        scenario, user_rate=0.1, user_burst=3, global_rate=100, global_burst=100
+    )
+
+    assert [allowed for allowed, _, _ in results] == [True, True, True, False]
+    _, scope, retry_after = results[-1]
+    assert scope == USER and 9 < retry_after <= 10
+    assert other_user == (True, None, 0.0)
+
+
+@pytest.mark.redis
+def test_global_bucket_limits_all_users():
+    async def scenario(limiter):
+        return [await limiter.acquire(user_id) for user_id in range(3)]
+
+    results = run_with_limiter(scenario, user_rate=10, user_burst=10, global_rate=1, global_burst=2)
+
+    assert [allowed for allowed, _, _ in results] == [True, True, False]
+    assert results[-1][1] == GLOBAL
+
+
+@pytest.mark.redis
+def test_request_larger_than_burst_leaves_debt():
+    async def scenario(limiter):
+        bulk = await limiter.acquire(1, cost=10)
+        following = await limiter.acquire(1)
+        return bulk, following
+
+    bulk, following = run_with_limiter(scenario, user_rate=1, user_burst=5, global_rate=100, global_burst=100)
+
+    assert bulk == (True, None, 0.0)
+    # 5개를 넘겨 쓴 빚(-5)을 갚고 1개가 충전될 때까지 대기
+    assert following[:2] == (False, USER) and 5 < following[2] <= 6
@@ -0,0 +1,143 @@
+"""
+Similar question index tests
+띄어쓰기/조사만 다른 질문을 찾고, 충분히 비슷하면 create_chapter가 기존 결과를 복사하는지 확인 (in-memory SQLite)
+"""
+
+import asyncio
+
+import pytest
+from sqlalchemy import select, func
+
+from api.v1.chapters import router as chapters_router
+from db import models
+from utils.generation_cache import generation_cache
+from utils import similar_question_index
+from utils.similar_question_index import SimilarQuestionIndex, normalize_title
+
+
+def test_normalize_title_ignores_spacing_particles_and_endings():
+    assert normalize_title("파이썬 리스트와 튜플 차이가 뭐예요?") == "파이썬리스트튜플차이"
+    assert normalize_title("파이썬에서 리스트랑 튜플의 차이는 뭔가요") == "파이썬리스트튜플차이"
+    assert normalize_title("Python decorator란?") == normalize_title("python  decorator가 뭐예요")
+
+
+def test_query_returns_most_similar_chapter():
+    index = SimilarQuestionIndex(maxsize=100, refresh_interval=60)
+    index.add(1, "파이썬 리스트와 튜플 차이가 뭐예요?")
+    index.add(2, "리스트와 딕셔너리 차이")
+    index.add(3, "파이썬 데코레이터가 뭐예요")
+
+    assert index.query("파이썬에서 리스트랑 튜플의 차이는 뭔가요", 0.7) == (1, 1.0)
+    assert index.query("리스트랑 딕셔너리의 차이는?", 0.7) == (2, 1.0)
+    assert index.query("자바 상속", 0.7) is None
+
+
+def test_index_evicts_oldest_and_removes():
+    index = SimilarQuestionIndex(maxsize=2, refresh_interval=60)
+    index.add(1, "리스트와 튜플 차이")
+    index.add(2, "파이썬 데코레이터")
+    index.add(3, "자바 인터페이스")
+
+    assert len(index) == 2
+    assert index.query("리스트와 튜플 차이", 0.5) is None
+
+    index.remove(2)
+    assert index.query("파이썬 데코레이터", 0.5) is None
+    assert index._buckets.keys() == {key for key in index._band_keys[3]}
+
+
+@pytest.fixture
+def completed_chapter(async_session_factory):
+    async def setup():
+        async with async_session_factory() as db:
+            member = models.Member(email="test@example.com", password="hashed")
+            db.add(member)
+            await db.flush()
+            original = models.Chapter(
+                owner_id=member.id, title="파이썬 리스트와 튜플 차이가 뭐예요?",
+                status=models.StatusEnum.completed, completion_mask=int(models.CompletionBit.all)
+            )
+            db.add(original)
+            await db.flush()
+            db.add_all([
+                models.Concept(chapter_id=original.id, title="리스트와 튜플", content="리스트는 가변, 튜플은 불변",
+                               is_complete=True),
+                models.Exercise(chapter_id=original.id, title="튜플을 수정해 보세요", contents="TypeError",
+                                is_complete=True),
+                models.Quiz(chapter_id=original.id, question="불변 자료형은?", options=["list", "tuple"],
+                            correct_answer="tuple", explanation="튜플은 불변", type=models.QuizTypeEnum.multiple),
+            ])
+            await db.commit()
+
+    asyncio.run(setup())
+
+
+@pytest.fixture
+def client(make_client, async_session_factory, completed_chapter, monkeypatch):
+    async def missing(title, description):
+        return None
+    monkeypatch.setattr(generation_cache, "get", missing)
+    monkeypatch.setattr(chapters_router, "similar_question_index", SimilarQuestionIndex(100, 60))
+    return make_client(chapters_router.router, async_db=async_session_factory)
+
+
+def count_outbox(async_session_factory) -> int:
+    async def count():
+        async with async_session_factory() as db:
+            return await db.scalar(select(func.count()).select_from(models.Outbox))
+    return asyncio.run(count())
+
+
+def test_near_duplicate_reuses_completed_chapter(client, async_session_factory):
+    response = client.post("/v1/chapter/", json={"owner_id": 1, "title": "파이썬에서 리스트랑 튜플의 차이는 뭔가요"})
+
+    body = response.json()
+    assert response.status_code == 200
+    assert body["status"] == "completed"
+    assert body["similar_chapter_id"] == 1
+    assert count_outbox(async_session_factory) == 0
+
+
+def test_less_similar_question_is_offered_but_generated(client, async_session_factory):
+    response = client.post("/v1/chapter/", json={"owner_id": 1, "title": "파이썬 리스트와 튜플 차이점 예시"})
+
+    body = response.json()
+    assert body["status"] == "pending"
+    assert body["similar_chapter_id"] == 1
+    assert 0.7 <= body["similarity"] < 0.9
+    assert count_outbox(async_session_factory) == 3
+
+
+def test_different_description_is_offered_but_generated(client, async_session_factory):
+    response = client.post("/v1/chapter/", json={
+        "owner_id": 1, "title": "파이썬에서 리스트랑 튜플의 차이는 뭔가요", "description": "성능 관점에서"
+    })
+
+    body = response.json()
+    assert body["status"] == "pending"
+    assert body["similar_chapter_id"] == 1
+    assert count_outbox(async_session_factory) == 3
+
+
+def test_sync_indexes_in_chunks(async_session_factory, completed_chapter, monkeypatch):
+    monkeypatch.setattr(similar_question_index, "SYNC_CHUNK_SIZE", 2)
+
+    async def add_chapters():
+        async with async_session_factory() as db:
+            db.add_all([
+                models.Chapter(owner_id=1, title=f"자료구조 질문 {index}번", status=models.StatusEnum.completed)
+                for index in range(4)
+            ])
+            await db.commit()
+    asyncio.run(add_chapters())
+
+    index = SimilarQuestionIndex(maxsize=3, refresh_interval=60)
+
+    async def sync():
+        async with async_session_factory() as db:
+            await index.sync(db)
+    asyncio.run(sync())
+
+    # 가장 최근에 완료된 3개만 색인
+    assert len(index) == 3
+    assert index.query("자료구조 질문 3번", 1.0) == (5, 1.0)
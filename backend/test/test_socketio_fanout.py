@@ -0,0 +1,117 @@
+"""
+Socket.IO multi-worker fan-out tests
+Redis 클라이언트 매니저로 한 워커의 emit이 다른 워커의 룸 멤버에게 전달되는지 확인
+
+로컬 Redis(SOCKETIO_MESSAGE_QUEUE)가 없으면 건너뜁니다.
+"""
+
+import asyncio
+import uuid
+
+import pytest
+import redis.asyncio as aioredis
+import socketio
+
+from core.config import settings
+from core.socketio_manager import create_client_manager
+from utils.room_registry import RoomRegistry
+
+
+pytestmark = pytest.mark.redis
+
+
+def create_worker(channel: str):
+    """워커 하나를 흉내 내는 AsyncServer (Engine.IO로 내보내는 패킷을 기록)"""
+    server = socketio.AsyncServer(
+        async_mode='asgi',
+        client_manager=create_client_manager("redis", channel=channel)
+    )
+    server.sent = []
+
+    async def send(eio_sid, data):
+        server.sent.append((eio_sid, data))
+
+    async def send_packet(eio_sid, pkt):
+        server.sent.append((eio_sid, pkt.data))
+
+    server.eio.send = send
+    server.eio.send_packet = send_packet
+    server.manager.set_server(server)
+    server.manager.initialize()
+    return server
+
+
+async def wait_for(predicate, timeout: float = 2.0):
+    deadline = asyncio.get_running_loop().time() + timeout
+    while not predicate():
+        if asyncio.get_running_loop().time() > deadline:
+            return False
+        await asyncio.sleep(0.01)
+    return True
+
+
+def test_emit_reaches_room_members_on_other_worker():
+    async def scenario():
+        channel = f"socketio-test-{uuid.uuid4().hex}"
+        worker_a = create_worker(channel)
+        worker_b = create_worker(channel)
+        await asyncio.sleep(0.2)  # pub/sub 구독 대기
+
+        sid = await worker_b.manager.connect("eio-b", "/")
+        await worker_b.manager.enter_room(sid, "/", "chapter_1")
+
+        await worker_a.emit("concept_completed", {"chapter_id": 1}, room="chapter_1")
+        delivered = await wait_for(lambda: worker_b.sent)
+
+        for worker in (worker_a, worker_b):
+            await worker.shutdown()
+        return delivered, worker_a.sent, worker_b.sent
+
+    delivered, sent_a, sent_b = asyncio.run(scenario())
+    assert delivered
+    assert len(sent_b) == 1
+    eio_sid, data = sent_b[0]
+    assert eio_sid == "eio-b"
+    assert '["concept_completed",{"chapter_id":1}]' in data
+    assert sent_a == []
+
+
+def test_enter_room_for_sid_on_other_worker():
+    async def scenario():
+        channel = f"socketio-test-{uuid.uuid4().hex}"
+        worker_a = create_worker(channel)
+        worker_b = create_worker(channel)
+        await asyncio.sleep(0.2)
+
+        sid = await worker_b.manager.connect("eio-b", "/")
+        # worker_a는 sid를 모르지만 pub/sub으로 worker_b에 룸 참여를 요청
+        await worker_a.enter_room(sid, "chapter_2")
+        joined = await wait_for(lambda: "chapter_2" in worker_b.rooms(sid))
+
+        for worker in (worker_a, worker_b):
+            await worker.shutdown()
+        return joined
+
+    assert asyncio.run(scenario())
+
+
+def test_room_registry_counts_members_across_workers():
+    async def scenario():
+        client = aioredis.Redis.from_url(settings.SOCKETIO_MESSAGE_QUEUE)
+        room = f"chapter_test_{uuid.uuid4().hex}"
+        # 워커마다 싱글톤을 갖지만 같은 Redis를 보므로 합산된 크기를 조회
+        worker_a, worker_b = RoomRegistry(client, ttl=60), RoomRegistry(client, ttl=60)
+        try:
+            await worker_a.join(room, "sid-a")
+            await worker_b.join(room, "sid-b")
+            joined = await worker_a.size(room)
+            await worker_b.leave_all("sid-b", [room])
+            sizes = await worker_b.sizes([room, f"{room}_empty"])
+        finally:
+            await client.delete(f"socketio:room:{room}")
+            await client.aclose()
+        return joined, sizes
+
+    joined, sizes = asyncio.run(scenario())
+    assert joined == 2
+    assert list(sizes.values()) == [1, 0]
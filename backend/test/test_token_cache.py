@@ -0,0 +1,163 @@
+"""
+Token cache tests
+로그아웃(로컬 무효화/다른 워커의 브로드캐스트) 직후 캐시된 토큰이 거부되고,
+epoch 가드·JWT exp 상한·LRU 크기 제한·구독 중이 아닐 때의 우회가 동작하는지 확인
+(Redis pub/sub은 메모리 내 가짜 클라이언트로 대체)
+"""
+
+import queue
+import threading
+import time
+
+import pytest
+
+from utils.token_cache import TokenCache, INVALIDATE_CHANNEL
+
+
+class FakePubSub:
+    def __init__(self, server):
+        self.server = server
+        self.messages = queue.Queue()
+
+    def subscribe(self, channel):
+        with self.server.lock:
+            self.server.subscribers.setdefault(channel, []).append(self)
+
+    def get_message(self, timeout=0.0):
+        try:
+            return self.messages.get(timeout=min(timeout, 0.05))
+        except queue.Empty:
+            return None
+
+    def close(self):
+        with self.server.lock:
+            for subscribers in self.server.subscribers.values():
+                if self in subscribers:
+                    subscribers.remove(self)
+
+
+class FakeRedis:
+    """워커 간에 공유되는 pub/sub 서버 흉내 (publish/pubsub만 지원)"""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.subscribers = {}
+
+    def pubsub(self, ignore_subscribe_messages=False):
+        return FakePubSub(self)
+
+    def publish(self, channel, data):
+        with self.lock:
+            subscribers = list(self.subscribers.get(channel, ()))
+        for pubsub in subscribers:
+            pubsub.messages.put({"type": "message", "channel": channel, "data": data.encode()})
+        return len(subscribers)
+
+
+def wait_until(condition, timeout=2.0):
+    deadline = time.monotonic() + timeout
+    while not condition():
+        if time.monotonic() > deadline:
+            raise AssertionError("condition not met in time")
+        time.sleep(0.01)
+
+
+@pytest.fixture
+def server():
+    return FakeRedis()
+
+
+@pytest.fixture
+def make_cache(server):
+    caches = []
+
+    def make(maxsize=100, ttl=60, listen=True):
+        cache = TokenCache(server, None, maxsize=maxsize, ttl=ttl)
+        caches.append(cache)
+        if listen:
+            cache.start_listener()
+            wait_until(lambda: cache._subscribed)
+        return cache
+
+    yield make
+    for cache in caches:
+        cache.stop_listener()
+
+
+def login(cache, token, user_id):
+    cache.set(token, {"user_id": user_id, "email": f"user{user_id}@example.com"}, cache.epoch)
+
+
+def test_cached_token_rejected_after_invalidate_user(make_cache):
+    cache = make_cache()
+    login(cache, "token-a", 1)
+    login(cache, "token-b", 2)
+    assert cache.get("token-a")["user_id"] == 1
+
+    cache.invalidate_user(1)
+
+    assert cache.get("token-a") is None
+    assert cache.get("token-b")["user_id"] == 2
+    assert cache.stats["invalidated"] == 1
+
+
+def test_logout_broadcast_reaches_other_workers(make_cache, server):
+    worker_a = make_cache()
+    worker_b = make_cache()
+    login(worker_a, "token-a", 1)
+    login(worker_b, "token-a", 1)
+
+    worker_b.broadcast_invalidation(1)
+
+    # 발행한 워커는 즉시, 다른 워커는 pub/sub 메시지를 받는 대로 거부
+    assert worker_b.get("token-a") is None
+    wait_until(lambda: worker_a.get("token-a") is None)
+    assert server.subscribers[INVALIDATE_CHANNEL]
+
+
+def test_set_after_concurrent_invalidation_is_dropped(make_cache):
+    cache = make_cache()
+    # 검증 시작 시점의 epoch를 읽은 뒤, 저장 전에 로그아웃이 일어난 경우
+    epoch = cache.epoch
+    cache.invalidate_user(1)
+    cache.set("token-a", {"user_id": 1}, epoch)
+
+    assert cache.get("token-a") is None
+    cache.set("token-a", {"user_id": 1}, cache.epoch)
+    assert cache.get("token-a") is not None
+
+
+def test_ttl_capped_at_token_exp(make_cache):
+    cache = make_cache(ttl=60)
+    cache.set("expiring", {"user_id": 1}, cache.epoch, token_exp=time.time() + 0.1)
+    cache.set("expired", {"user_id": 1}, cache.epoch, token_exp=time.time() - 1)
+
+    assert cache.get("expiring") is not None
+    assert cache.get("expired") is None
+    time.sleep(0.15)
+    assert cache.get("expiring") is None
+
+
+def test_lru_bound_evicts_least_recently_used(make_cache):
+    cache = make_cache(maxsize=2)
+    login(cache, "token-a", 1)
+    login(cache, "token-b", 2)
+    cache.get("token-a")
+    login(cache, "token-c", 3)
+
+    assert cache.get("token-b") is None
+    assert cache.get("token-a") is not None and cache.get("token-c") is not None
+    assert len(cache._entries) == 2 and 2 not in cache._by_user
+
+
+def test_cache_bypassed_while_not_subscribed(make_cache):
+    idle = make_cache(listen=False)
+    login(idle, "token-a", 1)
+    assert idle.get("token-a") is None and not idle._entries
+
+    cache = make_cache()
+    login(cache, "token-a", 1)
+    assert cache.get("token-a") is not None
+    # 구독이 끊기면 그동안의 무효화를 받을 수 없으므로 남은 항목도 쓰지 않음
+    cache.stop_listener()
+    assert cache.get("token-a") is None
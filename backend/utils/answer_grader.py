@@ -0,0 +1,188 @@
+"""
+로컬 답안 채점 엔진
+QuizGrader(n8n + Gemini)를 부르지 않고 대부분의 답안을 채점하고, 판정 신뢰도(confidence)를 함께 반환
+
+- boolean: O/X, 참/거짓, true/false 등 표현을 통일해 비교
+- 객관식: 앞뒤 공백/대소문자만 무시하고 보기 문구 그대로 비교
+- 숫자: 정규화 전 원문에서 쉼표/단위를 정리해 허용 오차 안에서 비교
+- 단답형: 띄어쓰기/문장부호/어미("~입니다", "~이요")를 정리한 뒤 한글을 자모로 분해해 편집 거리로 비교
+  ("튜플" vs "튜풀" 같은 오타는 정답, 전혀 다른 답은 오답으로 높은 신뢰도 판정)
+- 애매한 답안(유사도가 중간이거나 너무 긴 답안)은 신뢰도가 낮아 QuizGrader로 넘김
+"""
+
+import re
+import unicodedata
+from typing import Dict, Any, Optional, Tuple
+from core.config import settings
+from db.models import QuizTypeEnum
+from utils.answer_key_cache import normalize_answer
+
+# 한글 음절 → 초성/중성/종성 (유니코드 한글 음절 = 0xAC00 + (초성 * 21 + 중성) * 28 + 종성)
+_HANGUL_BASE = 0xAC00
+_HANGUL_END = 0xD7A3
+_CHOSEONG = "ㄱㄲㄴㄷㄸㄹㅁㅂㅃㅅㅆㅇㅈㅉㅊㅋㅌㅍㅎ"
+_JUNGSEONG = "ㅏㅐㅑㅒㅓㅔㅕㅖㅗㅘㅙㅚㅛㅜㅝㅞㅟㅠㅡㅢㅣ"
+_JONGSEONG = ("", "ㄱ", "ㄲ", "ㄳ", "ㄴ", "ㄵ", "ㄶ", "ㄷ", "ㄹ", "ㄺ", "ㄻ", "ㄼ", "ㄽ", "ㄾ", "ㄿ", "ㅀ",
+              "ㅁ", "ㅂ", "ㅄ", "ㅅ", "ㅆ", "ㅇ", "ㅈ", "ㅊ", "ㅋ", "ㅌ", "ㅍ", "ㅎ")
+
+# 숫자 사이의 "."/","는 남김 ("1.5"와 "15"가 같아지지 않도록)
+_IGNORED = re.compile(r"[\s!?~'\"`·…:;]+|(?<!\d)[.,]|[.,](?!\d)")
+# 답 끝에 붙는 서술형 어미 (떼고 남은 부분이 있을 때만 제거)
+_ANSWER_ENDINGS = ("입니다", "이에요", "예요", "이요", "이다", "요")
+_DIGITS = re.compile(r"\d+(?:[.,]\d+)*")
+_NUMBER = re.compile(r"([-+]?\d[\d,]*(?:\.\d+)?|[-+]?\.\d+)([^\d]{0,3})")
+
+_TRUE = {"o", "ㅇ", "○", "◯", "true", "t", "참", "맞다", "맞음", "맞아", "맞아요", "맞습니다", "예", "네", "yes", "y"}
+_FALSE = {"x", "×", "✕", "false", "f", "거짓", "틀리다", "틀림", "틀려", "틀려요", "틀립니다",
+          "아니다", "아님", "아니요", "아니오", "no", "n"}
+
+# 편집 거리 비교를 하지 않는 최대 길이 (자모 기준 O(n*m)이므로 긴 서술형은 QuizGrader로)
+MAX_LOCAL_LENGTH = 100
+
+
+def decompose_jamo(text: str) -> str:
+    """한글 음절을 자모로 분해 ("튜플" → "ㅌㅠㅍㅡㄹ"), 한글이 아닌 글자는 그대로"""
+    result = []
+    for char in text:
+        code = ord(char)
+        if _HANGUL_BASE <= code <= _HANGUL_END:
+            offset = code - _HANGUL_BASE
+            result.append(_CHOSEONG[offset // 588])
+            result.append(_JUNGSEONG[(offset % 588) // 28])
+            result.append(_JONGSEONG[offset % 28])
+        else:
+            result.append(char)
+    return "".join(result)
+
+
+def normalize_short_answer(answer: Optional[str]) -> str:
+    """
+    단답형 답안 정규화 (전각/반각 통일, 소문자, 띄어쓰기/문장부호 제거, 끝의 어미 제거)
+    숫자 사이의 "."/","는 지우지 않습니다.
+
+    "튜플 입니다." → "튜플", "len()" → "len"
+    """
+    if not answer:
+        return ""
+    text = _strip_ending(_IGNORED.sub("", unicodedata.normalize("NFKC", answer).lower()))
+    if text.endswith("()") and len(text) > 2:
+        text = text[:-2]
+    return text
+
+
+def _strip_ending(text: str) -> str:
+    for ending in _ANSWER_ENDINGS:
+        if text.endswith(ending) and len(text) > len(ending):
+            return text[:-len(ending)]
+    return text
+
+
+def _has_hangul(text: str) -> bool:
+    return any(_HANGUL_BASE <= ord(char) <= _HANGUL_END for char in text)
+
+
+def parse_boolean(answer: str) -> Optional[bool]:
+    """O/X 답안 해석 (알 수 없는 표현이면 None)"""
+    text = normalize_short_answer(answer)
+    if text in _TRUE:
+        return True
+    if text in _FALSE:
+        return False
+    return None
+
+
+def parse_number(answer: str) -> Optional[Tuple[float, str]]:
+    """숫자 답안 해석 ("1,000개" → (1000.0, "개"), 숫자가 아니면 None)"""
+    # 소수점이 지워지지 않도록 공백과 끝의 마침표만 정리
+    text = re.sub(r"\s+", "", unicodedata.normalize("NFKC", answer or "").lower()).rstrip(".")
+    match = _NUMBER.fullmatch(_strip_ending(text))
+    if not match:
+        return None
+    try:
+        return float(match.group(1).replace(",", "")), match.group(2)
+    except ValueError:
+        return None
+
+
+def edit_distance(a: str, b: str) -> int:
+    """Levenshtein 거리 (행 2개만 유지)"""
+    if len(a) < len(b):
+        a, b = b, a
+    previous = list(range(len(b) + 1))
+    for i, char_a in enumerate(a, 1):
+        current = [i]
+        for j, char_b in enumerate(b, 1):
+            current.append(min(
+                previous[j] + 1,
+                current[j - 1] + 1,
+                previous[j - 1] + (char_a != char_b)
+            ))
+        previous = current
+    return previous[-1]
+
+
+def jamo_similarity(a: str, b: str) -> float:
+    """자모 단위 편집 거리 유사도 (0~1)"""
+    a, b = decompose_jamo(a), decompose_jamo(b)
+    longest = max(len(a), len(b))
+    if longest == 0:
+        return 1.0
+    return 1 - edit_distance(a, b) / longest
+
+
+def grade_answer(answer_key: Dict[str, Any], answer: str) -> Tuple[bool, float]:
+    """
+    답안 로컬 채점
+
+    Args:
+        answer_key: load_answer_keys()의 정답 ({"answer", "type", ...})
+        answer: 학생 답안
+
+    Returns:
+        (정답 여부, 판정 신뢰도 0~1) - 신뢰도가 QUIZ_ESCALATION_CONFIDENCE 미만이면 QuizGrader 대상
+    """
+    expected = answer_key["answer"]
+    quiz_type = answer_key.get("type")
+
+    if quiz_type == QuizTypeEnum.boolean.value:
+        expected_bool, actual_bool = parse_boolean(expected), parse_boolean(answer)
+        if expected_bool is not None and actual_bool is not None:
+            return expected_bool == actual_bool, 1.0
+
+    # 객관식은 보기 문구가 정해져 있으므로 앞뒤 공백/대소문자만 무시하고 그대로 비교
+    if quiz_type == QuizTypeEnum.multiple.value:
+        return normalize_answer(answer or "") == normalize_answer(expected), 1.0
+
+    # 숫자는 문장부호를 지우기 전의 원문으로 비교 ("1.5"와 "15"는 다른 답)
+    expected_number, actual_number = parse_number(expected), parse_number(answer)
+    if expected_number is not None and actual_number is not None:
+        (expected_value, expected_unit), (actual_value, actual_unit) = expected_number, actual_number
+        if expected_unit and actual_unit and expected_unit != actual_unit:
+            return False, 0.5
+        tolerance = max(settings.QUIZ_NUMERIC_ABS_TOLERANCE, settings.QUIZ_NUMERIC_REL_TOLERANCE * abs(expected_value))
+        return abs(expected_value - actual_value) <= tolerance, 1.0
+
+    expected_text, actual_text = normalize_short_answer(expected), normalize_short_answer(answer)
+    if expected_text == actual_text:
+        return True, 1.0
+    if not actual_text:
+        return False, 1.0
+
+    if quiz_type == QuizTypeEnum.boolean.value or max(len(expected_text), len(actual_text)) > MAX_LOCAL_LENGTH:
+        return False, 0.0
+    # "python3.8" vs "python38"처럼 들어 있는 숫자가 다르면 오타가 아니라 다른 답
+    expected_digits, actual_digits = _DIGITS.findall(expected_text), _DIGITS.findall(actual_text)
+    if expected_digits and actual_digits and expected_digits != actual_digits:
+        return False, 1.0
+    # "tuple" vs "튜플"처럼 표기 문자가 다르면 편집 거리로 판단할 수 없음
+    if _has_hangul(expected_text) != _has_hangul(actual_text):
+        return False, 0.0
+
+    similarity = jamo_similarity(expected_text, actual_text)
+    if similarity >= settings.QUIZ_LOCAL_ACCEPT_SIMILARITY:
+        return True, similarity
+    if similarity <= settings.QUIZ_LOCAL_REJECT_SIMILARITY:
+        return False, 1 - similarity
+    # 애매한 구간: 가까운 쪽으로 판정하되 신뢰도는 낮게
+    midpoint = (settings.QUIZ_LOCAL_ACCEPT_SIMILARITY + settings.QUIZ_LOCAL_REJECT_SIMILARITY) / 2
+    return similarity >= midpoint, 0.5
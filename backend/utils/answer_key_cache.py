@@ -0,0 +1,129 @@
+"""
+퀴즈 정답 캐시
+채점에 필요한 정규화된 정답과 해설을 챕터별로 Redis에 캐싱 (read-through)
+
+키 구조:
+    learning_page:version:{chapter_id}           → 챕터 버전 (학습 페이지 캐시와 공유)
+    answer_key:v{SCHEMA}:{chapter_id}:{ver}      → {"answer": 정규화된 정답, "explanation": 해설,
+                                                    "type": 퀴즈 유형, "question": 문제 (QuizGrader 재채점용)}
+
+챕터 버전을 학습 페이지 캐시와 공유하므로 quiz_finish_webhook의 무효화(버전 증가)가
+두 캐시에 함께 적용되고, 무효화 직전에 읽은 요청이 늦게 채운 값은 이전 버전 키에 남아 보이지 않습니다.
+정답 TTL이 학습 페이지보다 길어도, 버전은 재사용되지 않는 고유 값이라 버전 키가 사라진 뒤
+예전 정답이 다시 보이지 않습니다.
+아직 생성되지 않은 퀴즈는 캐싱하지 않습니다.
+"""
+
+import json
+import logging
+from typing import Dict, Iterable, Optional, Tuple, Any
+import redis
+from core.config import settings
+from db.database import redis_client
+from utils.learning_page_cache import VERSION_KEY, new_version
+
+logger = logging.getLogger(__name__)
+
+# 정답 캐시 형식이 바뀌면 올려서 이전 형식의 캐시를 무시
+CACHE_SCHEMA_VERSION = 2
+
+ANSWER_KEY_PREFIX = f"answer_key:v{CACHE_SCHEMA_VERSION}:{{chapter_id}}:"
+
+# 챕터 여러 개의 버전 조회 + 정답 조회를 한 번의 왕복으로 처리
+# KEYS[i]: 버전 키, ARGV[2i-1]: 정답 키 prefix, ARGV[2i]: 버전 키가 없을 때 발급할 새 버전
+_GET_MANY_SCRIPT = """
+local result = {}
+for i = 1, #KEYS do
+    local version = redis.call('GET', KEYS[i])
+    if not version then
+        version = ARGV[2 * i]
+        redis.call('SET', KEYS[i], version)
+    end
+    result[i] = {version, redis.call('GET', ARGV[2 * i - 1] .. version)}
+end
+return result
+"""
+
+
+def normalize_answer(answer: str) -> str:
+    """채점용 정답 정규화 (앞뒤 공백 제거, 대소문자 무시)"""
+    return answer.strip().lower()
+
+
+class AnswerKeyCache:
+    """
+    퀴즈 정답 Redis 캐시
+
+    Redis 오류 시에는 캐시를 건너뛰고(fail-open) DB에서 조회하도록 빈 결과를 반환합니다.
+
+    Args:
+        client: Redis 클라이언트
+        ttl: 캐시 유지 시간 (초)
+    """
+
+    def __init__(self, client: redis.Redis, ttl: int):
+        self.client = client
+        self.ttl = ttl
+        self._get_many_script = client.register_script(_GET_MANY_SCRIPT)
+        self.stats = {
+            "hit": 0,
+            "miss": 0,
+            "error": 0,
+        }
+
+    def get_many(self, chapter_ids: Iterable[int]) -> Tuple[Dict[int, Dict[str, Any]], Dict[int, str]]:
+        """
+        여러 챕터의 정답 조회
+
+        Returns:
+            (캐시된 정답 {chapter_id: {"answer", "explanation"}},
+             캐시에 없는 챕터의 현재 버전 {chapter_id: version} - set_many()에 그대로 전달)
+        """
+        chapter_ids = list(chapter_ids)
+        if not chapter_ids:
+            return {}, {}
+        try:
+            rows = self._get_many_script(
+                keys=[VERSION_KEY.format(chapter_id=chapter_id) for chapter_id in chapter_ids],
+                args=[arg for chapter_id in chapter_ids
+                      for arg in (ANSWER_KEY_PREFIX.format(chapter_id=chapter_id), new_version())]
+            )
+        except redis.RedisError as e:
+            self.stats["error"] += 1
+            logger.warning(f"정답 캐시 조회 실패 - Chapters: {chapter_ids}, Error: {e}")
+            return {}, {}
+
+        found = {}
+        missing = {}
+        for chapter_id, (version, cached) in zip(chapter_ids, rows):
+            if isinstance(version, bytes):
+                version = version.decode()
+            if cached is None:
+                missing[chapter_id] = version
+            else:
+                found[chapter_id] = json.loads(cached)
+        self.stats["hit"] += len(found)
+        self.stats["miss"] += len(missing)
+        return found, missing
+
+    def set_many(self, answer_keys: Dict[int, Dict[str, Any]], versions: Dict[int, Optional[str]]):
+        """조회 시점의 버전 키에 정답 저장 (pipeline 1회 왕복, 버전이 없는 챕터는 저장하지 않음)"""
+        try:
+            pipe = self.client.pipeline(transaction=False)
+            for chapter_id, answer_key in answer_keys.items():
+                version = versions.get(chapter_id)
+                if version is None:
+                    continue
+                pipe.setex(
+                    ANSWER_KEY_PREFIX.format(chapter_id=chapter_id) + version,
+                    self.ttl,
+                    json.dumps(answer_key, ensure_ascii=False)
+                )
+            pipe.execute()
+        except redis.RedisError as e:
+            self.stats["error"] += 1
+            logger.warning(f"정답 캐시 저장 실패 - Chapters: {list(answer_keys)}, Error: {e}")
+
+
+# 싱글톤 인스턴스
+answer_key_cache = AnswerKeyCache(redis_client, settings.ANSWER_KEY_CACHE_TTL)
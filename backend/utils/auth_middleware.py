@@ -9,6 +9,7 @@ from jose import JWTError, jwt
 import redis
 from core.config import settings
 from db.database import get_redis
+from utils.token_cache import token_cache
 from typing import Optional, Dict, Any
 
 # HTTP Bearer 토큰
@@ -17,6 +18,7 @@ security = HTTPBearer()
 def verify_token(token: str, redis_client: redis.Redis) -> Dict[str, Any]:
     """
     JWT 토큰 검증 및 Redis 확인
+    검증 결과는 프로세스 내 캐시(token_cache)에 저장되어 이후 요청은 네트워크 왕복 없이 처리됩니다.
     
     Args:
         token: JWT 토큰
@@ -28,6 +30,11 @@ def verify_token(token: str, redis_client: redis.Redis) -> Dict[str, Any]:
     Raises:
         HTTPException: 토큰이 유효하지 않거나 만료된 경우
     """
+    cached = token_cache.get(token)
+    if cached is not None:
+        return cached
+    epoch = token_cache.epoch
+
     try:
         # JWT 토큰 디코딩
         payload = jwt.decode(token, settings.SECRET_KEY, algorithms=[settings.ALGORITHM])
@@ -50,17 +57,21 @@ def verify_token(token: str, redis_client: redis.Redis) -> Dict[str, Any]:
             )
         
         # 토큰 일치 확인
-        if stored_token.decode() != token:
+        if isinstance(stored_token, bytes):
+            stored_token = stored_token.decode()
+        if stored_token != token:
             raise HTTPException(
                 status_code=status.HTTP_401_UNAUTHORIZED,
                 detail="Invalid token",
                 headers={"WWW-Authenticate": "Bearer"},
             )
         
-        return {
+        user_info = {
             "user_id": int(user_id),
             "email": payload.get("email")
         }
+        token_cache.set(token, user_info, epoch, payload.get("exp"))
+        return user_info
         
     except JWTError:
         raise HTTPException(
@@ -0,0 +1,131 @@
+"""
+Socket.IO 상태 이벤트 발송 큐
+요청 경로에서 emit을 기다리지 않도록 상태 이벤트를 큐에 넣고 백그라운드 태스크가 모아서 발송
+
+- 같은 챕터의 이벤트는 flush 주기 동안 모아 chapter_status 프레임 하나로 발송
+- 참여자가 없는 룸은 건너뜀 (챕터 생성 직후에는 보통 아직 아무도 join하지 않음)
+- 대기 중인 챕터 수가 상한을 넘으면 새 챕터의 이벤트는 버림 (상태는 학습 페이지 조회로 확인 가능)
+
+chapter_status 프레임:
+    {
+        'chapter_id': 1,
+        'status': 'processing',          # 마지막 이벤트의 상태
+        'events': [{'event': 'chapter_processing_started', ...}, ...]
+    }
+
+백그라운드 태스크는 API 서버 lifespan에서 start()/stop()으로 관리합니다.
+"""
+
+import asyncio
+import logging
+from typing import Optional, Dict, List, Any
+from core.config import settings
+from core.socketio_manager import sio, chapter_room, get_room_sizes
+
+logger = logging.getLogger(__name__)
+
+
+class EmissionQueue:
+    """
+    챕터별로 이벤트를 모으는 발송 큐 (이벤트 루프 스레드에서만 사용)
+
+    Args:
+        maxsize: 동시에 대기할 수 있는 최대 챕터 수
+        flush_interval: 첫 이벤트 이후 발송까지 이벤트를 모으는 시간 (초)
+    """
+
+    def __init__(self, maxsize: int, flush_interval: float):
+        self.maxsize = maxsize
+        self.flush_interval = flush_interval
+        self._pending: Dict[int, List[Dict[str, Any]]] = {}
+        self._wakeup = asyncio.Event()
+        self._task: Optional[asyncio.Task] = None
+        self.stats = {
+            "enqueued": 0,
+            "coalesced": 0,
+            "frames": 0,
+            "skipped_empty": 0,
+            "dropped": 0,
+        }
+
+    def enqueue(self, chapter_id: int, event: str, data: Dict[str, Any]) -> bool:
+        """
+        이벤트 적재 (대기하지 않음)
+
+        Returns:
+            bool: 적재 여부 (큐가 가득 차 버려졌으면 False)
+        """
+        events = self._pending.get(chapter_id)
+        if events is None:
+            if len(self._pending) >= self.maxsize:
+                self.stats["dropped"] += 1
+                logger.warning(f"상태 이벤트 큐 가득 참, 이벤트 버림 - Chapter: {chapter_id}, Event: {event}")
+                return False
+            events = self._pending[chapter_id] = []
+        else:
+            self.stats["coalesced"] += 1
+        events.append({'event': event, **data})
+        self.stats["enqueued"] += 1
+        self._wakeup.set()
+        return True
+
+    async def flush(self):
+        """대기 중인 이벤트를 챕터별 프레임으로 발송"""
+        pending, self._pending = self._pending, {}
+        if not pending:
+            return
+
+        rooms = {chapter_id: chapter_room(chapter_id) for chapter_id in pending}
+        sizes = await get_room_sizes(rooms.values())
+
+        emits = []
+        for chapter_id, events in pending.items():
+            room = rooms[chapter_id]
+            # 조회 실패(-1)면 발송
+            if sizes.get(room) == 0:
+                self.stats["skipped_empty"] += 1
+                continue
+            frame = {
+                'chapter_id': chapter_id,
+                'status': events[-1].get('status'),
+                'events': events
+            }
+            emits.append(sio.emit('chapter_status', frame, room=room))
+
+        results = await asyncio.gather(*emits, return_exceptions=True)
+        for result in results:
+            if isinstance(result, Exception):
+                logger.error(f"chapter_status 발송 실패: {result}")
+        self.stats["frames"] += len(emits)
+        logger.debug(f"chapter_status 발송 - Frames: {len(emits)}, Chapters: {len(pending)}")
+
+    def start(self):
+        """백그라운드 발송 태스크 시작"""
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self):
+        """발송 태스크 정지 후 남은 이벤트 발송"""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        await self.flush()
+
+    async def _run(self):
+        while True:
+            await self._wakeup.wait()
+            # 같은 챕터의 후속 이벤트가 한 프레임에 들어가도록 잠시 대기
+            await asyncio.sleep(self.flush_interval)
+            self._wakeup.clear()
+            try:
+                await self.flush()
+            except Exception as e:
+                logger.error(f"상태 이벤트 발송 오류: {e}")
+
+
+# 싱글톤 인스턴스
+emission_queue = EmissionQueue(settings.SOCKETIO_EMIT_QUEUE_MAXSIZE, settings.SOCKETIO_EMIT_FLUSH_INTERVAL)
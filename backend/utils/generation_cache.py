@@ -0,0 +1,176 @@
+"""
+AI 생성 결과 캐시 (content-addressed)
+같은 질문이 반복되면 n8n/Gemini 생성을 다시 요청하지 않고 저장된 결과를 새 챕터에 복사
+
+키 구조:
+    generation_cache:{sha256(워크플로 버전 + 정규화된 제목 + 정규화된 설명)}
+        → {"concept": {...}, "exercise": {...}, "quiz": {...}}
+
+- 챕터의 세 리소스가 모두 완료되면(all_completed) 결과를 저장
+- create_chapter는 저장된 결과가 있으면 Kafka 요청 없이 바로 완료된 챕터를 생성
+- 프롬프트/워크플로가 바뀌면 GENERATION_WORKFLOW_VERSION을 올려 이전 결과를 무시
+- 항목마다 TTL을 두므로 Redis maxmemory-policy가 volatile-lru/allkeys-lru면 오래 쓰이지 않은 결과부터 제거됨
+"""
+
+import hashlib
+import json
+import logging
+import re
+import unicodedata
+from typing import Optional, Dict, Any, Iterable, List
+import redis
+import redis.asyncio as aioredis
+from sqlalchemy import select
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import joinedload
+from core.config import settings
+from db import models
+from db.database import async_redis_client
+
+logger = logging.getLogger(__name__)
+
+CACHE_KEY = "generation_cache:{digest}"
+
+_WHITESPACE = re.compile(r"\s+")
+_TRAILING_PUNCTUATION = re.compile(r"[\s?!.~…]+$")
+
+
+def normalize_question(text: Optional[str]) -> str:
+    """
+    질문 정규화 (전각/반각 통일, 대소문자 무시, 공백 정리, 끝의 물음표/마침표 제거)
+
+    "파이썬 리스트와 튜플 차이가 뭐예요?" 와 "파이썬  리스트와 튜플 차이가 뭐예요" 는 같은 키가 됩니다.
+    """
+    if not text:
+        return ""
+    text = unicodedata.normalize("NFKC", text).lower()
+    text = _WHITESPACE.sub(" ", text).strip()
+    return _TRAILING_PUNCTUATION.sub("", text)
+
+
+def question_digest(title: str, description: Optional[str]) -> str:
+    """질문 내용 해시 (캐시 키)"""
+    raw = "\n".join((settings.GENERATION_WORKFLOW_VERSION, normalize_question(title), normalize_question(description)))
+    return hashlib.sha256(raw.encode()).hexdigest()
+
+
+def serialize_generation(chapter: models.Chapter) -> Optional[Dict[str, Any]]:
+    """concept/exercise/quiz가 로드된 챕터의 생성 결과 (하나라도 비어 있으면 None)"""
+    concept, exercise, quiz = chapter.concept, chapter.exercise, chapter.quiz
+    if not (concept and concept.content and exercise and exercise.title and quiz and quiz.question):
+        return None
+    return {
+        "concept": {"title": concept.title, "content": concept.content},
+        "exercise": {"title": exercise.title, "contents": exercise.contents},
+        "quiz": {
+            "question": quiz.question,
+            "options": quiz.options,
+            "correct_answer": quiz.correct_answer,
+            "explanation": quiz.explanation,
+            "type": quiz.type.value if quiz.type else None
+        }
+    }
+
+
+async def load_chapters_with_resources(chapter_ids: Iterable[int], db: AsyncSession) -> List[models.Chapter]:
+    """concept/exercise/quiz를 함께 로드한 챕터 목록 (SELECT 1회)"""
+    return list((await db.scalars(
+        select(models.Chapter)
+        .options(
+            joinedload(models.Chapter.concept),
+            joinedload(models.Chapter.exercise),
+            joinedload(models.Chapter.quiz)
+        )
+        .where(models.Chapter.id.in_(list(chapter_ids)))
+    )).unique().all())
+
+
+class GenerationCache:
+    """
+    AI 생성 결과 Redis 캐시
+
+    Redis 오류 시에는 캐시를 건너뛰고(fail-open) 평소처럼 생성을 요청합니다.
+
+    Args:
+        client: 비동기 Redis 클라이언트
+        ttl: 결과 유지 시간 (초)
+    """
+
+    def __init__(self, client: aioredis.Redis, ttl: int):
+        self.client = client
+        self.ttl = ttl
+        self.stats = {
+            "hit": 0,
+            "miss": 0,
+            "stored": 0,
+            "error": 0,
+        }
+
+    async def get(self, title: str, description: Optional[str]) -> Optional[Dict[str, Any]]:
+        """저장된 생성 결과 조회 (없으면 None)"""
+        key = CACHE_KEY.format(digest=question_digest(title, description))
+        try:
+            cached = await self.client.get(key)
+        except redis.RedisError as e:
+            self.stats["error"] += 1
+            logger.warning(f"생성 결과 캐시 조회 실패 - Error: {e}")
+            return None
+
+        if cached is None:
+            self.stats["miss"] += 1
+            return None
+        self.stats["hit"] += 1
+        return json.loads(cached)
+
+    async def store_completed(self, chapter_ids: Iterable[int], db: AsyncSession) -> List[models.Chapter]:
+        """
+        완료된 챕터들의 생성 결과 저장 (SELECT 1회 + pipeline 1회 왕복)
+        같은 질문의 결과가 이미 있으면 TTL만 갱신됩니다.
+
+        Returns:
+            List[Chapter]: 결과를 저장한 챕터 (실패 시 빈 목록)
+        """
+        chapter_ids = list(chapter_ids)
+        if not chapter_ids:
+            return []
+        try:
+            chapters = await load_chapters_with_resources(chapter_ids, db)
+
+            pipe = self.client.pipeline(transaction=False)
+            stored = []
+            for chapter in chapters:
+                generation = serialize_generation(chapter)
+                if generation is None:
+                    continue
+                pipe.setex(
+                    CACHE_KEY.format(digest=question_digest(chapter.title, chapter.description)),
+                    self.ttl,
+                    json.dumps(generation, ensure_ascii=False)
+                )
+                stored.append(chapter)
+            await pipe.execute()
+            self.stats["stored"] += len(stored)
+            return stored
+        except (redis.RedisError, SQLAlchemyError) as e:
+            # 챕터 완료는 이미 커밋되었으므로 캐싱 실패는 로그만 남김
+            self.stats["error"] += 1
+            logger.warning(f"생성 결과 캐시 저장 실패 - Chapters: {chapter_ids}, Error: {e}")
+            return []
+
+    def get_metrics(self) -> Dict[str, Any]:
+        """
+        캐시 지표
+
+        Returns:
+            Dict: hit/miss/stored/error와 hit_rate (조회가 없으면 0.0)
+        """
+        lookups = self.stats["hit"] + self.stats["miss"]
+        return {
+            **self.stats,
+            "hit_rate": self.stats["hit"] / lookups if lookups else 0.0,
+        }
+
+
+# 싱글톤 인스턴스
+generation_cache = GenerationCache(async_redis_client, settings.GENERATION_CACHE_TTL)
@@ -0,0 +1,350 @@
+"""
+AI 생성 요청 스케줄러
+outbox_relay가 n8n-requests로 발송할 순서와 시점을 정함
+
+- 우선순위 등급(high: 개념 정리, normal: 실습/퀴즈)과 user_id별로 흐름(flow)을 나누고
+  가중 공정 큐(start-time fair queuing)로 꺼냄
+  → 교사가 질문 500개를 일괄 등록해도 뒤에 등록한 학생의 요청이 그 뒤에 줄 서지 않음
+  → 같은 사용자 안에서는 high가 normal보다 PRIORITY_WEIGHTS 배만큼 자주 발송됨
+- 발송 중인 생성 수를 전체/사용자별로 제한 (Gemini 할당량)
+  발송 시 Redis에 임대(lease)를 기록하고 완료 webhook/kafka_consumer가 반납,
+  완료 응답이 오지 않은 임대는 GENERATION_LEASE_TTL 후 자동 회수
+- 등급별 대기열 길이를 Redis에 기록해 API 서버의 /metrics에서 조회
+
+키 구조:
+    generation:inflight                 → 발송 중인 생성 (zset, member="{chapter_id}:{workflow_type}", score=발송 시각)
+    generation:inflight:user:{user_id}  → 사용자별 발송 중인 생성 (zset)
+    generation:inflight:owner           → member → user_id (hash, 반납/회수 시 사용자 zset을 찾기 위함)
+    generation:queue_depth              → 등급별 대기 수 (hash, relay가 갱신)
+"""
+
+import logging
+import time
+from collections import deque
+from typing import Dict, Iterable, List, Set, Tuple
+import redis
+import redis.asyncio as aioredis
+from core.config import settings
+from db.database import async_redis_client, redis_client
+
+logger = logging.getLogger(__name__)
+
+HIGH = "high"
+NORMAL = "normal"
+
+# 등급별 가중치 (같은 사용자에서 high 4건 발송될 때 normal 1건)
+PRIORITY_WEIGHTS = {HIGH: 4, NORMAL: 1}
+
+INFLIGHT_KEY = "generation:inflight"
+USER_INFLIGHT_PREFIX = "generation:inflight:user:"
+OWNER_KEY = "generation:inflight:owner"
+QUEUE_DEPTH_KEY = "generation:queue_depth"
+
+# 만료된 임대 회수 (KEYS[1]=전체 zset, KEYS[2]=owner hash, ARGV[1]=만료 기준 시각, ARGV[2]=사용자 키 prefix)
+_PURGE = """
+local expired = redis.call('ZRANGEBYSCORE', KEYS[1], '-inf', ARGV[1])
+for _, member in ipairs(expired) do
+    local owner = redis.call('HGET', KEYS[2], member)
+    if owner then
+        redis.call('ZREM', ARGV[2] .. owner, member)
+        redis.call('HDEL', KEYS[2], member)
+    end
+end
+if #expired > 0 then
+    redis.call('ZREMRANGEBYSCORE', KEYS[1], '-inf', ARGV[1])
+end
+"""
+
+# 반환: {전체 발송 중 수, ARGV[3..]의 사용자별 발송 중 수...}
+_COUNTS_SCRIPT = _PURGE + """
+local counts = {redis.call('ZCARD', KEYS[1])}
+for i = 3, #ARGV do
+    counts[#counts + 1] = redis.call('ZCARD', ARGV[2] .. ARGV[i])
+end
+return counts
+"""
+
+# ARGV[3]=현재 시각, ARGV[4]=전체 상한, ARGV[5]=사용자별 상한, ARGV[6]=키 TTL, ARGV[7..]=(member, user_id) 쌍
+# 반환: 임대에 성공한 member 목록 (이미 임대 중인 member는 재발송으로 보고 시각만 갱신)
+_ACQUIRE_SCRIPT = _PURGE + """
+local total = redis.call('ZCARD', KEYS[1])
+local acquired = {}
+for i = 7, #ARGV, 2 do
+    local member, user_key = ARGV[i], ARGV[2] .. ARGV[i + 1]
+    local renewing = redis.call('ZSCORE', KEYS[1], member)
+    if renewing or (total < tonumber(ARGV[4]) and redis.call('ZCARD', user_key) < tonumber(ARGV[5])) then
+        if not renewing then
+            total = total + 1
+        end
+        redis.call('ZADD', KEYS[1], ARGV[3], member)
+        redis.call('ZADD', user_key, ARGV[3], member)
+        redis.call('HSET', KEYS[2], member, ARGV[i + 1])
+        redis.call('EXPIRE', user_key, ARGV[6])
+        acquired[#acquired + 1] = member
+    end
+end
+redis.call('EXPIRE', KEYS[1], ARGV[6])
+redis.call('EXPIRE', KEYS[2], ARGV[6])
+return acquired
+"""
+
+# ARGV[1]=사용자 키 prefix, ARGV[2..]=반납할 member, 반환: 반납된 수
+_RELEASE_SCRIPT = """
+local released = 0
+for i = 2, #ARGV do
+    local owner = redis.call('HGET', KEYS[2], ARGV[i])
+    if owner then
+        redis.call('ZREM', ARGV[1] .. owner, ARGV[i])
+        redis.call('HDEL', KEYS[2], ARGV[i])
+    end
+    released = released + redis.call('ZREM', KEYS[1], ARGV[i])
+end
+return released
+"""
+
+
+def lease_member(chapter_id, workflow_type: str) -> str:
+    """발송 중인 생성 1건의 임대 식별자 ("{chapter_id}:{workflow_type}")"""
+    return f"{chapter_id}:{workflow_type}"
+
+
+class FairQueue:
+    """
+    가중 공정 큐 (start-time fair queuing, in-memory)
+
+    (우선순위 등급, user_id)마다 흐름을 두고, 흐름의 다음 항목에 시작 태그를 붙여
+    태그가 가장 작은 흐름부터 꺼냅니다. 한 건을 꺼낼 때마다 그 흐름의 태그가 1/가중치만큼 늘어나므로
+    대기 중인 흐름들은 가중치 비율대로 번갈아 발송되고, 새로 들어온 흐름은 현재 가상 시각에서 시작합니다.
+
+    Args:
+        weights: 우선순위 등급별 가중치 (없는 등급은 NORMAL로 취급)
+    """
+
+    def __init__(self, weights: Dict[str, int] = PRIORITY_WEIGHTS):
+        self.weights = weights
+        self._flows: Dict[Tuple[str, int], deque] = {}  # (등급, user_id) → 대기 중인 outbox id
+        self._start: Dict[Tuple[str, int], float] = {}  # 흐름의 다음 항목 시작 태그
+        self._finish: Dict[Tuple[str, int], float] = {}  # 흐름에서 마지막으로 꺼낸 항목의 종료 태그
+        self._virtual_time = 0.0
+        self._ids: Set[int] = set()
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    def __contains__(self, row_id: int) -> bool:
+        return row_id in self._ids
+
+    def _flow(self, user_id: int, priority: str) -> Tuple[str, int]:
+        return (priority if priority in self.weights else NORMAL, user_id)
+
+    def push(self, row_id: int, user_id: int, priority: str):
+        """대기열 끝에 추가 (이미 대기 중인 id는 무시)"""
+        if row_id in self._ids:
+            return
+        flow = self._flow(user_id, priority)
+        queue = self._flows.get(flow)
+        if not queue:
+            queue = self._flows[flow] = deque()
+            # 비어 있던 흐름은 지금부터 시작 (쉬는 동안 몫을 쌓아 두었다가 몰아서 받지 않음)
+            self._start[flow] = max(self._virtual_time, self._finish.get(flow, 0.0))
+        queue.append(row_id)
+        self._ids.add(row_id)
+
+    def requeue(self, items: Iterable[Tuple[int, int, str]]):
+        """pop()으로 꺼냈지만 발송하지 못한 항목을 흐름 맨 앞으로 되돌림"""
+        for row_id, user_id, priority in reversed(list(items)):
+            if row_id in self._ids:
+                continue
+            flow = self._flow(user_id, priority)
+            queue = self._flows.get(flow)
+            if not queue:
+                queue = self._flows[flow] = deque()
+                self._start[flow] = self._virtual_time
+            else:
+                self._start[flow] = min(self._start[flow], self._virtual_time)
+            queue.appendleft(row_id)
+            self._ids.add(row_id)
+
+    def pop(self, limit: int, user_slots: Dict[int, int], default_slots: int) -> List[Tuple[int, int, str]]:
+        """
+        공정 순서대로 최대 limit개 꺼냄
+
+        Args:
+            limit: 꺼낼 최대 항목 수
+            user_slots: user_id별 남은 발송 가능 수 (0 이하인 사용자는 건너뜀)
+            default_slots: user_slots에 없는 사용자의 발송 가능 수
+
+        Returns:
+            List: [(outbox id, user_id, 등급), ...]
+        """
+        slots = dict(user_slots)
+        picked = []
+        while len(picked) < limit:
+            eligible = [flow for flow in self._flows if slots.get(flow[1], default_slots) > 0]
+            if not eligible:
+                break
+            # 태그가 같으면 가중치가 큰 등급, 그다음 user_id 순 (결과가 항상 같도록)
+            flow = min(eligible, key=lambda f: (self._start[f], -self.weights[f[0]], f[1]))
+            queue = self._flows[flow]
+            row_id = queue.popleft()
+            self._ids.discard(row_id)
+
+            start = self._start[flow]
+            self._virtual_time = max(self._virtual_time, start)
+            self._finish[flow] = start + 1 / self.weights[flow[0]]
+            if queue:
+                self._start[flow] = self._finish[flow]
+            else:
+                del self._flows[flow]
+                del self._start[flow]
+            slots[flow[1]] = slots.get(flow[1], default_slots) - 1
+            picked.append((row_id, flow[1], flow[0]))
+
+        # 가상 시각보다 앞선 종료 태그는 push()에 영향이 없으므로 정리
+        self._finish = {
+            flow: finish for flow, finish in self._finish.items()
+            if finish > self._virtual_time or flow in self._flows
+        }
+        return picked
+
+    def user_ids(self) -> List[int]:
+        """대기 중인 항목이 있는 user_id 목록"""
+        return sorted({user_id for _, user_id in self._flows})
+
+    def depths(self) -> Dict[str, int]:
+        """등급별 대기 수와 대기 중인 사용자 수"""
+        depths = {priority: 0 for priority in self.weights}
+        for (priority, _), queue in self._flows.items():
+            depths[priority] += len(queue)
+        depths["users"] = len(self.user_ids())
+        return depths
+
+
+class InflightLimiter:
+    """
+    발송 중인 생성 수 제한 (Redis 임대, 여러 relay 프로세스가 공유)
+
+    Redis 오류 시에는 제한 없이 발송하도록 둡니다 (생성이 멈추는 것보다 할당량 초과 재시도가 나음).
+    반납에 실패한 임대는 lease_ttl 후 회수됩니다.
+
+    Args:
+        client: 비동기 Redis 클라이언트
+        max_inflight: 전체 발송 중 상한
+        max_inflight_per_user: 사용자별 발송 중 상한
+        lease_ttl: 완료 응답이 오지 않은 임대를 회수하기까지의 시간 (초)
+    """
+
+    def __init__(self, client: aioredis.Redis, max_inflight: int, max_inflight_per_user: int, lease_ttl: int):
+        self.client = client
+        self.max_inflight = max_inflight
+        self.max_inflight_per_user = max_inflight_per_user
+        self.lease_ttl = lease_ttl
+        self._counts_script = client.register_script(_COUNTS_SCRIPT)
+        self._acquire_script = client.register_script(_ACQUIRE_SCRIPT)
+        self._release_script = client.register_script(_RELEASE_SCRIPT)
+        self.stats = {
+            "acquired": 0,
+            "denied": 0,
+            "released": 0,
+            "error": 0,
+        }
+
+    def _purge_args(self) -> Tuple[List[str], List]:
+        return [INFLIGHT_KEY, OWNER_KEY], [time.time() - self.lease_ttl, USER_INFLIGHT_PREFIX]
+
+    async def counts(self, user_ids: List[int]) -> Tuple[int, Dict[int, int]]:
+        """
+        발송 중인 생성 수 (만료된 임대는 먼저 회수)
+
+        Returns:
+            (전체 발송 중 수, {user_id: 발송 중 수})
+        """
+        keys, args = self._purge_args()
+        try:
+            counts = await self._counts_script(keys=keys, args=[*args, *user_ids])
+        except redis.RedisError as e:
+            self.stats["error"] += 1
+            logger.warning(f"발송 중 생성 수 조회 실패 - Error: {e}")
+            return 0, {}
+        return int(counts[0]), {user_id: int(count) for user_id, count in zip(user_ids, counts[1:])}
+
+    async def acquire(self, entries: List[Tuple[str, int]]) -> Set[str]:
+        """
+        임대 획득 (상한은 스크립트 안에서 다시 확인하므로 relay가 여러 개여도 넘지 않음)
+
+        Args:
+            entries: [(lease_member, user_id), ...] 발송 순서대로
+
+        Returns:
+            Set: 임대에 성공한 lease_member
+        """
+        if not entries:
+            return set()
+        keys, args = self._purge_args()
+        pairs = [value for member, user_id in entries for value in (member, user_id)]
+        try:
+            acquired = await self._acquire_script(keys=keys, args=[
+                *args, time.time(), self.max_inflight, self.max_inflight_per_user, self.lease_ttl, *pairs
+            ])
+        except redis.RedisError as e:
+            self.stats["error"] += 1
+            logger.warning(f"생성 임대 획득 실패, 제한 없이 발송 - Error: {e}")
+            return {member for member, _ in entries}
+        acquired = {member.decode() if isinstance(member, bytes) else member for member in acquired}
+        self.stats["acquired"] += len(acquired)
+        self.stats["denied"] += len(entries) - len(acquired)
+        return acquired
+
+    async def release(self, members: Iterable[str]):
+        """임대 반납 (생성 완료 또는 발송 실패, 이미 반납/회수된 임대는 무시)"""
+        members = list(members)
+        if not members:
+            return
+        try:
+            released = await self._release_script(keys=[INFLIGHT_KEY, OWNER_KEY], args=[USER_INFLIGHT_PREFIX, *members])
+        except redis.RedisError as e:
+            self.stats["error"] += 1
+            logger.warning(f"생성 임대 반납 실패 (TTL 후 회수) - Error: {e}")
+            return
+        self.stats["released"] += int(released)
+
+    async def publish_depths(self, depths: Dict[str, int]):
+        """relay의 등급별 대기 수를 Redis에 기록 (relay가 멈추면 만료)"""
+        try:
+            async with self.client.pipeline(transaction=True) as pipe:
+                pipe.hset(QUEUE_DEPTH_KEY, mapping=depths)
+                pipe.expire(QUEUE_DEPTH_KEY, max(60, int(settings.OUTBOX_POLL_INTERVAL * 10)))
+                await pipe.execute()
+        except redis.RedisError as e:
+            self.stats["error"] += 1
+            logger.warning(f"대기열 길이 기록 실패 - Error: {e}")
+
+
+def get_scheduler_metrics() -> Dict[str, object]:
+    """
+    스케줄러 지표 (API 서버 /metrics용, relay가 기록한 값을 조회)
+
+    Returns:
+        Dict: 발송 중 생성 수, 등급별 대기 수 (Redis 오류 시 빈 dict)
+    """
+    try:
+        inflight = redis_client.zcard(INFLIGHT_KEY)
+        depths = redis_client.hgetall(QUEUE_DEPTH_KEY)
+    except redis.RedisError:
+        return {}
+    return {
+        "inflight": inflight,
+        "max_inflight": settings.GENERATION_MAX_INFLIGHT,
+        "queue_depth": {
+            (key.decode() if isinstance(key, bytes) else key): int(value) for key, value in depths.items()
+        },
+    }
+
+
+# 싱글톤 인스턴스
+inflight_limiter = InflightLimiter(
+    async_redis_client,
+    settings.GENERATION_MAX_INFLIGHT,
+    settings.GENERATION_MAX_INFLIGHT_PER_USER,
+    settings.GENERATION_LEASE_TTL
+)
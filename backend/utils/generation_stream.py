@@ -0,0 +1,90 @@
+"""
+AI 생성 스트리밍 버퍼
+n8n이 생성 중간 결과를 조각(seq, delta) 단위로 보내면 Redis에 이어 붙여 두었다가
+마지막 조각에서 전체 본문을 한 번만 DB에 저장
+
+키 구조:
+    generation_stream:{resource}:{chapter_id}      → 지금까지 누적된 본문
+    generation_stream:{resource}:{chapter_id}:seq  → 마지막으로 반영한 조각 순번
+
+여러 API 워커가 같은 챕터의 조각을 받아도 Lua 스크립트로 순번 확인과 이어 붙이기를 원자적으로 처리합니다.
+- 이미 반영한 순번(재전송) → duplicate, 버퍼는 그대로
+- 순번이 건너뛰어짐 → gap, 보낸 쪽이 기대 순번부터 다시 전송
+완료 후에는 본문만 지우고 순번 키는 TTL까지 남겨 마지막 조각의 재전송을 duplicate로 처리합니다.
+"""
+
+import logging
+from typing import Optional, Tuple
+import redis.asyncio as aioredis
+from core.config import settings
+from db.database import async_redis_client
+
+logger = logging.getLogger(__name__)
+
+BUFFER_KEY = "generation_stream:{resource}:{chapter_id}"
+
+APPENDED = "appended"
+DUPLICATE = "duplicate"
+GAP = "gap"
+
+# 반환: {상태(1=appended, 0=duplicate, -1=gap), 마지막 반영 순번}
+_APPEND_SCRIPT = """
+local last = tonumber(redis.call('GET', KEYS[2]) or '-1')
+local seq = tonumber(ARGV[1])
+if seq <= last then
+    return {0, last}
+end
+if seq ~= last + 1 then
+    return {-1, last}
+end
+redis.call('APPEND', KEYS[1], ARGV[2])
+redis.call('SET', KEYS[2], seq, 'EX', ARGV[3])
+redis.call('EXPIRE', KEYS[1], ARGV[3])
+return {1, seq}
+"""
+
+_STATUS = {1: APPENDED, 0: DUPLICATE, -1: GAP}
+
+
+class GenerationStream:
+    """
+    생성 중간 결과 버퍼
+
+    Args:
+        client: 비동기 Redis 클라이언트
+        ttl: 마지막 조각 이후 버퍼 유지 시간 (초), 생성이 중단된 버퍼 정리용
+    """
+
+    def __init__(self, client: aioredis.Redis, ttl: int):
+        self.client = client
+        self.ttl = ttl
+        self._append_script = client.register_script(_APPEND_SCRIPT)
+
+    async def append(self, resource: str, chapter_id: int, seq: int, delta: str) -> Tuple[str, int]:
+        """
+        조각 이어 붙이기
+
+        Returns:
+            (APPENDED/DUPLICATE/GAP, 마지막으로 반영된 순번)
+        """
+        key = BUFFER_KEY.format(resource=resource, chapter_id=chapter_id)
+        status, last = await self._append_script(
+            keys=[key, f"{key}:seq"],
+            args=[seq, delta, self.ttl]
+        )
+        return _STATUS[int(status)], int(last)
+
+    async def read(self, resource: str, chapter_id: int) -> Optional[str]:
+        """누적된 본문 조회"""
+        content = await self.client.get(BUFFER_KEY.format(resource=resource, chapter_id=chapter_id))
+        if isinstance(content, bytes):
+            content = content.decode()
+        return content
+
+    async def clear(self, resource: str, chapter_id: int):
+        """저장이 끝난 본문 삭제 (순번 키는 재전송 판별용으로 TTL까지 유지)"""
+        await self.client.delete(BUFFER_KEY.format(resource=resource, chapter_id=chapter_id))
+
+
+# 싱글톤 인스턴스
+generation_stream = GenerationStream(async_redis_client, settings.GENERATION_STREAM_TTL)
@@ -0,0 +1,171 @@
+"""
+QuizGrader 요청 묶음 발송 (micro-batching)
+여러 요청에서 동시에 들어온 재채점 답안을 짧은 시간 동안 모아 QuizGrader 요청 1회로 채점하고,
+결과를 기다리는 호출자에게 나눠 돌려줌
+
+- 첫 답안이 들어온 뒤 QUIZ_GRADER_BATCH_WAIT초 또는 QUIZ_GRADER_BATCH_SIZE개가 모이면 발송
+- 발송은 QUIZ_GRADER_MAX_CONCURRENCY개까지 동시에 진행 (느린 요청이 다음 묶음을 막지 않음)
+- 채점 라우트가 동기(스레드풀) 함수이므로 수집은 전용 스레드, 결과 전달은 concurrent.futures.Future 사용
+- 시간 초과로 호출자가 포기한 답안은 취소되어, 발송 대기 중이던 묶음에서 빠짐 (아무도 기다리지 않는 채점 요청 방지)
+"""
+
+import logging
+import queue
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor, TimeoutError as FutureTimeout
+from typing import List, Dict, Any, Optional, Tuple
+from core.config import settings
+from utils.quiz_grader import quiz_grader
+
+logger = logging.getLogger(__name__)
+
+_STOP = object()
+
+
+class GradingDispatcher:
+    """
+    QuizGrader 요청 묶음 발송기
+
+    Args:
+        grader: grade(items) -> 점수 목록을 제공하는 채점기 (QuizGraderClient, StubQuizGrader)
+        max_batch_size: 요청 1회에 담을 최대 답안 수
+        max_wait: 첫 답안이 들어온 뒤 묶음을 기다리는 최대 시간 (초)
+        max_concurrency: 동시에 진행할 수 있는 QuizGrader 요청 수
+        timeout: 호출자가 결과를 기다리는 최대 시간 (초, 초과 시 None)
+    """
+
+    def __init__(self, grader, max_batch_size: int, max_wait: float, max_concurrency: int, timeout: float):
+        self.grader = grader
+        self.max_batch_size = max_batch_size
+        self.max_wait = max_wait
+        self.max_concurrency = max_concurrency
+        self.timeout = timeout
+        self._queue: "queue.Queue" = queue.Queue()
+        self._lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self.stats = {
+            "submitted": 0,
+            "batches": 0,
+            "largest_batch": 0,
+            "timeouts": 0,
+            "abandoned": 0,  # 발송 전에 호출자가 포기해 채점하지 않은 답안 수
+        }
+
+    @property
+    def enabled(self) -> bool:
+        return self.grader.enabled
+
+    def start(self):
+        """수집 스레드 시작 (첫 제출 시 자동으로 호출됨)"""
+        with self._lock:
+            if self._thread is not None:
+                return
+            self._executor = ThreadPoolExecutor(max_workers=self.max_concurrency, thread_name_prefix="quiz-grader")
+            self._thread = threading.Thread(
+                target=self._run, args=(self._executor,), name="grading-dispatcher", daemon=True
+            )
+            self._thread.start()
+
+    def stop(self):
+        """수집 중인 답안까지 발송한 뒤 종료"""
+        with self._lock:
+            thread, executor = self._thread, self._executor
+            self._thread = self._executor = None
+        if thread is None:
+            return
+        self._queue.put(_STOP)
+        thread.join()
+        executor.shutdown(wait=True)
+
+    def submit(self, item: Dict[str, Any]) -> Future:
+        """답안 1개를 다음 묶음에 추가 (결과는 Future로 전달)"""
+        if self._thread is None:
+            self.start()
+        future: Future = Future()
+        self._queue.put((item, future))
+        with self._lock:
+            self.stats["submitted"] += 1
+        return future
+
+    def grade(self, items: List[Dict[str, Any]]) -> List[Optional[float]]:
+        """
+        답안 여러 개 채점 (다른 요청의 답안과 함께 묶여 발송됨)
+
+        Returns:
+            List: items와 같은 순서의 점수 (0~100, 채점하지 못했거나 시간이 초과되면 None)
+        """
+        futures = [self.submit(item) for item in items]
+        deadline = time.monotonic() + self.timeout
+        results = []
+        for future in futures:
+            try:
+                results.append(future.result(timeout=max(0.0, deadline - time.monotonic())))
+            except FutureTimeout:
+                # 아직 발송 전이면 취소 (_dispatch가 건너뜀)
+                future.cancel()
+                with self._lock:
+                    self.stats["timeouts"] += 1
+                results.append(None)
+        return results
+
+    def get_metrics(self) -> Dict[str, int]:
+        """발송 지표 (여러 스레드에서 갱신되므로 잠금 후 복사)"""
+        with self._lock:
+            return dict(self.stats)
+
+    def _run(self, executor: ThreadPoolExecutor):
+        stopping = False
+        while not stopping:
+            first = self._queue.get()
+            if first is _STOP:
+                break
+            batch: List[Tuple[Dict[str, Any], Future]] = [first]
+            deadline = time.monotonic() + self.max_wait
+            while len(batch) < self.max_batch_size:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    entry = self._queue.get(timeout=remaining)
+                except queue.Empty:
+                    break
+                if entry is _STOP:
+                    stopping = True
+                    break
+                batch.append(entry)
+            with self._lock:
+                self.stats["batches"] += 1
+                self.stats["largest_batch"] = max(self.stats["largest_batch"], len(batch))
+            executor.submit(self._dispatch, batch)
+
+    def _dispatch(self, batch: List[Tuple[Dict[str, Any], Future]]):
+        # 발송 대기 중에 취소된(호출자가 포기한) 답안 제외, 남은 답안은 더 이상 취소되지 않음
+        live = [(item, future) for item, future in batch if future.set_running_or_notify_cancel()]
+        if len(live) < len(batch):
+            with self._lock:
+                self.stats["abandoned"] += len(batch) - len(live)
+        if not live:
+            return
+        batch = live
+        try:
+            scores = self.grader.grade([item for item, _ in batch])
+        except Exception as e:
+            # 채점기 오류가 호출자를 멈추게 하지 않도록 모두 None으로 전달
+            logger.error(f"QuizGrader 묶음 채점 실패 - Items: {len(batch)}, Error: {e}")
+            scores = []
+        # 점수가 모자라게 돌아와도 모든 호출자가 결과를 받도록 None으로 채움
+        scores = list(scores) + [None] * (len(batch) - len(scores))
+        for (_, future), score in zip(batch, scores):
+            future.set_result(score)
+
+
+# 싱글톤 인스턴스
+grading_dispatcher = GradingDispatcher(
+    quiz_grader,
+    settings.QUIZ_GRADER_BATCH_SIZE,
+    settings.QUIZ_GRADER_BATCH_WAIT,
+    settings.QUIZ_GRADER_MAX_CONCURRENCY,
+    settings.QUIZ_GRADER_TIMEOUT + settings.QUIZ_GRADER_BATCH_WAIT
+)
@@ -3,10 +3,14 @@ Kafka 유틸리티 클래스
 n8n 워크플로우 요청을 Kafka를 통해 비동기 처리
 """
 
+import asyncio
 import json
 import logging
+import threading
+import time
 from typing import Dict, Any, Optional, List
 from datetime import datetime
+from core.config import settings
 try:
     from confluent_kafka import Producer, Consumer, KafkaError
     KAFKA_AVAILABLE = True
@@ -20,6 +24,18 @@ import uuid
 
 logger = logging.getLogger(__name__)
 
+
+class KafkaDeliveryError(Exception):
+    """브로커가 메시지 전달 실패를 보고한 경우 (비동기 발송 API의 future에 설정됨)"""
+    pass
+
+
+def _retrieve_exception(future: "asyncio.Future"):
+    """future의 예외를 회수 처리 (await하는 호출자는 그대로 예외를 받음)"""
+    if not future.cancelled():
+        future.exception()
+
+
 class KafkaManager:
     """
     Kafka 메시지 관리 클래스
@@ -48,28 +64,55 @@ class KafkaManager:
     토픽 구조:
         - n8n-requests: n8n으로 보낼 작업 요청
         - n8n-responses: n8n에서 받을 작업 결과  
+        - n8n-responses-dlq: kafka_consumer가 반영하지 못한 작업 결과
         - concept-generation: 컨셉 생성 요청
         - exercise-generation: 연습문제 생성 요청
         - quiz-generation: 퀴즈 생성 요청
         - content-updates: 콘텐츠 업데이트 알림
+
+    배치 전송:
+        produce()는 로컬 큐에 적재만 하고 즉시 반환합니다 (flush 없음).
+        librdkafka가 linger.ms / batch.size 기준으로 묶어서 전송하고,
+        백그라운드 poller 스레드가 delivery 콜백을 처리합니다.
+        로컬 큐가 가득 차면 KAFKA_BACKPRESSURE_TIMEOUT 동안 poll하며 재시도하고,
+        그래도 자리가 없으면 메시지를 버리고 stats["dropped"]를 증가시킵니다.
+        stats는 호출 스레드와 poller 스레드가 함께 갱신하므로 get_metrics()로 조회합니다.
     """
     
     # Kafka 토픽 정의
     TOPICS = {
         "N8N_REQUESTS": "n8n-requests",
         "N8N_RESPONSES": "n8n-responses",
+        "N8N_RESPONSES_DLQ": "n8n-responses-dlq",
         "CONCEPT_GENERATION": "concept-generation",
         "EXERCISE_GENERATION": "exercise-generation", 
         "QUIZ_GENERATION": "quiz-generation",
         "CONTENT_UPDATES": "content-updates"
     }
     
+    # poller 스레드의 poll 주기 (초)
+    POLL_INTERVAL = 0.1
+
     def __init__(self):
         self.producer = None
         self.consumer = None
         self.kafka_config = {
-            'bootstrap.servers': 'localhost:9092',
-            'client.id': 'docgodai-backend'
+            'bootstrap.servers': settings.KAFKA_BOOTSTRAP_SERVERS,
+            'client.id': 'docgodai-backend',
+            'linger.ms': settings.KAFKA_LINGER_MS,
+            'batch.num.messages': settings.KAFKA_BATCH_NUM_MESSAGES,
+            'batch.size': settings.KAFKA_BATCH_SIZE,
+            'queue.buffering.max.messages': settings.KAFKA_QUEUE_MAX_MESSAGES,
+        }
+        self._lock = threading.Lock()
+        self._poller_thread: Optional[threading.Thread] = None
+        self._poller_stop = threading.Event()
+        self._stats_lock = threading.Lock()
+        self.stats = {
+            "produced": 0,
+            "delivered": 0,
+            "failed": 0,
+            "dropped": 0,
         }
     
     def get_producer(self):
@@ -79,26 +122,110 @@ class KafkaManager:
             return None
             
         if self.producer is None:
+            with self._lock:
+                if self.producer is None:
+                    try:
+                        self.producer = Producer(self.kafka_config)
+                        self._start_poller()
+                        logger.info("Kafka Producer 연결 성공")
+                    except Exception as e:
+                        logger.error(f"Kafka Producer 연결 실패: {e}")
+                        return None
+        return self.producer
+
+    def _start_poller(self):
+        """delivery 콜백을 처리하는 백그라운드 poller 스레드 시작"""
+        self._poller_stop.clear()
+        self._poller_thread = threading.Thread(
+            target=self._poll_loop,
+            name="kafka-producer-poller",
+            daemon=True
+        )
+        self._poller_thread.start()
+
+    def _poll_loop(self):
+        """producer.poll()을 주기적으로 호출하여 delivery 콜백 실행"""
+        while not self._poller_stop.is_set():
+            producer = self.producer
+            if producer is None:
+                break
             try:
-                self.producer = Producer(self.kafka_config)
-                logger.info("Kafka Producer 연결 성공")
+                producer.poll(self.POLL_INTERVAL)
             except Exception as e:
-                logger.error(f"Kafka Producer 연결 실패: {e}")
-                return None
-        return self.producer
+                logger.error(f"Kafka Producer poll 실패: {e}")
+
+    def _count(self, name: str):
+        """stats 증가 (호출 스레드와 poller 스레드에서 동시에 호출됨)"""
+        with self._stats_lock:
+            self.stats[name] += 1
+
+    def get_metrics(self) -> Dict[str, Any]:
+        """발송 지표 조회"""
+        with self._stats_lock:
+            return dict(self.stats)
+
+    def _on_delivery(self, err, msg):
+        """브로커 ack 수신 시 호출되는 delivery 콜백 (poller 스레드에서 실행)"""
+        if err is not None:
+            self._count("failed")
+            logger.error(f"Kafka 메시지 전달 실패 - Topic: {msg.topic()}, Key: {msg.key()}, Error: {err}")
+        else:
+            self._count("delivered")
+
+    def _produce(self, producer, topic: str, key: str, value: str, on_delivery=None):
+        """
+        로컬 큐에 메시지 적재 (flush하지 않음)
+
+        로컬 큐가 가득 찬 경우(BufferError) KAFKA_BACKPRESSURE_TIMEOUT 동안
+        poll로 큐를 비우며 재시도하고, 시간 초과 시 BufferError를 그대로 올립니다.
+
+        Args:
+            producer: Kafka Producer
+            topic: 토픽 이름
+            key: 메시지 키
+            value: 직렬화된 메시지
+            on_delivery: delivery 콜백 (기본값: self._on_delivery)
+        """
+        deadline = time.monotonic() + settings.KAFKA_BACKPRESSURE_TIMEOUT
+        while True:
+            try:
+                producer.produce(
+                    topic=topic,
+                    key=key,
+                    value=value,
+                    on_delivery=on_delivery or self._on_delivery
+                )
+                self._count("produced")
+                return
+            except BufferError:
+                if time.monotonic() >= deadline:
+                    self._count("dropped")
+                    logger.error(f"Kafka 로컬 큐 포화 - 메시지 폐기 (Topic: {topic}, Key: {key}, "
+                                 f"Queue: {len(producer)})")
+                    raise
+                producer.poll(self.POLL_INTERVAL)
     
-    def get_consumer(self, topics: List[str], group_id: str = "docgodai-backend"):
-        """Kafka Consumer 인스턴스 가져오기"""
+    def get_consumer(self, topics: List[str], group_id: str = "docgodai-backend",
+                     extra_config: Optional[Dict[str, Any]] = None):
+        """
+        Kafka Consumer 인스턴스 가져오기
+
+        Args:
+            topics: 구독할 토픽 목록
+            group_id: 컨슈머 그룹 ID
+            extra_config: 추가/덮어쓸 consumer 설정 (예: enable.auto.commit)
+        """
         if not KAFKA_AVAILABLE:
             logger.warning("Kafka가 설치되지 않았습니다.")
             return None
             
         try:
             consumer_config = {
-                'bootstrap.servers': 'localhost:9092',
+                'bootstrap.servers': settings.KAFKA_BOOTSTRAP_SERVERS,
                 'group.id': group_id,
                 'auto.offset.reset': 'latest'
             }
+            consumer_config.update(extra_config or {})
             consumer = Consumer(consumer_config)
             consumer.subscribe(topics)
             logger.info(f"Kafka Consumer 생성 - Topics: {topics}, Group: {group_id}")
@@ -126,18 +253,8 @@ class KafkaManager:
         Returns:
             str: 메시지 ID
         """
-        message_id = str(uuid.uuid4())
-        
-        message = {
-            "message_id": message_id,
-            "timestamp": datetime.utcnow().isoformat(),
-            "workflow_type": workflow_type,
-            "user_id": user_id,
-            "chapter_id": chapter_id,
-            "priority": priority,
-            "data": data,
-            "status": "pending"
-        }
+        message = self.build_n8n_message(workflow_type, user_id, chapter_id, data, priority)
+        message_id = message["message_id"]
         
         try:
             producer = self.get_producer()
@@ -147,16 +264,16 @@ class KafkaManager:
                            f"User: {user_id}, Chapter: {chapter_id}, Message: {message}")
                 return message_id
             
-            # confluent-kafka 방식으로 메시지 발송
-            producer.produce(
-                topic=self.TOPICS["N8N_REQUESTS"],
-                key=message_id,
-                value=json.dumps(message, ensure_ascii=False, default=str)
+            # 로컬 큐에 적재 (전송/ack는 poller 스레드에서 처리)
+            self._produce(
+                producer,
+                self.TOPICS["N8N_REQUESTS"],
+                message_id,
+                json.dumps(message, ensure_ascii=False, default=str)
             )
-            producer.flush()
             
-            logger.info(f"메시지 발송 성공 - Topic: {self.TOPICS['N8N_REQUESTS']}, "
-                       f"Type: {workflow_type}, Chapter: {chapter_id}")
+            logger.debug(f"메시지 큐 적재 - Topic: {self.TOPICS['N8N_REQUESTS']}, "
+                        f"Type: {workflow_type}, Chapter: {chapter_id}")
             
             return message_id
             
@@ -167,6 +284,147 @@ class KafkaManager:
                        f"User: {user_id}, Chapter: {chapter_id}")
             return message_id
     
+    def build_n8n_message(self, workflow_type: str, user_id: int, chapter_id: int,
+                          data: Dict[str, Any], priority: str = "normal") -> Dict[str, Any]:
+        """n8n 워크플로우 요청 메시지 생성"""
+        return {
+            "message_id": str(uuid.uuid4()),
+            "timestamp": datetime.utcnow().isoformat(),
+            "workflow_type": workflow_type,
+            "user_id": user_id,
+            "chapter_id": chapter_id,
+            "priority": priority,
+            "data": data,
+            "status": "pending"
+        }
+
+    async def send_n8n_request_async(self,
+                                     workflow_type: str,
+                                     user_id: int,
+                                     chapter_id: int,
+                                     data: Dict[str, Any],
+                                     priority: str = "normal") -> "asyncio.Future[str]":
+        """
+        n8n 워크플로우 요청 메시지 발송 (asyncio 전용)
+
+        로컬 큐 적재까지만 await하고, 브로커 ack 시 완료되는 future를 반환합니다.
+        delivery 콜백은 poller 스레드에서 실행되며 call_soon_threadsafe로
+        이벤트 루프에 결과를 전달하므로 호출한 코루틴은 블록되지 않습니다.
+
+        사용 예시:
+            future = await kafka_manager.send_n8n_request_async("concept", 1, 10, data)
+            message_id = await future  # 브로커 ack 대기 (선택)
+
+        Args:
+            workflow_type: 워크플로우 타입 (concept, exercise, quiz)
+            user_id: 사용자 ID
+            chapter_id: 챕터 ID
+            data: 워크플로우에 전달할 데이터
+            priority: 우선순위 (high, normal, low)
+
+        Returns:
+            asyncio.Future[str]: ack 시 메시지 ID로 완료, 전달 실패 시 KafkaDeliveryError
+        """
+        message = self.build_n8n_message(workflow_type, user_id, chapter_id, data, priority)
+        return await self.publish_async(self.TOPICS["N8N_REQUESTS"], message["message_id"], message)
+
+    async def publish_async(self, topic: str, key: str, message: Dict[str, Any]) -> "asyncio.Future[str]":
+        """
+        임의 메시지 발송 (asyncio 전용)
+        send_n8n_request_async 및 outbox relay가 사용하는 공통 경로
+
+        Args:
+            topic: 토픽 이름
+            key: 메시지 키 (future 결과값으로도 사용)
+            message: 발송할 메시지 (JSON 직렬화)
+
+        Returns:
+            asyncio.Future[str]: ack 시 key로 완료, 전달 실패 시 KafkaDeliveryError
+                (적재 실패 시 그 예외, 실패는 이미 로그로 남으므로 await하지 않아도 됨)
+        """
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        # ack를 기다리지 않는 호출자의 future가 "Future exception was never retrieved"로 다시 보고되지 않도록 회수
+        future.add_done_callback(_retrieve_exception)
+
+        producer = self.get_producer()
+        if producer is None:
+            # Kafka 사용 불가 시 로깅으로 대체하고 바로 완료 처리
+            logger.info(f"[Kafka 미사용] 메시지 발송 - Topic: {topic}, Key: {key}, Message: {message}")
+            future.set_result(key)
+            return future
+
+        def _resolve(err, msg):
+            if future.done():
+                return
+            if err is not None:
+                future.set_exception(KafkaDeliveryError(str(err)))
+            else:
+                future.set_result(key)
+
+        def _on_delivery(err, msg):
+            self._on_delivery(err, msg)
+            loop.call_soon_threadsafe(_resolve, err, msg)
+
+        try:
+            await self._produce_async(
+                producer,
+                topic,
+                key,
+                json.dumps(message, ensure_ascii=False, default=str),
+                on_delivery=_on_delivery
+            )
+        except Exception as e:
+            logger.error(f"Kafka 메시지 발송 실패: {e}")
+            future.set_exception(e)
+
+        return future
+
+    async def _produce_async(self, producer, topic: str, key: str, value: str, on_delivery=None):
+        """
+        _produce의 asyncio 버전
+        로컬 큐가 가득 찬 경우 스레드를 막는 poll 대신 asyncio.sleep으로 양보하며 재시도합니다.
+        """
+        deadline = time.monotonic() + settings.KAFKA_BACKPRESSURE_TIMEOUT
+        while True:
+            try:
+                producer.produce(
+                    topic=topic,
+                    key=key,
+                    value=value,
+                    on_delivery=on_delivery or self._on_delivery
+                )
+                self._count("produced")
+                return
+            except BufferError:
+                if time.monotonic() >= deadline:
+                    self._count("dropped")
+                    logger.error(f"Kafka 로컬 큐 포화 - 메시지 폐기 (Topic: {topic}, Key: {key}, "
+                                 f"Queue: {len(producer)})")
+                    raise
+                await asyncio.sleep(self.POLL_INTERVAL)
+
+    def build_generation_messages(self, user_id: int, chapter_id: int, question: str) -> List[Dict[str, Any]]:
+        """
+        챕터 생성 시 발송할 컨셉/연습문제/퀴즈 생성 요청 메시지 3개 생성
+        (outbox에 저장 후 relay가 발송)
+        """
+        return [
+            self.build_n8n_message("concept", user_id, chapter_id, {
+                "question": question,
+                "type": "concept_generation"
+            }, "high"),
+            self.build_n8n_message("exercise", user_id, chapter_id, {
+                "concept_content": question,
+                "type": "exercise_generation"
+            }, "normal"),
+            self.build_n8n_message("quiz", user_id, chapter_id, {
+                "concept_content": question,
+                "exercise_content": "",
+                "type": "quiz_generation"
+            }, "normal"),
+        ]
+
     def send_concept_generation_request(self, user_id: int, chapter_id: int, question: str) -> str:
         """컨셉 생성 요청"""
         data = {
@@ -193,6 +451,35 @@ class KafkaManager:
         }
         return self.send_n8n_request("quiz", user_id, chapter_id, data, "normal")
     
+    async def send_concept_generation_request_async(self, user_id: int, chapter_id: int,
+                                                    question: str) -> "asyncio.Future[str]":
+        """컨셉 생성 요청 (asyncio 전용)"""
+        data = {
+            "question": question,
+            "type": "concept_generation"
+        }
+        return await self.send_n8n_request_async("concept", user_id, chapter_id, data, "high")
+
+    async def send_exercise_generation_request_async(self, user_id: int, chapter_id: int,
+                                                     concept_content: str) -> "asyncio.Future[str]":
+        """연습문제 생성 요청 (asyncio 전용)"""
+        data = {
+            "concept_content": concept_content,
+            "type": "exercise_generation"
+        }
+        return await self.send_n8n_request_async("exercise", user_id, chapter_id, data, "normal")
+
+    async def send_quiz_generation_request_async(self, user_id: int, chapter_id: int,
+                                                 concept_content: str,
+                                                 exercise_content: str) -> "asyncio.Future[str]":
+        """퀴즈 생성 요청 (asyncio 전용)"""
+        data = {
+            "concept_content": concept_content,
+            "exercise_content": exercise_content,
+            "type": "quiz_generation"
+        }
+        return await self.send_n8n_request_async("quiz", user_id, chapter_id, data, "normal")
+    
     def send_content_update_notification(self, content_type: str, content_id: int, 
                                        user_id: int, status: str, content: Optional[Dict] = None) -> str:
         """콘텐츠 업데이트 알림 발송"""
@@ -214,12 +501,12 @@ class KafkaManager:
                 logger.info(f"[Kafka 미사용] 콘텐츠 업데이트 알림 - Type: {content_type}, ID: {content_id}")
                 return message_id
                 
-            producer.produce(
-                topic=self.TOPICS["CONTENT_UPDATES"],
-                key=f"{content_type}_{content_id}",
-                value=json.dumps(message, ensure_ascii=False, default=str)
+            self._produce(
+                producer,
+                self.TOPICS["CONTENT_UPDATES"],
+                f"{content_type}_{content_id}",
+                json.dumps(message, ensure_ascii=False, default=str)
             )
-            producer.flush()
             return message_id
         except Exception as e:
             logger.error(f"콘텐츠 업데이트 알림 발송 실패: {e}")
@@ -227,10 +514,17 @@ class KafkaManager:
             return message_id
     
     def close_connections(self):
-        """Kafka 연결 종료"""
+        """Kafka 연결 종료 (큐에 남은 메시지를 drain한 뒤 poller 정지)"""
         if self.producer:
-            self.producer.close()
-            logger.info("Kafka Producer 연결 종료")
+            remaining = self.producer.flush(settings.KAFKA_FLUSH_TIMEOUT)
+            if remaining > 0:
+                logger.error(f"Kafka Producer 종료 시 미전송 메시지 {remaining}개")
+            self._poller_stop.set()
+            if self._poller_thread is not None:
+                self._poller_thread.join(timeout=self.POLL_INTERVAL * 10)
+                self._poller_thread = None
+            self.producer = None
+            logger.info(f"Kafka Producer 연결 종료 - Stats: {self.get_metrics()}")
         if self.consumer:
             self.consumer.close()
             logger.info("Kafka Consumer 연결 종료")
@@ -260,4 +554,19 @@ def create_exercise_request(user_id: int, chapter_id: int, concept_content: str)
 
 def create_quiz_request(user_id: int, chapter_id: int, concept_content: str, exercise_content: str) -> str:
     """퀴즈 생성 요청 (편의 함수)"""
-    return kafka_manager.send_quiz_generation_request(user_id, chapter_id, concept_content, exercise_content)
\ No newline at end of file
+    return kafka_manager.send_quiz_generation_request(user_id, chapter_id, concept_content, exercise_content)
+
+async def create_concept_request_async(user_id: int, chapter_id: int, question: str) -> "asyncio.Future[str]":
+    """컨셉 생성 요청 (asyncio 편의 함수, ack future 반환)"""
+    return await kafka_manager.send_concept_generation_request_async(user_id, chapter_id, question)
+
+async def create_exercise_request_async(user_id: int, chapter_id: int, concept_content: str) -> "asyncio.Future[str]":
+    """연습문제 생성 요청 (asyncio 편의 함수, ack future 반환)"""
+    return await kafka_manager.send_exercise_generation_request_async(user_id, chapter_id, concept_content)
+
+async def create_quiz_request_async(user_id: int, chapter_id: int, concept_content: str,
+                                    exercise_content: str) -> "asyncio.Future[str]":
+    """퀴즈 생성 요청 (asyncio 편의 함수, ack future 반환)"""
+    return await kafka_manager.send_quiz_generation_request_async(
+        user_id, chapter_id, concept_content, exercise_content
+    )
@@ -0,0 +1,164 @@
+"""
+학습 페이지 캐시
+GET /v1/chapter/{id}/learning 응답(SingleLearningPage)을 Redis에 캐싱 (read-through)
+
+키 구조:
+    learning_page:version:{chapter_id}          → 챕터별 버전 (무효화 시 새 고유 값으로 교체)
+    learning_page:v{SCHEMA}:{chapter_id}:{ver}  → 직렬화된 SingleLearningPage
+
+무효화는 버전 키를 새 고유 값으로 바꾸는 방식입니다. 무효화 직전에 DB를 읽은 요청이
+뒤늦게 캐시를 채우더라도 이전 버전 키에 기록되므로 새 요청에는 보이지 않고,
+이전 버전의 페이지는 TTL로 정리됩니다.
+버전은 카운터가 아니라 매번 새로 만든 값이라, 버전 키가 만료·축출(allkeys-lru)되더라도
+조회 시 새 버전이 발급될 뿐 예전 버전 번호가 다시 쓰여 오래된 캐시가 되살아나지 않습니다.
+"""
+
+import logging
+import uuid
+from typing import Optional, Tuple, Iterable
+import redis
+import redis.asyncio as aioredis
+from core.config import settings
+from db.database import redis_client, async_redis_client
+from api.v1.schemas import SingleLearningPage
+
+logger = logging.getLogger(__name__)
+
+# SingleLearningPage 스키마가 바뀌면 올려서 이전 형식의 캐시를 무시
+CACHE_SCHEMA_VERSION = 1
+
+VERSION_KEY = "learning_page:version:{chapter_id}"
+PAGE_KEY_PREFIX = f"learning_page:v{CACHE_SCHEMA_VERSION}:{{chapter_id}}:"
+
+# 버전 조회 + 페이지 조회를 한 번의 왕복으로 처리
+# 버전 키가 없으면 ARGV[2](새 고유 버전)를 발급
+_GET_SCRIPT = """
+local version = redis.call('GET', KEYS[1])
+if not version then
+    version = ARGV[2]
+    redis.call('SET', KEYS[1], version)
+end
+return {version, redis.call('GET', ARGV[1] .. version)}
+"""
+
+
+def new_version() -> str:
+    """새 챕터 버전 (이전에 쓰인 적 없는 고유 값)"""
+    return uuid.uuid4().hex
+
+
+class LearningPageCache:
+    """
+    SingleLearningPage Redis 캐시
+
+    Redis 오류 시에는 캐시를 건너뛰고(fail-open) DB에서 조회하도록 None을 반환합니다.
+    """
+
+    def __init__(self, client: redis.Redis, async_client: aioredis.Redis, ttl: int):
+        self.client = client
+        self.async_client = async_client
+        self.ttl = ttl
+        self._get_script = client.register_script(_GET_SCRIPT)
+        self.stats = {
+            "hit": 0,
+            "miss": 0,
+            "error": 0,
+        }
+
+    def get(self, chapter_id: int) -> Tuple[Optional[SingleLearningPage], Optional[str]]:
+        """
+        캐시 조회
+
+        Returns:
+            (캐시된 페이지 또는 None, 현재 버전 - set()에 그대로 전달)
+        """
+        cached, version = self.get_json(chapter_id)
+        if cached is None:
+            return None, version
+        return SingleLearningPage.model_validate_json(cached), version
+
+    def get_json(self, chapter_id: int) -> Tuple[Optional[bytes], Optional[str]]:
+        """
+        캐시 조회 (직렬화된 JSON 그대로, 응답 본문으로 바로 사용)
+
+        Returns:
+            (캐시된 JSON 또는 None, 현재 버전 - set_json()에 그대로 전달)
+        """
+        try:
+            version, cached = self._get_script(
+                keys=[VERSION_KEY.format(chapter_id=chapter_id)],
+                args=[PAGE_KEY_PREFIX.format(chapter_id=chapter_id), new_version()]
+            )
+        except redis.RedisError as e:
+            self.stats["error"] += 1
+            logger.warning(f"학습 페이지 캐시 조회 실패 - Chapter: {chapter_id}, Error: {e}")
+            return None, None
+
+        if isinstance(version, bytes):
+            version = version.decode()
+        if cached is None:
+            self.stats["miss"] += 1
+            return None, version
+
+        self.stats["hit"] += 1
+        if isinstance(cached, str):
+            cached = cached.encode()
+        return cached, version
+
+    def set(self, chapter_id: int, version: Optional[str], page: SingleLearningPage):
+        """조회 시점의 버전 키에 페이지 저장 (버전이 없으면 저장하지 않음)"""
+        self.set_json(chapter_id, version, page.model_dump_json())
+
+    def set_json(self, chapter_id: int, version: Optional[str], body):
+        """직렬화된 페이지 저장 (응답 본문과 같은 bytes를 그대로 저장)"""
+        if version is None:
+            return
+        try:
+            self.client.setex(
+                PAGE_KEY_PREFIX.format(chapter_id=chapter_id) + version,
+                self.ttl,
+                body
+            )
+        except redis.RedisError as e:
+            self.stats["error"] += 1
+            logger.warning(f"학습 페이지 캐시 저장 실패 - Chapter: {chapter_id}, Error: {e}")
+
+    def invalidate(self, chapter_id: int):
+        """챕터 캐시 무효화"""
+        self.invalidate_many([chapter_id])
+
+    def invalidate_many(self, chapter_ids: Iterable[int]):
+        """
+        여러 챕터 캐시 무효화 (pipeline 1회 왕복)
+        버전 키에는 TTL을 두지 않습니다 (챕터당 키 1개, 사라져도 새 버전이 발급될 뿐 안전).
+        """
+        try:
+            pipe = self.client.pipeline(transaction=False)
+            self._queue_invalidations(pipe, chapter_ids)
+            pipe.execute()
+        except redis.RedisError as e:
+            self.stats["error"] += 1
+            logger.warning(f"학습 페이지 캐시 무효화 실패 - Chapters: {chapter_ids}, Error: {e}")
+
+    async def invalidate_async(self, chapter_id: int):
+        """챕터 캐시 무효화 (async 라우트용)"""
+        await self.invalidate_many_async([chapter_id])
+
+    async def invalidate_many_async(self, chapter_ids: Iterable[int]):
+        """invalidate_many의 async 버전 (이벤트 루프를 막지 않음)"""
+        try:
+            pipe = self.async_client.pipeline(transaction=False)
+            self._queue_invalidations(pipe, chapter_ids)
+            await pipe.execute()
+        except redis.RedisError as e:
+            self.stats["error"] += 1
+            logger.warning(f"학습 페이지 캐시 무효화 실패 - Chapters: {chapter_ids}, Error: {e}")
+
+    def _queue_invalidations(self, pipe, chapter_ids: Iterable[int]):
+        """pipeline에 버전 교체 명령 적재"""
+        for chapter_id in chapter_ids:
+            pipe.set(VERSION_KEY.format(chapter_id=chapter_id), new_version())
+
+
+# 싱글톤 인스턴스
+learning_page_cache = LearningPageCache(redis_client, async_redis_client, settings.LEARNING_PAGE_CACHE_TTL)
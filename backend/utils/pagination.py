@@ -0,0 +1,52 @@
+"""
+Keyset(cursor) 페이지네이션
+(created_at, id) 내림차순 목록에서 마지막 항목의 위치를 불투명한 커서 문자열로 주고받음
+
+OFFSET은 앞쪽 행을 모두 읽고 버리므로 페이지가 깊어질수록 느려지지만,
+커서는 인덱스에서 마지막 위치 바로 다음부터 읽으므로 페이지 깊이와 무관하게 일정합니다.
+
+사용 예시:
+    cursor = encode_cursor(chapter.created_at, chapter.id)
+    created_at, chapter_id = decode_cursor(cursor)
+    query.filter(keyset_before(models.Chapter.created_at, models.Chapter.id, created_at, chapter_id))
+"""
+
+import base64
+import json
+from datetime import datetime
+from typing import Tuple
+from sqlalchemy import and_, or_
+
+
+def encode_cursor(created_at: datetime, row_id: int) -> str:
+    """마지막 항목의 (created_at, id)를 커서 문자열로 변환"""
+    raw = json.dumps([created_at.isoformat(), row_id], separators=(",", ":"))
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> Tuple[datetime, int]:
+    """
+    커서 문자열을 (created_at, id)로 변환
+
+    Raises:
+        ValueError: 형식이 잘못된 커서
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        created_at, row_id = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        return datetime.fromisoformat(created_at), int(row_id)
+    except (ValueError, TypeError) as e:
+        raise ValueError(f"Invalid cursor: {cursor}") from e
+
+
+def keyset_before(created_at_column, id_column, created_at: datetime, row_id: int):
+    """
+    (created_at, id) 내림차순에서 커서 위치 다음 행 조건
+
+    행 값 비교 (created_at, id) < (:c, :i) 는 MySQL이 인덱스 범위로 쓰지 못하는 경우가 있어
+    created_at < :c OR (created_at = :c AND id < :i) 로 풀어 씁니다.
+    """
+    return or_(
+        created_at_column < created_at,
+        and_(created_at_column == created_at, id_column < row_id)
+    )
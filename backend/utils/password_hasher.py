@@ -0,0 +1,102 @@
+"""
+비밀번호 해싱 프로세스 풀
+bcrypt 해싱/검증(약 250ms, CPU 바운드)을 전용 프로세스 풀에서 실행
+
+회원가입/로그인이 anyio 워커 스레드(다른 모든 sync 라우트가 공유)를 점유하지 않고,
+GIL과도 무관하게 코어 수만큼 병렬로 처리됩니다.
+
+워커는 spawn으로 띄웁니다. fork는 부모의 스레드(토큰 캐시 pub/sub 리스너, Kafka 폴러,
+채점 디스패처)가 잡고 있던 락까지 복제해 자식이 교착될 수 있으므로,
+lifespan에서 다른 스레드보다 먼저 start()로 풀을 만듭니다.
+
+사용 예시:
+    hashed = await password_hasher.hash(password)
+    ok = await password_hasher.verify(password, member.password)
+"""
+
+import asyncio
+import logging
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from typing import Optional, Dict, Any
+from core.config import settings
+from api.v1.auth.router import get_password_hash, verify_password
+
+logger = logging.getLogger(__name__)
+
+
+class PasswordHasher:
+    """
+    비밀번호 해싱 전용 프로세스 풀 (start() 또는 첫 사용 시 생성)
+
+    Args:
+        max_workers: 프로세스 수 (None이면 CPU 코어 수)
+    """
+
+    def __init__(self, max_workers: Optional[int] = None):
+        self.max_workers = max_workers
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._pending = 0
+        self.stats = {
+            "submitted": 0,
+            "completed": 0,
+            "max_pending": 0,
+        }
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.max_workers,
+                mp_context=multiprocessing.get_context("spawn")
+            )
+            logger.info(f"비밀번호 해싱 프로세스 풀 생성 - Workers: {self._executor._max_workers}")
+        return self._executor
+
+    def start(self):
+        """프로세스 풀 생성 (lifespan에서 다른 스레드를 띄우기 전에 호출)"""
+        self._get_executor()
+
+    async def _run(self, fn, *args):
+        """프로세스 풀에서 실행하고 대기열 지표 갱신 (이벤트 루프 스레드에서만 호출)"""
+        loop = asyncio.get_running_loop()
+        self._pending += 1
+        self.stats["submitted"] += 1
+        self.stats["max_pending"] = max(self.stats["max_pending"], self._pending)
+        try:
+            return await loop.run_in_executor(self._get_executor(), fn, *args)
+        finally:
+            self._pending -= 1
+            self.stats["completed"] += 1
+
+    async def hash(self, password: str) -> str:
+        """비밀번호 해싱"""
+        return await self._run(get_password_hash, password)
+
+    async def verify(self, plain_password: str, hashed_password: str) -> bool:
+        """평문 비밀번호와 해시 비교"""
+        return await self._run(verify_password, plain_password, hashed_password)
+
+    def get_metrics(self) -> Dict[str, Any]:
+        """
+        대기열 지표
+
+        Returns:
+            Dict: pending(실행 중 + 대기 중 작업 수), queued(워커를 기다리는 작업 수) 등
+        """
+        workers = self._executor._max_workers if self._executor else self.max_workers
+        return {
+            **self.stats,
+            "workers": workers,
+            "pending": self._pending,
+            "queued": max(0, self._pending - (workers or 0)),
+        }
+
+    def shutdown(self):
+        """프로세스 풀 종료"""
+        if self._executor is not None:
+            self._executor.shutdown(wait=True, cancel_futures=True)
+            self._executor = None
+
+
+# 싱글톤 인스턴스
+password_hasher = PasswordHasher(settings.PASSWORD_HASH_WORKERS)
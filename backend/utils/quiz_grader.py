@@ -0,0 +1,161 @@
+"""
+QuizGrader 클라이언트 (n8n /webhook/grade1, Gemini 채점)
+로컬 채점 엔진(answer_grader)이 확신하지 못한 답안만 재채점
+
+요청 (webhook.txt의 퀴즈 정답 제출 형식):
+    {"output": {"courseTitle", "courseDescription", "contents": [{"id", "quiz", "answer", "correct_answer"}, ...]}}
+    - id는 응답을 요청 항목과 맞추기 위한 순번, correct_answer는 DB에 저장된 정답 (채점 참고용)
+응답:
+    {"scores": [{"id", "score", "correct_answer"}, ...]}
+"""
+
+import logging
+import time
+from typing import List, Dict, Any, Optional
+import httpx
+from core.config import settings
+from utils.answer_grader import grade_answer
+
+logger = logging.getLogger(__name__)
+
+# QuizGrader가 점수 대신 판정 문자열을 돌려주는 경우
+_VERDICT_SCORES = {"correct": 100.0, "incorrect": 0.0}
+
+
+def parse_score(score: Any) -> Optional[float]:
+    """QuizGrader 점수 해석 (숫자, "80", "80%", "correct"/"incorrect" → 0~100, 해석할 수 없으면 None)"""
+    if isinstance(score, (int, float)) and not isinstance(score, bool):
+        return max(0.0, min(100.0, float(score)))
+    if isinstance(score, str):
+        text = score.strip().lower()
+        if text in _VERDICT_SCORES:
+            return _VERDICT_SCORES[text]
+        try:
+            return max(0.0, min(100.0, float(text.rstrip("%"))))
+        except ValueError:
+            return None
+    return None
+
+
+class QuizGraderClient:
+    """
+    QuizGrader webhook 클라이언트
+
+    요청 실패 시에는 예외 대신 None 점수를 돌려주고, 호출자는 로컬 판정을 그대로 사용합니다.
+
+    Args:
+        url: QuizGrader webhook URL (비어 있으면 비활성화)
+        timeout: 요청 타임아웃 (초)
+    """
+
+    def __init__(self, url: str, timeout: float):
+        self.url = url
+        self.timeout = timeout
+        self._client: Optional[httpx.Client] = None
+        self.stats = {
+            "requests": 0,
+            "items": 0,
+            "errors": 0,
+        }
+
+    @property
+    def enabled(self) -> bool:
+        return bool(self.url)
+
+    def _get_client(self) -> httpx.Client:
+        # 커넥션 재사용 (요청마다 TCP/TLS 연결을 새로 맺지 않음)
+        if self._client is None:
+            self._client = httpx.Client(timeout=self.timeout)
+        return self._client
+
+    def grade(self, items: List[Dict[str, Any]]) -> List[Optional[float]]:
+        """
+        답안 여러 개를 한 번의 요청으로 채점
+
+        Args:
+            items: [{"quiz": 문제, "answer": 학생 답안, "correct_answer": 정답}, ...]
+
+        Returns:
+            List: items와 같은 순서의 점수 (0~100, 채점하지 못한 항목은 None)
+        """
+        if not items or not self.enabled:
+            return [None] * len(items)
+
+        payload = {
+            "output": {
+                "courseTitle": "",
+                "courseDescription": "",
+                "contents": [{"id": index, **item} for index, item in enumerate(items)]
+            }
+        }
+        self.stats["requests"] += 1
+        self.stats["items"] += len(items)
+        try:
+            response = self._get_client().post(self.url, json=payload)
+            response.raise_for_status()
+            scores = response.json()["scores"]
+        except (httpx.HTTPError, ValueError, KeyError, TypeError) as e:
+            self.stats["errors"] += 1
+            logger.warning(f"QuizGrader 채점 실패 - Items: {len(items)}, Error: {e}")
+            return [None] * len(items)
+
+        results: List[Optional[float]] = [None] * len(items)
+        for position, entry in enumerate(scores if isinstance(scores, list) else []):
+            if not isinstance(entry, dict):
+                continue
+            # id를 돌려주면 id로, 아니면 순서대로 매칭
+            try:
+                index = int(entry.get("id", position))
+            except (TypeError, ValueError):
+                index = position
+            if 0 <= index < len(items):
+                results[index] = parse_score(entry.get("score"))
+        return results
+
+    def close(self):
+        """커넥션 풀 정리"""
+        if self._client is not None:
+            self._client.close()
+            self._client = None
+
+
+class StubQuizGrader:
+    """
+    QuizGrader 대역 (테스트, 벤치마크, n8n 없이 로컬 개발할 때 QUIZ_GRADER_URL=stub)
+
+    요청 1회 지연과 답안당 지연을 흉내 내고, 로컬 채점 엔진 판정을 100/0점으로 돌려줍니다.
+
+    Args:
+        latency: 요청 1회 고정 지연 (초, LLM 호출 왕복)
+        per_item: 답안 1개당 추가 지연 (초)
+    """
+
+    enabled = True
+
+    def __init__(self, latency: float = 0.0, per_item: float = 0.0):
+        self.latency = latency
+        self.per_item = per_item
+        self.stats = {
+            "requests": 0,
+            "items": 0,
+            "errors": 0,
+        }
+
+    def grade(self, items: List[Dict[str, Any]]) -> List[Optional[float]]:
+        self.stats["requests"] += 1
+        self.stats["items"] += len(items)
+        time.sleep(self.latency + self.per_item * len(items))
+        return [
+            100.0 if grade_answer({"answer": item["correct_answer"], "type": None}, item["answer"])[0] else 0.0
+            for item in items
+        ]
+
+    def close(self):
+        pass
+
+
+# 싱글톤 인스턴스
+if settings.QUIZ_GRADER_URL == "stub":
+    quiz_grader = StubQuizGrader(latency=1.0, per_item=0.01)
+else:
+    quiz_grader = QuizGraderClient(settings.QUIZ_GRADER_URL, settings.QUIZ_GRADER_TIMEOUT)
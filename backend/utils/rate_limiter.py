@@ -0,0 +1,179 @@
+"""
+AI 생성 요청 유입 제한 (Redis 토큰 버킷)
+질문 1개가 AI 생성 3건으로 이어지므로, 질문 등록 라우트가 생성 요청을 outbox에 기록하기 직전에
+admit_generation()으로 확인해 급증한 요청을 429로 돌려보냄
+
+- 사용자별 버킷과 전체 버킷을 Lua 스크립트 하나로 확인/차감 (Redis 왕복 1회, 여러 API 워커가 공유)
+- 토큰 단위는 실제로 AI 생성을 요청하는 질문 수 (일괄 등록은 질문 수만큼 차감)
+  본문 검증에 실패한 요청(422/400)이나 생성 캐시/유사 질문으로 바로 완료되는 질문은 차감하지 않음
+- 버킷 용량보다 큰 요청은 버킷이 가득 찼을 때 받아들이고 토큰을 음수(빚)로 남김
+  → 다음 요청은 빚을 갚을 만큼 충전된 뒤에 허용되므로 장기 평균 속도는 그대로 유지
+- 거절 시 Retry-After 헤더로 다시 시도할 수 있는 시각을 알림
+- Redis 오류 시에는 제한 없이 허용 (질문 등록이 막히는 것보다 나음)
+
+키 구조:
+    rate_limit:generation:user:{user_id}  → 사용자별 버킷 (hash: tokens, ts)
+    rate_limit:generation:global          → 전체 버킷 (hash: tokens, ts)
+    가득 찰 때까지의 시간만큼만 유지 (키가 없으면 가득 찬 버킷)
+"""
+
+import logging
+import math
+from typing import Dict, Any, Optional, Tuple
+import redis
+import redis.asyncio as aioredis
+from fastapi import HTTPException
+from core.config import settings
+from db.database import async_redis_client
+
+logger = logging.getLogger(__name__)
+
+USER_BUCKET_KEY = "rate_limit:generation:user:{user_id}"
+GLOBAL_BUCKET_KEY = "rate_limit:generation:global"
+
+USER = "user"
+GLOBAL = "global"
+
+# KEYS[1]=사용자 버킷, KEYS[2]=전체 버킷
+# ARGV[1]=차감할 토큰, ARGV[2]/ARGV[3]=사용자 충전 속도(초당)/용량, ARGV[4]/ARGV[5]=전체 충전 속도/용량
+# 반환: {1, 0, 사용자 버킷 남은 토큰} 또는 {0, 거절한 버킷(1=사용자, 2=전체), 다시 시도까지 남은 초}
+# (Lua 숫자는 정수로 잘려 반환되므로 소수는 문자열로)
+_ACQUIRE_SCRIPT = """
+local time = redis.call('TIME')
+local now = tonumber(time[1]) + tonumber(time[2]) / 1000000
+local cost = tonumber(ARGV[1])
+
+local function refill(key, rate, burst)
+    local state = redis.call('HMGET', key, 'tokens', 'ts')
+    local tokens = tonumber(state[1]) or burst
+    local ts = tonumber(state[2]) or now
+    return math.min(burst, tokens + math.max(0, now - ts) * rate)
+end
+
+local function wait(tokens, rate, burst)
+    local need = math.min(cost, burst) - tokens
+    if need <= 0 then
+        return 0
+    end
+    return need / rate
+end
+
+local function save(key, tokens, rate, burst)
+    redis.call('HSET', key, 'tokens', tostring(tokens), 'ts', tostring(now))
+    redis.call('EXPIRE', key, math.ceil((burst - tokens) / rate) + 1)
+end
+
+local user_rate, user_burst = tonumber(ARGV[2]), tonumber(ARGV[3])
+local global_rate, global_burst = tonumber(ARGV[4]), tonumber(ARGV[5])
+local user_tokens = refill(KEYS[1], user_rate, user_burst)
+local global_tokens = refill(KEYS[2], global_rate, global_burst)
+
+-- 거절 시에는 저장하지 않음 (다음 호출에서 시각 기준으로 다시 계산)
+local user_wait = wait(user_tokens, user_rate, user_burst)
+local global_wait = wait(global_tokens, global_rate, global_burst)
+if user_wait > 0 or global_wait > 0 then
+    if user_wait >= global_wait then
+        return {0, 1, tostring(user_wait)}
+    end
+    return {0, 2, tostring(global_wait)}
+end
+
+save(KEYS[1], user_tokens - cost, user_rate, user_burst)
+save(KEYS[2], global_tokens - cost, global_rate, global_burst)
+return {1, 0, tostring(user_tokens - cost)}
+"""
+
+_SCOPES = {1: USER, 2: GLOBAL}
+
+
+class TokenBucketLimiter:
+    """
+    사용자별 + 전체 토큰 버킷
+
+    Args:
+        client: 비동기 Redis 클라이언트
+        user_rate: 사용자별 초당 충전 토큰
+        user_burst: 사용자별 버킷 용량 (연속으로 보낼 수 있는 최대 질문 수)
+        global_rate: 전체 초당 충전 토큰
+        global_burst: 전체 버킷 용량
+    """
+
+    def __init__(self, client: aioredis.Redis, user_rate: float, user_burst: int,
+                 global_rate: float, global_burst: int):
+        self.client = client
+        self.user_rate = user_rate
+        self.user_burst = user_burst
+        self.global_rate = global_rate
+        self.global_burst = global_burst
+        self._acquire_script = client.register_script(_ACQUIRE_SCRIPT)
+        self.stats = {
+            "allowed": 0,
+            "rejected_user": 0,
+            "rejected_global": 0,
+            "error": 0,
+        }
+
+    async def acquire(self, user_id: int, cost: int = 1) -> Tuple[bool, Optional[str], float]:
+        """
+        토큰 차감 시도
+
+        Args:
+            user_id: 요청한 사용자
+            cost: 차감할 토큰 (등록할 질문 수)
+
+        Returns:
+            (허용 여부, 거절한 버킷(USER/GLOBAL, 허용 시 None), 다시 시도까지 남은 초(허용 시 0))
+        """
+        try:
+            allowed, scope, value = await self._acquire_script(
+                keys=[USER_BUCKET_KEY.format(user_id=user_id), GLOBAL_BUCKET_KEY],
+                args=[cost, self.user_rate, self.user_burst, self.global_rate, self.global_burst]
+            )
+        except redis.RedisError as e:
+            self.stats["error"] += 1
+            logger.warning(f"생성 요청 유입 제한 확인 실패, 허용 - User: {user_id}, Error: {e}")
+            return True, None, 0.0
+
+        if int(allowed):
+            self.stats["allowed"] += 1
+            return True, None, 0.0
+        scope = _SCOPES[int(scope)]
+        self.stats[f"rejected_{scope}"] += 1
+        return False, scope, float(value)
+
+    def get_metrics(self) -> Dict[str, Any]:
+        """유입 제한 지표 (허용/거절 수와 거절 비율)"""
+        rejected = self.stats["rejected_user"] + self.stats["rejected_global"]
+        total = self.stats["allowed"] + rejected
+        return {
+            **self.stats,
+            "reject_rate": rejected / total if total else 0.0,
+        }
+
+
+async def admit_generation(user_id: int, cost: int):
+    """
+    토큰이 부족하면 429 (Retry-After: 다시 시도할 수 있을 때까지의 초)
+
+    Raises:
+        HTTPException: 사용자별 또는 전체 버킷의 토큰이 부족한 경우 429 에러
+    """
+    allowed, scope, retry_after = await generation_limiter.acquire(user_id, cost)
+    if allowed:
+        return
+    retry_after = max(1, math.ceil(retry_after))
+    raise HTTPException(
+        status_code=429,
+        detail={"message": "Too many generation requests", "scope": scope, "retry_after": retry_after},
+        headers={"Retry-After": str(retry_after)}
+    )
+
+
+# 싱글톤 인스턴스
+generation_limiter = TokenBucketLimiter(
+    async_redis_client,
+    settings.GENERATION_USER_RATE,
+    settings.GENERATION_USER_BURST,
+    settings.GENERATION_GLOBAL_RATE,
+    settings.GENERATION_GLOBAL_BURST
+)
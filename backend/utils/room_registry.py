@@ -0,0 +1,98 @@
+"""
+Socket.IO 룸 멤버 레지스트리
+여러 워커에 흩어진 클라이언트의 룸 멤버십을 Redis 집합으로 공유
+
+Socket.IO 클라이언트 매니저는 각 워커가 자기 프로세스에 연결된 sid만 알고 있으므로,
+"이 챕터 룸에 지금 누가 있는가"는 워커끼리 공유하는 저장소가 있어야 답할 수 있습니다.
+
+키 구조:
+    socketio:room:{room} → 룸에 참여 중인 sid 집합
+
+워커가 비정상 종료되면 그 워커의 sid가 집합에 남을 수 있으므로,
+참여할 때마다 TTL을 갱신해 활동이 없는 룸은 만료되도록 합니다.
+"""
+
+import logging
+from typing import Iterable, Dict
+import redis
+import redis.asyncio as aioredis
+from core.config import settings
+from db.database import async_redis_client
+
+logger = logging.getLogger(__name__)
+
+ROOM_KEY = "socketio:room:{room}"
+
+
+class RoomRegistry:
+    """
+    룸 멤버 레지스트리
+
+    Redis 오류 시에는 로그만 남기고 넘어갑니다 (이벤트 전달 자체는 pub/sub이 담당).
+
+    Args:
+        client: 비동기 Redis 클라이언트
+        ttl: 룸 멤버 집합 유지 시간 (초)
+    """
+
+    def __init__(self, client: aioredis.Redis, ttl: int):
+        self.client = client
+        self.ttl = ttl
+
+    async def join(self, room: str, sid: str):
+        """룸 참여 기록"""
+        key = ROOM_KEY.format(room=room)
+        try:
+            pipe = self.client.pipeline(transaction=False)
+            pipe.sadd(key, sid)
+            pipe.expire(key, self.ttl)
+            await pipe.execute()
+        except redis.RedisError as e:
+            logger.warning(f"룸 참여 기록 실패 - Room: {room}, SID: {sid}, Error: {e}")
+
+    async def leave(self, room: str, sid: str):
+        """룸 나가기 기록"""
+        await self.leave_all(sid, [room])
+
+    async def leave_all(self, sid: str, rooms: Iterable[str]):
+        """여러 룸에서 sid 제거 (연결 해제 시, pipeline 1회 왕복)"""
+        rooms = list(rooms)
+        if not rooms:
+            return
+        try:
+            pipe = self.client.pipeline(transaction=False)
+            for room in rooms:
+                pipe.srem(ROOM_KEY.format(room=room), sid)
+            await pipe.execute()
+        except redis.RedisError as e:
+            logger.warning(f"룸 나가기 기록 실패 - Rooms: {rooms}, SID: {sid}, Error: {e}")
+
+    async def size(self, room: str) -> int:
+        """룸에 참여 중인 클라이언트 수 (모든 워커 합산, 조회 실패 시 -1)"""
+        try:
+            return await self.client.scard(ROOM_KEY.format(room=room))
+        except redis.RedisError as e:
+            logger.warning(f"룸 크기 조회 실패 - Room: {room}, Error: {e}")
+            return -1
+
+    async def sizes(self, rooms: Iterable[str]) -> Dict[str, int]:
+        """
+        여러 룸의 클라이언트 수 (pipeline 1회 왕복)
+
+        Returns:
+            Dict: 룸 이름 → 클라이언트 수 (조회 실패 시 모두 -1)
+        """
+        rooms = list(rooms)
+        try:
+            pipe = self.client.pipeline(transaction=False)
+            for room in rooms:
+                pipe.scard(ROOM_KEY.format(room=room))
+            counts = await pipe.execute()
+        except redis.RedisError as e:
+            logger.warning(f"룸 크기 조회 실패 - Rooms: {rooms}, Error: {e}")
+            counts = [-1] * len(rooms)
+        return dict(zip(rooms, counts))
+
+
+# 싱글톤 인스턴스
+room_registry = RoomRegistry(async_redis_client, settings.SOCKETIO_ROOM_TTL)
@@ -0,0 +1,279 @@
+"""
+유사 질문 색인 (MinHash + LSH, in-memory)
+띄어쓰기/조사/문장부호만 다른 질문을 찾아 이미 생성된 챕터의 결과를 재사용
+
+- 완료된 챕터 제목을 정규화 → 글자 2-gram 집합 → MinHash 시그니처 → LSH 밴드 버킷에 등록
+- 조회 시 같은 버킷에 들어온 후보만 실제 Jaccard 유사도로 다시 비교 (후보가 적어 O(1)에 가까움)
+- 같은 프로세스의 webhook 완료는 add()로 바로 반영하고,
+  다른 프로세스(kafka_consumer)에서 완료된 챕터는 sync()가 updated_at 기준으로 주기적으로 가져옴
+- 프로세스마다 색인을 따로 가지며 재시작 시 최근 완료된 챕터부터 다시 채움
+  (앱 시작 시 warm_up()으로 미리 채우고, MinHash 계산은 SYNC_CHUNK_SIZE개씩 스레드 풀에서 수행해
+   수만 개를 색인하는 동안에도 이벤트 루프를 막지 않음)
+"""
+
+import asyncio
+import hashlib
+import logging
+import random
+import re
+import time
+import unicodedata
+from collections import OrderedDict, defaultdict
+from datetime import datetime
+from typing import Optional, Dict, List, Set, Tuple, FrozenSet
+from sqlalchemy import select
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.ext.asyncio import AsyncSession
+from core.config import settings
+from db import models
+from db.database import AsyncSessionLocal
+
+logger = logging.getLogger(__name__)
+
+SHINGLE_SIZE = 2  # 한글은 음절 하나의 정보량이 커서 2-gram 사용
+NUM_PERM = 64  # MinHash 해시 함수 수
+BANDS = 16  # LSH 밴드 수 (밴드당 4행 → 유사도 약 0.5 이상이면 후보가 될 확률이 높음)
+HASH_SEED = 20240101  # 프로세스가 달라도 같은 시그니처가 나오도록 고정
+SYNC_CHUNK_SIZE = 1000  # sync()가 한 번에 스레드 풀로 넘겨 MinHash를 계산하는 챕터 수
+
+_MERSENNE_PRIME = (1 << 61) - 1
+
+# 영문/숫자와 한글을 따로 나눔 ("decorator란" → "decorator", "란")
+_TOKEN = re.compile(r"[0-9a-z]+|[가-힣]+")
+
+# 명사 뒤에 붙는 조사 (긴 것부터 비교, 떼고 남은 부분이 2글자 이상일 때만 제거)
+_PARTICLES = (
+    "에서는", "으로는", "에서", "으로", "이랑", "에게", "까지", "부터", "처럼", "보다", "하고", "이란",
+    "은", "는", "이", "가", "을", "를", "와", "과", "랑", "의", "에", "로", "도", "만", "란",
+)
+
+# 질문 끝의 의문형 어미 (내용과 무관하므로 제거)
+_QUESTION_ENDINGS = (
+    "알려주세요", "무엇인가요", "뭐예요", "뭔가요", "뭐에요", "인가요", "인지", "일까요", "나요", "요",
+)
+
+
+def _strip_particle(token: str) -> str:
+    for particle in _PARTICLES:
+        if token.endswith(particle) and len(token) - len(particle) >= 2:
+            return token[:-len(particle)]
+    return token
+
+
+def normalize_title(title: Optional[str]) -> str:
+    """
+    한국어 질문 정규화 (전각/반각 통일, 소문자, 문장부호 제거, 조사 제거, 띄어쓰기 무시)
+
+    "파이썬 리스트와 튜플 차이가 뭐예요?" 와 "파이썬에서 리스트랑 튜플의 차이는 뭔가요" 는
+    둘 다 "파이썬리스트튜플차이" 가 됩니다.
+    """
+    if not title:
+        return ""
+    text = unicodedata.normalize("NFKC", title).lower()
+    tokens = []
+    for token in _TOKEN.findall(text):
+        if token.isascii():
+            tokens.append(token)
+        elif tokens and tokens[-1].isascii() and token in _PARTICLES:
+            continue  # 영문 용어 뒤에 붙은 조사
+        else:
+            tokens.append(_strip_particle(token))
+    normalized = "".join(tokens)
+    for ending in _QUESTION_ENDINGS:
+        if normalized.endswith(ending) and len(normalized) > len(ending):
+            normalized = normalized[:-len(ending)]
+            break
+    return normalized
+
+
+def title_shingles(title: Optional[str]) -> FrozenSet[str]:
+    """정규화한 제목의 글자 n-gram 집합 (제목이 n보다 짧으면 제목 전체)"""
+    text = normalize_title(title)
+    if len(text) <= SHINGLE_SIZE:
+        return frozenset([text]) if text else frozenset()
+    return frozenset(text[i:i + SHINGLE_SIZE] for i in range(len(text) - SHINGLE_SIZE + 1))
+
+
+def jaccard(a: FrozenSet[str], b: FrozenSet[str]) -> float:
+    """두 n-gram 집합의 Jaccard 유사도"""
+    if not a or not b:
+        return 0.0
+    return len(a & b) / len(a | b)
+
+
+class SimilarQuestionIndex:
+    """
+    완료된 챕터 제목의 MinHash LSH 색인
+
+    Args:
+        maxsize: 색인할 최대 챕터 수 (초과 시 가장 오래 전에 색인된 챕터부터 제거)
+        refresh_interval: sync()가 DB에서 새로 완료된 챕터를 가져오는 최소 간격 (초)
+    """
+
+    def __init__(self, maxsize: int, refresh_interval: float, num_perm: int = NUM_PERM, bands: int = BANDS):
+        self.maxsize = maxsize
+        self.refresh_interval = refresh_interval
+        self.bands = bands
+        self.rows = num_perm // bands
+        rng = random.Random(HASH_SEED)
+        self._perms = [
+            (rng.randrange(1, _MERSENNE_PRIME), rng.randrange(0, _MERSENNE_PRIME))
+            for _ in range(self.bands * self.rows)
+        ]
+        self._shingles: "OrderedDict[int, FrozenSet[str]]" = OrderedDict()  # chapter_id → n-gram 집합
+        self._band_keys: Dict[int, List[Tuple[int, int]]] = {}  # chapter_id → 등록된 버킷 키
+        self._buckets: Dict[Tuple[int, int], Set[int]] = defaultdict(set)  # (밴드, 밴드 해시) → chapter_id
+        self._watermark: Optional[datetime] = None  # sync()가 마지막으로 본 updated_at
+        self._synced_at: Optional[float] = None
+        self.stats = {
+            "lookups": 0,
+            "candidates": 0,
+            "matched": 0,
+            "sync_error": 0,
+        }
+
+    def __len__(self) -> int:
+        return len(self._shingles)
+
+    def _signature(self, shingles: FrozenSet[str]) -> List[int]:
+        hashes = [
+            int.from_bytes(hashlib.blake2b(shingle.encode(), digest_size=8).digest(), "big")
+            for shingle in shingles
+        ]
+        return [min((a * h + b) % _MERSENNE_PRIME for h in hashes) for a, b in self._perms]
+
+    def _bucket_keys(self, shingles: FrozenSet[str]) -> List[Tuple[int, int]]:
+        signature = self._signature(shingles)
+        return [
+            (band, hash(tuple(signature[band * self.rows:(band + 1) * self.rows])))
+            for band in range(self.bands)
+        ]
+
+    def _prepare(self, rows) -> List[Tuple[int, FrozenSet[str], List[Tuple[int, int]]]]:
+        """제목의 n-gram 집합과 버킷 키 계산 (색인 상태를 건드리지 않으므로 스레드 풀에서 실행 가능)"""
+        prepared = []
+        for chapter_id, title in rows:
+            shingles = title_shingles(title)
+            prepared.append((chapter_id, shingles, self._bucket_keys(shingles) if shingles else []))
+        return prepared
+
+    def add(self, chapter_id: int, title: Optional[str]):
+        """완료된 챕터 색인 (이미 있으면 갱신)"""
+        self._insert(*self._prepare([(chapter_id, title)])[0])
+
+    def _insert(self, chapter_id: int, shingles: FrozenSet[str], keys: List[Tuple[int, int]]):
+        """_prepare()로 계산한 챕터 등록"""
+        self.remove(chapter_id)
+        if not shingles:
+            return
+        for key in keys:
+            self._buckets[key].add(chapter_id)
+        self._shingles[chapter_id] = shingles
+        self._band_keys[chapter_id] = keys
+
+        while len(self._shingles) > self.maxsize:
+            self.remove(next(iter(self._shingles)))
+
+    def remove(self, chapter_id: int):
+        """색인에서 제거 (삭제되었거나 더 이상 재사용할 수 없는 챕터)"""
+        if self._shingles.pop(chapter_id, None) is None:
+            return
+        for key in self._band_keys.pop(chapter_id):
+            bucket = self._buckets[key]
+            bucket.discard(chapter_id)
+            if not bucket:
+                del self._buckets[key]
+
+    def query(self, title: str, threshold: float) -> Optional[Tuple[int, float]]:
+        """
+        가장 비슷한 완료 챕터 조회
+
+        Args:
+            title: 새 질문
+            threshold: 최소 Jaccard 유사도
+
+        Returns:
+            (chapter_id, 유사도) 또는 None
+        """
+        self.stats["lookups"] += 1
+        shingles = title_shingles(title)
+        if not shingles:
+            return None
+
+        candidates = set()
+        for key in self._bucket_keys(shingles):
+            candidates |= self._buckets.get(key, set())
+        self.stats["candidates"] += len(candidates)
+
+        best = None
+        for chapter_id in candidates:
+            similarity = jaccard(shingles, self._shingles[chapter_id])
+            # 유사도가 같으면 먼저 완료된(id가 작은) 원본 챕터 우선
+            if similarity >= threshold and (best is None or (similarity, -chapter_id) > (best[1], -best[0])):
+                best = (chapter_id, similarity)
+        if best:
+            self.stats["matched"] += 1
+        return best
+
+    async def sync(self, db: AsyncSession):
+        """
+        마지막 동기화 이후 완료된 챕터를 DB에서 가져와 색인 (refresh_interval마다 최대 1회)
+        첫 호출은 최근 완료된 챕터 maxsize개로 색인을 채웁니다.
+        MinHash 계산은 SYNC_CHUNK_SIZE개씩 스레드 풀에서 하고 색인 등록만 이벤트 루프에서 하므로,
+        채우는 동안 들어온 요청은 기다리지 않고 지금까지 채워진 색인으로 조회합니다.
+        """
+        now = time.monotonic()
+        if self._synced_at is not None and now - self._synced_at < self.refresh_interval:
+            return
+        # 동시에 들어온 요청이 같은 조회를 반복하지 않도록 먼저 기록
+        self._synced_at = now
+
+        query = select(models.Chapter.id, models.Chapter.title, models.Chapter.updated_at).where(
+            models.Chapter.status == models.StatusEnum.completed
+        )
+        if self._watermark is None:
+            query = query.order_by(models.Chapter.updated_at.desc()).limit(self.maxsize)
+        else:
+            # 같은 시각에 갱신된 챕터를 놓치지 않도록 >= (다시 색인해도 결과는 같음)
+            query = query.where(models.Chapter.updated_at >= self._watermark) \
+                .order_by(models.Chapter.updated_at).limit(self.maxsize)
+
+        try:
+            rows = (await db.execute(query)).all()
+        except SQLAlchemyError as e:
+            self.stats["sync_error"] += 1
+            logger.warning(f"유사 질문 색인 동기화 실패 - Error: {e}")
+            return
+
+        rows = sorted(rows, key=lambda row: row.updated_at or datetime.min)
+        loop = asyncio.get_running_loop()
+        for start in range(0, len(rows), SYNC_CHUNK_SIZE):
+            chunk = rows[start:start + SYNC_CHUNK_SIZE]
+            prepared = await loop.run_in_executor(
+                None, self._prepare, [(chapter_id, title) for chapter_id, title, _ in chunk]
+            )
+            for entry, (_, _, updated_at) in zip(prepared, chunk):
+                self._insert(*entry)
+                if updated_at and (self._watermark is None or updated_at > self._watermark):
+                    self._watermark = updated_at
+
+    async def warm_up(self):
+        """앱 시작 시 색인 채우기 (첫 질문 등록 요청이 전체 색인 구축을 떠안지 않도록)"""
+        try:
+            async with AsyncSessionLocal() as db:
+                await self.sync(db)
+        except Exception as e:
+            # 색인이 비어 있어도 요청 처리에는 문제 없음 (다음 sync()가 다시 채움)
+            self._synced_at = None
+            logger.warning(f"유사 질문 색인 초기화 실패 - Error: {e}")
+
+    def get_metrics(self) -> Dict[str, int]:
+        """색인 지표 (색인된 챕터 수 포함)"""
+        return {**self.stats, "size": len(self)}
+
+
+# 싱글톤 인스턴스
+similar_question_index = SimilarQuestionIndex(
+    settings.SIMILAR_QUESTION_INDEX_MAXSIZE,
+    settings.SIMILAR_QUESTION_REFRESH_INTERVAL
+)
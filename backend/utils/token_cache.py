@@ -0,0 +1,206 @@
+"""
+검증된 JWT 토큰의 프로세스 내 캐시
+require_auth가 매 요청마다 JWT 디코딩 + Redis GET을 하지 않도록 검증 결과를 캐싱
+
+- 토큰 해시(SHA-256)를 키로 하는 LRU + TTL 캐시 (원문 토큰은 메모리에 남기지 않음)
+- 로그아웃/재로그인 시 Redis pub/sub(auth:token-invalidate)으로 user_id를 브로드캐스트하여
+  모든 워커 프로세스의 캐시에서 해당 사용자의 토큰을 제거
+- pub/sub 연결이 끊겼다가 다시 붙으면 그 사이 메시지를 놓쳤을 수 있으므로 캐시 전체를 비움
+- 구독 중이 아닐 때(리스너 미실행/연결 끊김)는 무효화를 받을 수 없으므로 캐시를 사용하지 않음
+"""
+
+import hashlib
+import logging
+import threading
+import time
+from collections import OrderedDict
+from typing import Optional, Dict, Any, Set
+import redis
+import redis.asyncio as aioredis
+from core.config import settings
+from db.database import redis_client, async_redis_client
+
+logger = logging.getLogger(__name__)
+
+INVALIDATE_CHANNEL = "auth:token-invalidate"
+
+
+def hash_token(token: str) -> str:
+    """캐시 키로 사용할 토큰 해시"""
+    return hashlib.sha256(token.encode()).hexdigest()
+
+
+class TokenCache:
+    """
+    검증된 토큰 캐시 (thread-safe, sync 의존성이 threadpool에서 실행되므로 lock 사용)
+
+    Args:
+        client: pub/sub에 사용할 Redis 클라이언트
+        async_client: async 라우트에서 무효화를 발행할 비동기 Redis 클라이언트
+        maxsize: 최대 캐시 항목 수 (초과 시 가장 오래 사용되지 않은 항목 제거)
+        ttl: 캐시 유지 시간 (초), 토큰 만료 시각이 더 이르면 그에 맞춤
+    """
+
+    def __init__(self, client: redis.Redis, async_client: aioredis.Redis, maxsize: int, ttl: float):
+        self.client = client
+        self.async_client = async_client
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._entries: "OrderedDict[str, tuple]" = OrderedDict()  # token_hash → (user_info, expires_at)
+        self._by_user: Dict[int, Set[str]] = {}
+        self._lock = threading.Lock()
+        self._listener_thread: Optional[threading.Thread] = None
+        self._listener_stop = threading.Event()
+        self._subscribed = False
+        self._epoch = 0  # 무효화가 일어날 때마다 증가
+        self.stats = {
+            "hit": 0,
+            "miss": 0,
+            "invalidated": 0,
+        }
+
+    def get(self, token: str) -> Optional[Dict[str, Any]]:
+        """캐시된 사용자 정보 반환 (없거나 만료되면 None)"""
+        if not self._subscribed:
+            return None
+        key = hash_token(token)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.stats["miss"] += 1
+                return None
+            user_info, expires_at = entry
+            if expires_at <= time.monotonic():
+                self._remove(key)
+                self.stats["miss"] += 1
+                return None
+            self._entries.move_to_end(key)
+            self.stats["hit"] += 1
+            return user_info
+
+    @property
+    def epoch(self) -> int:
+        """현재 무효화 epoch (검증 시작 전에 읽어 set()에 전달)"""
+        return self._epoch
+
+    def set(self, token: str, user_info: Dict[str, Any], epoch: int, token_exp: Optional[float] = None):
+        """
+        검증된 토큰 저장
+
+        검증 도중(Redis 조회 후 저장 전) 무효화가 일어났다면 epoch가 달라지므로 저장하지 않습니다.
+
+        Args:
+            token: JWT 토큰
+            user_info: verify_token 반환값 (user_id 포함)
+            epoch: 검증 시작 시점의 epoch
+            token_exp: JWT exp (epoch 초), 있으면 캐시 만료를 그 이전으로 제한
+        """
+        if not self._subscribed:
+            return
+        ttl = self.ttl
+        if token_exp is not None:
+            ttl = min(ttl, token_exp - time.time())
+        if ttl <= 0:
+            return
+
+        key = hash_token(token)
+        user_id = user_info["user_id"]
+        with self._lock:
+            if epoch != self._epoch:
+                return
+            self._entries[key] = (user_info, time.monotonic() + ttl)
+            self._entries.move_to_end(key)
+            self._by_user.setdefault(user_id, set()).add(key)
+            while len(self._entries) > self.maxsize:
+                oldest = next(iter(self._entries))
+                self._remove(oldest)
+
+    def _remove(self, key: str):
+        """항목 제거 (lock 안에서 호출)"""
+        entry = self._entries.pop(key, None)
+        if entry is None:
+            return
+        user_id = entry[0]["user_id"]
+        keys = self._by_user.get(user_id)
+        if keys is not None:
+            keys.discard(key)
+            if not keys:
+                del self._by_user[user_id]
+
+    def invalidate_user(self, user_id: int):
+        """이 프로세스에서 사용자의 캐시된 토큰 제거"""
+        with self._lock:
+            self._epoch += 1
+            for key in list(self._by_user.get(user_id, ())):
+                self._remove(key)
+                self.stats["invalidated"] += 1
+
+    def clear(self):
+        """캐시 전체 비우기"""
+        with self._lock:
+            self._epoch += 1
+            self._entries.clear()
+            self._by_user.clear()
+
+    def broadcast_invalidation(self, user_id: int):
+        """
+        모든 워커에 사용자 토큰 무효화 전파 (로그아웃/재로그인 시 호출)
+        로컬 캐시는 pub/sub 전달을 기다리지 않고 즉시 제거합니다.
+        """
+        self.invalidate_user(user_id)
+        try:
+            self.client.publish(INVALIDATE_CHANNEL, str(user_id))
+        except redis.RedisError as e:
+            logger.error(f"토큰 무효화 브로드캐스트 실패 - User: {user_id}, Error: {e}")
+
+    async def broadcast_invalidation_async(self, user_id: int):
+        """broadcast_invalidation의 async 버전 (이벤트 루프를 막지 않음)"""
+        self.invalidate_user(user_id)
+        try:
+            await self.async_client.publish(INVALIDATE_CHANNEL, str(user_id))
+        except redis.RedisError as e:
+            logger.error(f"토큰 무효화 브로드캐스트 실패 - User: {user_id}, Error: {e}")
+
+    # ==================== pub/sub 리스너 ====================
+
+    def start_listener(self):
+        """무효화 메시지를 수신하는 백그라운드 스레드 시작"""
+        if self._listener_thread is not None:
+            return
+        self._listener_stop.clear()
+        self._listener_thread = threading.Thread(
+            target=self._listen_loop,
+            name="token-cache-invalidation",
+            daemon=True
+        )
+        self._listener_thread.start()
+
+    def stop_listener(self):
+        """리스너 스레드 정지"""
+        self._listener_stop.set()
+        if self._listener_thread is not None:
+            self._listener_thread.join(timeout=2)
+            self._listener_thread = None
+
+    def _listen_loop(self):
+        while not self._listener_stop.is_set():
+            pubsub = self.client.pubsub(ignore_subscribe_messages=True)
+            try:
+                pubsub.subscribe(INVALIDATE_CHANNEL)
+                # (재)구독 전에 놓친 무효화가 있을 수 있으므로 전체 비움
+                self.clear()
+                self._subscribed = True
+                while not self._listener_stop.is_set():
+                    message = pubsub.get_message(timeout=1.0)
+                    if message and message["type"] == "message":
+                        self.invalidate_user(int(message["data"]))
+            except (redis.RedisError, ValueError) as e:
+                logger.warning(f"토큰 무효화 구독 오류, 재연결합니다: {e}")
+                self._listener_stop.wait(1.0)
+            finally:
+                self._subscribed = False
+                pubsub.close()
+
+
+# 싱글톤 인스턴스
+token_cache = TokenCache(redis_client, async_redis_client, settings.TOKEN_CACHE_MAXSIZE, settings.TOKEN_CACHE_TTL)